@@ -0,0 +1,62 @@
+# Imports
+import os
+import time
+import gc
+from pathlib import Path
+
+# Package Imports
+from gmdkit.models.level import Level
+from gmdkit.serialization.functions import (
+    compress_string, compress_strings, decompress_string, COMPRESS_BLOCK_SIZE
+    )
+
+
+LEVELS_DIR = Path(__file__).parent.parent / "data" / "gmd"
+WORKERS = (None, 2, 4, os.cpu_count())
+
+
+def measure(function, *args, repeat:int=3, **kwargs) -> float:
+    best = float("inf")
+
+    for _ in range(repeat):
+        gc.collect()
+        start = time.perf_counter()
+        function(*args, **kwargs)
+        best = min(best, time.perf_counter() - start)
+
+    return best
+
+
+def level_strings() -> list[str]:
+    return [
+        decompress_string(objstr.string)
+        for path in sorted(LEVELS_DIR.rglob("*.gmd"))
+        if (objstr := Level.from_file(path, load_content=False).get("k4")) is not None and objstr.string
+        ]
+
+
+def main():
+    strings = level_strings()
+    largest = max(strings, key=len)
+    size = sum(map(len, strings))
+
+    print(f"{len(strings)} level strings, {size/2**20:.1f} MB, largest {len(largest)/2**20:.1f} MB, {os.cpu_count()} cpus")
+    
+    single = measure(compress_string, largest)
+    print(f"{'single stream':<24}{single:>9.3f} s {len(compress_string(largest)):>10} B")
+    
+    for workers in dict.fromkeys(WORKERS):
+        blocks = measure(compress_string, largest, block_size=COMPRESS_BLOCK_SIZE, workers=workers)
+        length = len(compress_string(largest, block_size=COMPRESS_BLOCK_SIZE))
+        print(f"{'blocks, ' + str(workers or 1) + ' workers':<24}{blocks:>9.3f} s {length:>10} B")
+    
+    print()
+    print(f"{'all strings, sequential':<24}{measure(compress_strings, strings):>9.3f} s")
+    
+    for workers in dict.fromkeys(WORKERS):
+        elapsed = measure(compress_strings, strings, workers=workers, block_size=COMPRESS_BLOCK_SIZE)
+        print(f"{'all strings, ' + str(workers or 1) + ' workers':<24}{elapsed:>9.3f} s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,126 @@
+# Imports
+import time
+import gc
+from contextlib import contextmanager
+from pathlib import Path
+
+# Package Imports
+from gmdkit.models.level import Level
+from gmdkit.models.prop.gzip import ObjectString
+from gmdkit.models.prop.color import Color
+from gmdkit.models.prop.hsv import HSV
+from gmdkit.models.prop.particle import Particle
+from gmdkit.models.prop.replay import ReplayInput
+from gmdkit.serialization.mixins import DataclassDecoderMixin
+from gmdkit.serialization.functions import decompress_string
+from gmdkit.mappings import obj_prop
+
+
+LEVELS_DIR = Path(__file__).parent.parent / "data" / "gmd"
+REPLAY_INPUTS = 200000
+
+
+
+def subclasses(cls:type):
+    for sub in cls.__subclasses__():
+        yield sub
+        yield from subclasses(sub)
+
+
+@contextmanager
+def generic_methods():
+    # removes the generated methods, restoring the methods used before compile_dataclass_tokens
+    removed = []
+    
+    for cls in set(subclasses(DataclassDecoderMixin)):
+        for name in ("from_tokens", "to_tokens"):
+            method = cls.__dict__.get(name)
+            if hasattr(getattr(method, "__func__", method), "generic"):
+                removed.append((cls, name, method))
+                delattr(cls, name)
+    try:
+        yield
+    finally:
+        for cls, name, method in removed:
+            setattr(cls, name, method)
+
+
+def level_tokens() -> dict[type,list[list[str]]]:
+    samples = {Color: [], HSV: [], Particle: []}
+
+    for path in sorted(LEVELS_DIR.rglob("*.gmd")):
+        objstr = Level.from_file(path, load_content=False).get("k4")
+
+        if not isinstance(objstr, ObjectString) or not objstr.string:
+            continue
+
+        start, _, objects = decompress_string(objstr.string).partition(";")
+        tokens = start.split(",")
+        colors = dict(zip(tokens[::2], tokens[1::2])).get("kS38", "")
+        samples[Color] += [color.split("_") for color in colors.split("|") if color]
+
+        for obj in objects.split(";"):
+            tokens = obj.split(",")
+            props = dict(zip(tokens[::2], tokens[1::2]))
+
+            for key in (obj_prop.HSV_1, obj_prop.HSV_2, obj_prop.trigger.color.HSV):
+                if str(key) in props:
+                    samples[HSV].append(props[str(key)].split("a"))
+
+            if str(obj_prop.particle.DATA) in props:
+                samples[Particle].append(props[str(obj_prop.particle.DATA)].split("a"))
+
+    return samples
+
+
+def measure(function, data, repeat:int=5) -> float:
+    best = float("inf")
+
+    for _ in range(repeat):
+        gc.collect()
+        start = time.perf_counter()
+        function(data)
+        best = min(best, time.perf_counter() - start)
+
+    return best
+
+
+def main():
+    samples = level_tokens()
+    samples[ReplayInput] = [[str(i * 3), f"{i % 3}:"] for i in range(REPLAY_INPUTS)]
+
+    print(
+        f"{'class':<14}{'items':>9}"
+        f"{'generic dec/s':>16}{'compiled/s':>13}{'speedup':>9}"
+        f"{'generic enc/s':>16}{'compiled/s':>13}{'speedup':>9}"
+        )
+
+    for cls, token_lists in samples.items():
+        if not token_lists:
+            continue
+
+        items = [cls.from_tokens(tokens) for tokens in token_lists]
+        count = len(items)
+
+        def decode(data):
+            return [cls.from_tokens(tokens) for tokens in data]
+
+        def encode(data):
+            return [item.to_tokens() for item in data]
+
+        compiled_dec = measure(decode, token_lists)
+        compiled_enc = measure(encode, items)
+
+        with generic_methods():
+            generic_dec = measure(decode, token_lists)
+            generic_enc = measure(encode, items)
+
+        print(
+            f"{cls.__name__:<14}{count:>9}"
+            f"{count/generic_dec:>16,.0f}{count/compiled_dec:>13,.0f}{generic_dec/compiled_dec:>8.2f}x"
+            f"{count/generic_enc:>16,.0f}{count/compiled_enc:>13,.0f}{generic_enc/compiled_enc:>8.2f}x"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,82 @@
+# Imports
+import time
+import gc
+from pathlib import Path
+
+# Package Imports
+from gmdkit.models.level import Level
+from gmdkit.models.object import ObjectList
+
+
+LEVELS_DIR = Path(__file__).parent.parent / "data" / "gmd"
+
+
+def dedupe_strings(objects:ObjectList) -> ObjectList:
+    # the previous implementation, serializing every object with sorted keys
+    seen = set()
+    result = ObjectList()
+    for obj in objects:
+        key = obj.to_string(sort_keys=True)
+        if key in seen:
+            continue
+        seen.add(key)
+        result.append(obj)
+    return result
+
+
+def difference_strings(objects:ObjectList, other:ObjectList) -> ObjectList:
+    keys = {obj.to_string(sort_keys=True) for obj in other}
+    return objects.where(lambda obj: obj.to_string(sort_keys=True) not in keys)
+
+
+def clear_hashes(objects:ObjectList):
+    for obj in objects:
+        obj._hash = None
+
+
+def measure(function, prepare=None, repeat:int=5) -> float:
+    best = float("inf")
+
+    for _ in range(repeat):
+        if prepare is not None:
+            prepare()
+        gc.collect()
+        start = time.perf_counter()
+        function()
+        best = min(best, time.perf_counter() - start)
+
+    return best
+
+
+def main():
+    print(
+        f"{'level':<28}{'objects':>9}"
+        f"{'string dedupe s':>17}{'hash dedupe s':>15}{'cached s':>10}"
+        f"{'string diff s':>15}{'hash diff s':>13}{'speedup':>9}"
+        )
+
+    for path in sorted(LEVELS_DIR.rglob("*.gmd")):
+        objects = Level.from_file(path).objects
+
+        if len(objects) < 20000:
+            continue
+
+        # every fourth object is duplicated, as by a copy paste in the editor
+        combined = ObjectList(objects + [obj.copy() for obj in objects[::4]])
+        other = ObjectList(objects[::2])
+
+        string_dedupe = measure(lambda: dedupe_strings(combined))
+        hash_dedupe = measure(combined.dedupe, lambda: clear_hashes(combined))
+        cached_dedupe = measure(combined.dedupe)
+        string_diff = measure(lambda: difference_strings(combined, other))
+        hash_diff = measure(lambda: combined.difference(other), lambda: clear_hashes(combined))
+
+        print(
+            f"{path.stem[:27]:<28}{len(combined):>9}"
+            f"{string_dedupe:>17.3f}{hash_dedupe:>15.3f}{cached_dedupe:>10.3f}"
+            f"{string_diff:>15.3f}{hash_diff:>13.3f}{string_dedupe/hash_dedupe:>8.2f}x"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,61 @@
+# Imports
+import os
+import time
+import gc
+import shutil
+import tempfile
+from pathlib import Path
+
+# Package Imports
+from gmdkit.models.level import LevelList
+from gmdkit.mappings import lvl_prop
+
+
+LEVELS_DIR = Path(__file__).parent.parent / "data" / "gmd"
+COPIES = 4
+# larger levels are skipped, a folder of their copies does not fit in memory once loaded
+MAX_SIZE = 2**20
+WORKERS = (None, 2, 4, os.cpu_count())
+
+
+def build_folder(directory:str) -> int:
+    # copies every stored level a few times, so the pool has enough files to balance
+    count = 0
+    for path in sorted(LEVELS_DIR.rglob("*.gmd")):
+        if path.stat().st_size > MAX_SIZE:
+            continue
+        for i in range(COPIES):
+            shutil.copyfile(path, os.path.join(directory, f"{path.stem} {i}.gmd"))
+            count += 1
+    return count
+
+
+def measure(function, *args, **kwargs) -> float:
+    gc.collect()
+    start = time.perf_counter()
+    function(*args, **kwargs)
+    return time.perf_counter() - start
+
+
+def main():
+    with tempfile.TemporaryDirectory() as source, tempfile.TemporaryDirectory() as target:
+        count = build_folder(source)
+        
+        print(f"{count} levels, {os.cpu_count()} cpus")
+        print(f"{'workers':<9}{'load s':>9}{'load content s':>16}{'save s':>9}")
+        
+        for workers in dict.fromkeys(WORKERS):
+            load = measure(LevelList.from_folder, source, workers=workers, load_content=False)
+            levels = LevelList.from_folder(source, workers=workers)
+            # files are named after the level id, which copies and offline levels do not have
+            for i, level in enumerate(levels):
+                level[lvl_prop.ID] = i
+            load_content = measure(LevelList.from_folder, source, workers=workers)
+            save = measure(levels.to_folder, target, workers=workers)
+            del levels
+            
+            print(f"{str(workers or 1):<9}{load:>9.3f}{load_content:>16.3f}{save:>9.3f}")
+
+
+if __name__ == "__main__":
+    main()
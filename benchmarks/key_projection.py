@@ -0,0 +1,47 @@
+# Imports
+import time
+import gc
+from pathlib import Path
+
+# Package Imports
+from gmdkit.models.level import Level
+from gmdkit.mappings import lvl_prop
+
+
+LEVELS_DIR = Path(__file__).parent.parent / "data" / "gmd"
+SCAN_KEYS = {lvl_prop.NAME, lvl_prop.OFFICIAL_DIFFICULTY, lvl_prop.STARS}
+
+
+def scan(paths:list[Path], **kwargs) -> list[tuple]:
+    levels = (Level.from_file(path, **kwargs) for path in paths)
+    return [(level.get(lvl_prop.NAME), level.get(lvl_prop.STARS)) for level in levels]
+
+
+def measure(paths:list[Path], repeat:int=3, **kwargs) -> float:
+    best = float("inf")
+
+    for _ in range(repeat):
+        gc.collect()
+        start = time.perf_counter()
+        scan(paths, **kwargs)
+        best = min(best, time.perf_counter() - start)
+
+    return best
+
+
+def main():
+    paths = sorted(LEVELS_DIR.rglob("*.gmd"))
+    
+    print(f"scanning {len(paths)} levels for {sorted(SCAN_KEYS)}")
+    
+    for name, kwargs in (
+            ("full load", {}),
+            ("without content", {"load_content": False}),
+            ("keys", {"keys": SCAN_KEYS}),
+            ("skip_keys", {"skip_keys": {lvl_prop.OBJECT_STRING}}),
+            ):
+        print(f"{name:<18}{measure(paths, **kwargs):>9.3f} s")
+
+
+if __name__ == "__main__":
+    main()
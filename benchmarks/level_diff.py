@@ -0,0 +1,101 @@
+# Imports
+import time
+import gc
+import random
+from collections import Counter
+from pathlib import Path
+
+# Package Imports
+from gmdkit.models.level import Level
+from gmdkit.models.level_diff import ObjectDiff
+from gmdkit.models.object import Object, ObjectList
+from gmdkit.mappings import obj_prop
+
+
+LEVELS_DIR = Path(__file__).parent.parent / "data" / "gmd"
+EDITS = 1000
+
+
+def diff_strings(old:ObjectList, new:ObjectList) -> tuple[Counter,Counter]:
+    # the previous workflow, comparing the dumped object strings
+    old_strings = Counter(obj.to_string(sort_keys=True) for obj in old)
+    new_strings = Counter(obj.to_string(sort_keys=True) for obj in new)
+    return old_strings - new_strings, new_strings - old_strings
+
+
+def edit(objects:ObjectList) -> ObjectList:
+    # moves, edits, removes and adds objects, as an editor session would
+    random.seed(0)
+    objects = ObjectList(obj.copy() for obj in objects)
+    count = len(objects)
+
+    for i in random.sample(range(count), EDITS):
+        objects[i][obj_prop.X] = objects[i].get(obj_prop.X, 0) + 30
+
+    for i in random.sample(range(count), EDITS):
+        objects[i][obj_prop.ROTATION] = 45.0
+
+    removed = set(random.sample(range(count), EDITS))
+    objects = ObjectList(obj for i, obj in enumerate(objects) if i not in removed)
+
+    for _ in range(EDITS):
+        obj = Object.default(1)
+        obj[obj_prop.X] = random.uniform(0, 10000)
+        objects.append(obj)
+
+    return objects
+
+
+def clear_hashes(*obj_lists:ObjectList):
+    for objects in obj_lists:
+        for obj in objects:
+            obj._hash = None
+
+
+def measure(function, prepare=None, repeat:int=3) -> float:
+    best = float("inf")
+
+    for _ in range(repeat):
+        if prepare is not None:
+            prepare()
+        gc.collect()
+        start = time.perf_counter()
+        function()
+        best = min(best, time.perf_counter() - start)
+
+    return best
+
+
+def main():
+    print(
+        f"{'level':<28}{'objects':>9}"
+        f"{'strings s':>11}{'diff s':>8}{'cached s':>10}{'apply s':>9}{'speedup':>9}"
+        )
+
+    for path in sorted(LEVELS_DIR.rglob("*.gmd")):
+        objects = Level.from_file(path).objects
+
+        if len(objects) < 20000:
+            continue
+
+        # the largest level is doubled, to time a level of over 150k objects
+        if len(objects) > 50000:
+            objects = ObjectList(objects + [obj.copy() for obj in objects])
+
+        edited = edit(objects)
+        diff = ObjectDiff.from_objects(objects, edited)
+
+        string_time = measure(lambda: diff_strings(objects, edited))
+        diff_time = measure(lambda: ObjectDiff.from_objects(objects, edited), lambda: clear_hashes(objects, edited))
+        cached_time = measure(lambda: ObjectDiff.from_objects(objects, edited))
+        apply_time = measure(lambda: diff.apply(objects))
+
+        print(
+            f"{path.stem[:27]:<28}{len(objects):>9}"
+            f"{string_time:>11.3f}{diff_time:>8.3f}{cached_time:>10.3f}{apply_time:>9.3f}"
+            f"{string_time/diff_time:>8.2f}x"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,102 @@
+# Imports
+import time
+import gc
+from pathlib import Path
+
+# Package Imports
+from gmdkit.models.level import Level
+from gmdkit.models.level_index import LevelIndex
+from gmdkit.models.prop.groups import IDList
+from gmdkit.mappings import obj_prop
+from gmdkit.functions.object_list import (
+    compile_groups,
+    compile_parents,
+    compile_links,
+    compile_keyframe_ids,
+    compile_keyframe_groups,
+    compile_spawn_groups
+    )
+
+
+LEVELS_DIR = Path(__file__).parent.parent / "data" / "gmd"
+EDITS = 100
+
+
+def compile_all(objects):
+    compile_groups(objects)
+    compile_parents(objects)
+    compile_links(objects)
+    compile_keyframe_ids(objects)
+    compile_keyframe_groups(objects)
+    compile_spawn_groups(objects)
+
+
+def query_all(index:LevelIndex):
+    # compile_parents already returns the groups
+    index.parents()
+    index.links()
+    index.keyframe_ids()
+    index.keyframe_groups()
+    index.spawn_groups()
+
+
+def edit(objects, start:int):
+    # moves a few objects to another group, as a script editing a level would
+    edited = objects[start:start+EDITS]
+    for obj in edited:
+        obj[obj_prop.GROUPS] = IDList([9999])
+    return edited
+
+
+def measure(function, repeat:int=5) -> float:
+    best = float("inf")
+
+    for _ in range(repeat):
+        gc.collect()
+        start = time.perf_counter()
+        function()
+        best = min(best, time.perf_counter() - start)
+
+    return best
+
+
+def main():
+    print(
+        f"{'level':<28}{'objects':>9}"
+        f"{'compile s':>11}{'build s':>9}{'query s':>9}"
+        f"{'edit+compile s':>16}{'edit+update s':>15}{'speedup':>9}"
+        )
+
+    for path in sorted(LEVELS_DIR.rglob("*.gmd")):
+        objects = Level.from_file(path).objects
+
+        if len(objects) < 20000:
+            continue
+
+        index = LevelIndex(objects)
+        step = iter(range(0, len(objects), EDITS))
+
+        compile_time = measure(lambda: compile_all(objects))
+        build_time = measure(lambda: LevelIndex(objects))
+        query_time = measure(lambda: query_all(index))
+
+        def recompile():
+            edit(objects, next(step))
+            compile_all(objects)
+
+        def update():
+            index.update(*edit(objects, next(step)))
+            query_all(index)
+
+        recompile_time = measure(recompile)
+        update_time = measure(update)
+
+        print(
+            f"{path.stem[:27]:<28}{len(objects):>9}"
+            f"{compile_time:>11.3f}{build_time:>9.3f}{query_time:>9.3f}"
+            f"{recompile_time:>16.3f}{update_time:>15.3f}{recompile_time/update_time:>8.2f}x"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,95 @@
+# Imports
+import os
+import time
+import gc
+import tempfile
+import multiprocessing
+import tracemalloc
+from pathlib import Path
+
+# Package Imports
+from gmdkit.models.level import Level, LevelList
+from gmdkit.models.save.level_manager import LevelSave
+from gmdkit.mappings import lvl_save
+
+
+DATA_DIR = Path(__file__).parent.parent / "data"
+SYNTHETIC_LEVELS = 400
+
+
+def read_status(field:str) -> int:
+    # VmHWM is the peak RSS of this address space, unlike ru_maxrss it is reset on exec
+    with open("/proc/self/status") as file:
+        for line in file:
+            if line.startswith(field + ":"):
+                return int(line.split()[1]) * 1024
+    raise KeyError(field)
+
+
+def measure(cls, path:str, mapped:bool, queue):
+    # runs in a fresh process, so that peak RSS only covers this load
+    kwargs = {"compressed": False} if cls is LevelSave else {}
+    
+    gc.collect()
+    before = read_status("VmRSS")
+    start = time.perf_counter()
+    cls.from_file(path, mapped=mapped, load_content=False, **kwargs)
+    elapsed = time.perf_counter() - start
+    peak = read_status("VmHWM")
+    
+    # mapped pages count towards RSS while they are resident, the traced peak only counts allocations
+    tracemalloc.start()
+    cls.from_file(path, mapped=mapped, load_content=False, **kwargs)
+    _, traced = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    queue.put((elapsed, max(peak - before, 0), traced))
+
+
+def run(cls, path:str, mapped:bool) -> tuple[float, int, int]:
+    context = multiprocessing.get_context("spawn")
+    queue = context.Queue()
+    process = context.Process(target=measure, args=(cls, path, mapped, queue))
+    process.start()
+    result = queue.get()
+    process.join()
+    return result
+
+
+def synthetic_save(directory:str) -> str:
+    levels = [Level.from_file(path, load_content=False) for path in sorted((DATA_DIR / "gmd").rglob("*.gmd"))]
+    save = LevelSave()
+    save[lvl_save.LEVELS] = LevelList(levels[i % len(levels)] for i in range(SYNTHETIC_LEVELS))
+
+    path = os.path.join(directory, "CCLocalLevels.dat")
+    save.to_file(path, compressed=False)
+    return path
+
+
+def main():
+    with tempfile.TemporaryDirectory() as directory:
+        cases = [(path.name, Level, str(path)) for path in sorted((DATA_DIR / "gmd" / "online").glob("*.gmd"))]
+        cases.append((f"synthetic save ({SYNTHETIC_LEVELS} levels)", LevelSave, synthetic_save(directory)))
+
+        print(
+            f"{'file':<36}{'MB':>7}"
+            f"{'text s':>9}{'mapped s':>10}"
+            f"{'text RSS MB':>13}{'mapped RSS MB':>15}"
+            f"{'text heap MB':>14}{'mapped heap MB':>16}"
+            )
+
+        for name, cls, path in cases:
+            size = os.path.getsize(path)
+            text_time, text_rss, text_heap = run(cls, path, False)
+            mapped_time, mapped_rss, mapped_heap = run(cls, path, True)
+
+            print(
+                f"{name:<36}{size/2**20:>7.2f}"
+                f"{text_time:>9.3f}{mapped_time:>10.3f}"
+                f"{text_rss/2**20:>13.1f}{mapped_rss/2**20:>15.1f}"
+                f"{text_heap/2**20:>14.1f}{mapped_heap/2**20:>16.1f}"
+                )
+
+
+if __name__ == "__main__":
+    main()
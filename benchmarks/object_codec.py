@@ -0,0 +1,101 @@
+# Imports
+import time
+import gc
+from pathlib import Path
+
+# Package Imports
+from gmdkit.models.object import Object
+from gmdkit.models.prop.gzip import ObjectString
+from gmdkit.models.level import Level
+from gmdkit.serialization.functions import dict_cast, decompress_string
+from gmdkit.serialization.type_cast import to_numkey, serialize
+from gmdkit.casting.object_props import PROPERTY_DECODERS, PROPERTY_ENCODERS
+
+
+LEVELS_DIR = Path(__file__).parent.parent / "data" / "gmd"
+
+# codecs used before CompiledDecoder and CompiledEncoder
+CAST_DECODER = dict_cast(PROPERTY_DECODERS,key_start=to_numkey)
+CAST_ENCODER = dict_cast(PROPERTY_ENCODERS,key_end=str,default=serialize)
+
+
+def cast_decode(token_lists:list[list[str]]) -> list:
+    decoder = CAST_DECODER
+    result = []
+    for tokens in token_lists:
+        it = iter(tokens)
+        result.append(list(map(decoder, it, it)))
+    return result
+
+
+def compiled_decode(token_lists:list[list[str]]) -> list:
+    decode_tokens = Object.DECODER.decode_tokens
+    return [list(decode_tokens(tokens)) for tokens in token_lists]
+
+
+def cast_encode(objects:list[Object]) -> list[list[str]]:
+    encoder = CAST_ENCODER
+    result = []
+    for obj in objects:
+        tokens = []
+        extend = tokens.extend
+        for key, value in dict.items(obj):
+            extend(encoder(key, value))
+        result.append(tokens)
+    return result
+
+
+def compiled_encode(objects:list[Object]) -> list[list[str]]:
+    encode_items = Object.ENCODER.encode_items
+    return [encode_items(dict.items(obj)) for obj in objects]
+
+
+def measure(function, data, repeat:int=7) -> float:
+    best = float("inf")
+
+    for _ in range(repeat):
+        gc.collect()
+        start = time.perf_counter()
+        function(data)
+        best = min(best, time.perf_counter() - start)
+
+    return best
+
+
+def main():
+    print(
+        f"{'level':<28}{'pairs':>9}"
+        f"{'cast dec/s':>13}{'compiled/s':>13}{'speedup':>9}"
+        f"{'cast enc/s':>13}{'compiled/s':>13}{'speedup':>9}"
+        )
+
+    for path in sorted(LEVELS_DIR.rglob("*.gmd")):
+        level = Level.from_file(path, load_content=False)
+        objstr = level.get("k4")
+
+        if not isinstance(objstr, ObjectString) or not objstr.string:
+            continue
+
+        string = decompress_string(objstr.string)
+        token_lists = [token.split(",") for token in string.split(";")[1:] if token]
+        pairs = sum(map(len, token_lists)) // 2
+
+        if pairs < 50000:
+            continue
+
+        objects = [Object.from_tokens(tokens) for tokens in token_lists]
+
+        cast_dec = measure(cast_decode, token_lists)
+        compiled_dec = measure(compiled_decode, token_lists)
+        cast_enc = measure(cast_encode, objects)
+        compiled_enc = measure(compiled_encode, objects)
+
+        print(
+            f"{path.stem[:27]:<28}{pairs:>9}"
+            f"{pairs/cast_dec:>13,.0f}{pairs/compiled_dec:>13,.0f}{cast_dec/compiled_dec:>8.2f}x"
+            f"{pairs/cast_enc:>13,.0f}{pairs/compiled_enc:>13,.0f}{cast_enc/compiled_enc:>8.2f}x"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,79 @@
+# Imports
+import time
+import tracemalloc
+import gc
+import sys
+from pathlib import Path
+
+# Package Imports
+from gmdkit.models.object import ObjectList, CompactObject
+from gmdkit.models.prop.gzip import ObjectString
+from gmdkit.models.level import Level
+from gmdkit.serialization.functions import decompress_string
+
+
+LEVELS_DIR = Path(__file__).parent.parent / "data" / "gmd"
+
+
+def container_size(obj) -> int:
+    # the object and its own storage, excluding property values and the cached string
+    if isinstance(obj, CompactObject):
+        return sys.getsizeof(obj) + sys.getsizeof(obj._values)
+    return sys.getsizeof(obj)
+
+
+def measure(string:str, compact:bool) -> tuple[float, int, int]:
+    gc.collect()
+    start = time.perf_counter()
+    ObjectList.from_string(string, compact=compact)
+    elapsed = time.perf_counter() - start
+
+    gc.collect()
+    tracemalloc.start()
+    objects = ObjectList.from_string(string, compact=compact)
+    gc.collect()
+    retained, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    # key tuples are shared, count each once
+    containers = sum(map(container_size, objects))
+    if compact:
+        containers += sum(sys.getsizeof(keys) for keys in {id(obj._keys): obj._keys for obj in objects}.values())
+
+    return elapsed, retained, containers
+
+
+def main():
+    # B/obj: retained bytes per object, cont: object storage excluding values and cached strings
+    print(
+        f"{'level':<28}{'objects':>9}"
+        f"{'dict s':>8}{'compact s':>11}"
+        f"{'dict B/obj':>12}{'compact B/obj':>15}"
+        f"{'dict cont':>11}{'compact cont':>14}"
+        )
+
+    for path in sorted(LEVELS_DIR.rglob("*.gmd")):
+        objstr = Level.from_file(path, load_content=False).get("k4")
+
+        if not isinstance(objstr, ObjectString) or not objstr.string:
+            continue
+
+        string = decompress_string(objstr.string)
+        count = string.count(";")
+
+        if count < 10000:
+            continue
+
+        dict_time, dict_bytes, dict_containers = measure(string, compact=False)
+        compact_time, compact_bytes, compact_containers = measure(string, compact=True)
+
+        print(
+            f"{path.stem[:27]:<28}{count:>9}"
+            f"{dict_time:>8.3f}{compact_time:>11.3f}"
+            f"{dict_bytes/count:>12.0f}{compact_bytes/count:>15.0f}"
+            f"{dict_containers/count:>11.0f}{compact_containers/count:>14.0f}"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,63 @@
+# Imports
+import time
+import tracemalloc
+import gc
+from pathlib import Path
+
+# Package Imports
+from gmdkit.models.object import ObjectList
+from gmdkit.models.prop.gzip import ObjectString
+from gmdkit.models.level import Level
+from gmdkit.serialization.functions import decompress_string
+
+
+LEVELS_DIR = Path(__file__).parent.parent / "data" / "gmd" / "online"
+
+
+def measure(string:str, intern:bool) -> tuple[float, int, int]:
+    gc.collect()
+    start = time.perf_counter()
+    ObjectList.from_string(string, intern=intern)
+    elapsed = time.perf_counter() - start
+
+    gc.collect()
+    tracemalloc.start()
+    objects = ObjectList.from_string(string, intern=intern)
+    gc.collect()
+    retained, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del objects
+
+    return elapsed, retained, peak
+
+
+def main():
+    print(
+        f"{'level':<28}{'objects':>9}"
+        f"{'plain s':>9}{'intern s':>10}"
+        f"{'plain MB':>10}{'intern MB':>11}{'saved':>8}"
+        f"{'plain peak':>12}{'intern peak':>13}"
+        )
+
+    for path in sorted(LEVELS_DIR.rglob("*.gmd")):
+        objstr = Level.from_file(path, load_content=False).get("k4")
+
+        if not isinstance(objstr, ObjectString) or not objstr.string:
+            continue
+
+        string = decompress_string(objstr.string)
+        count = string.count(";")
+
+        plain_time, plain, plain_peak = measure(string, intern=False)
+        intern_time, interned, intern_peak = measure(string, intern=True)
+
+        print(
+            f"{path.stem[:27]:<28}{count:>9}"
+            f"{plain_time:>9.3f}{intern_time:>10.3f}"
+            f"{plain/2**20:>10.1f}{interned/2**20:>11.1f}{1 - interned/plain:>8.0%}"
+            f"{plain_peak/2**20:>12.1f}{intern_peak/2**20:>13.1f}"
+            )
+
+
+if __name__ == "__main__":
+    main()
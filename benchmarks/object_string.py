@@ -0,0 +1,76 @@
+# Imports
+import time
+import tracemalloc
+import gc
+from pathlib import Path
+
+# Package Imports
+from gmdkit.models.object import ObjectList
+from gmdkit.models.prop.gzip import ObjectString
+from gmdkit.serialization.mixins import ArrayDecoderMixin
+from gmdkit.serialization.functions import decompress_string
+from gmdkit.models.level import Level
+
+
+LEVELS_DIR = Path(__file__).parent.parent / "data" / "gmd"
+
+
+def split_decode(string:str) -> ObjectList:
+    # decoding path used before ObjectList.iter_string
+    first, _, remainder = string.partition(";")
+    ObjectList.DECODER(first)
+    return ArrayDecoderMixin.from_string.__func__(ObjectList, remainder)
+
+
+def stream_decode(string:str) -> ObjectList:
+    objects = ObjectList.iter_string(string)
+    next(objects, None)
+    return ObjectList(objects)
+
+
+def measure(function, string:str, repeat:int=3) -> tuple[int, float, int]:
+    best = float("inf")
+    
+    for _ in range(repeat):
+        gc.collect()
+        start = time.perf_counter()
+        count = len(function(string)) + 1
+        best = min(best, time.perf_counter() - start)
+    
+    gc.collect()
+    tracemalloc.start()
+    function(string)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    
+    return count, best, peak
+
+
+def main():
+    print(
+        f"{'level':<28}{'objects':>9}"
+        f"{'split obj/s':>14}{'stream obj/s':>14}{'speedup':>9}"
+        f"{'split MB':>10}{'stream MB':>11}"
+        )
+    
+    for path in sorted(LEVELS_DIR.rglob("*.gmd")):
+        level = Level.from_file(path, load_content=False)
+        objstr = level.get("k4")
+        
+        if not isinstance(objstr, ObjectString) or not objstr.string:
+            continue
+        
+        string = decompress_string(objstr.string)
+        
+        count, before, before_peak = measure(split_decode, string)
+        _, after, after_peak = measure(stream_decode, string)
+        
+        print(
+            f"{path.stem[:27]:<28}{count:>9}"
+            f"{count/before:>14,.0f}{count/after:>14,.0f}{before/after:>8.2f}x"
+            f"{before_peak/2**20:>10.1f}{after_peak/2**20:>11.1f}"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,58 @@
+# Imports
+import time
+import gc
+from pathlib import Path
+
+# Package Imports
+from gmdkit.models.level import Level
+from gmdkit.models.object import ObjectList
+from gmdkit.models.object_table import ObjectTable, HITBOX_COLUMNS, DEFAULT_COLUMNS
+from gmdkit.functions.object_table import overlapping_pairs, stacked_objects
+
+
+LEVELS_DIR = Path(__file__).parent.parent / "data" / "gmd"
+COPIES = 2
+
+
+def measure(function) -> tuple[float, object]:
+    gc.collect()
+    start = time.perf_counter()
+    result = function()
+    return time.perf_counter() - start, result
+
+
+def main():
+    print(
+        f"{'level':<32}{'objects':>9}{'table s':>9}{'bounds s':>10}"
+        f"{'pairs s':>9}{'pairs':>9}{'stacked s':>11}{'stacks':>8}{'total s':>9}"
+        )
+
+    cases = []
+
+    for path in sorted(LEVELS_DIR.rglob("*.gmd")):
+        objects = Level.from_file(path).objects
+
+        if len(objects) >= 20000:
+            cases.append((path.stem[:31], objects))
+
+    # the largest level repeated, copies stack on the originals
+    name, objects = max(cases, key=lambda case: len(case[1]))
+    cases.append((f"{name[:22]} x{COPIES}", ObjectList(obj for _ in range(COPIES) for obj in objects)))
+
+    for name, objects in cases:
+        columns = {key: DEFAULT_COLUMNS[key] for key in HITBOX_COLUMNS}
+
+        table_time, table = measure(lambda: ObjectTable(objects, columns=columns, groups=False))
+        bounds_time, bounds = measure(table.bounds)
+        pairs_time, pairs = measure(lambda: overlapping_pairs(table, bounds=bounds))
+        stacked_time, stacks = measure(lambda: stacked_objects(table))
+        total = table_time + bounds_time + pairs_time + stacked_time
+
+        print(
+            f"{name:<32}{len(objects):>9}{table_time:>9.3f}{bounds_time:>10.3f}"
+            f"{pairs_time:>9.3f}{len(pairs):>9}{stacked_time:>11.3f}{len(stacks):>8}{total:>9.3f}"
+            )
+
+
+if __name__ == "__main__":
+    main()
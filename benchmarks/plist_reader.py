@@ -0,0 +1,108 @@
+# Imports
+import time
+import gc
+import os
+import tempfile
+import multiprocessing
+import xml.etree.ElementTree as ET
+from pathlib import Path
+
+# Package Imports
+from gmdkit.models.level import Level, LevelList
+from gmdkit.models.save.game_manager import GameSave
+from gmdkit.models.save.level_manager import LevelSave
+from gmdkit.serialization.functions import get_plist_root
+
+
+DATA_DIR = Path(__file__).parent.parent / "data"
+SYNTHETIC_LEVELS = 2000
+
+
+def tree_load(cls, string:str):
+    # decoding path used before the streaming reader
+    return cls.from_node(get_plist_root(ET.fromstring(string)))
+
+
+def stream_load(cls, string:str):
+    return cls.from_string(string, compressed=False)
+
+
+def read_status(field:str) -> int:
+    # VmHWM is the peak RSS of this address space, unlike ru_maxrss it is reset on exec
+    with open("/proc/self/status") as file:
+        for line in file:
+            if line.startswith(field + ":"):
+                return int(line.split()[1]) * 1024
+    raise KeyError(field)
+
+
+def measure(function, cls, path:str, queue):
+    # runs in a fresh process, so that peak RSS only covers this load
+    with open(path, "r", encoding="utf-8") as file:
+        string = file.read()
+
+    gc.collect()
+    before = read_status("VmRSS")
+    start = time.perf_counter()
+    function(cls, string)
+    elapsed = time.perf_counter() - start
+    peak = read_status("VmHWM")
+
+    queue.put((elapsed, max(peak - before, 0)))
+
+
+def run(function, cls, path:str) -> tuple[float, int]:
+    context = multiprocessing.get_context("spawn")
+    queue = context.Queue()
+    process = context.Process(target=measure, args=(function, cls, path, queue))
+    process.start()
+    result = queue.get()
+    process.join()
+    return result
+
+
+def synthetic_save(directory:str) -> str:
+    levels = [Level.from_file(path, load_content=False) for path in sorted((DATA_DIR / "gmd").rglob("*.gmd"))]
+    save = LevelSave()
+    save["LLM_01"] = LevelList(levels[i % len(levels)] for i in range(SYNTHETIC_LEVELS))
+    save["LLM_02"] = 37
+
+    path = os.path.join(directory, "CCLocalLevels.xml")
+    save.to_file(path, compressed=False, extension="xml")
+    return path
+
+
+def decompressed(path:Path, directory:str) -> str:
+    new = os.path.join(directory, path.parent.name + ".xml")
+    GameSave.from_file(path).to_file(new, compressed=False, extension="xml")
+    return new
+
+
+def main():
+    with tempfile.TemporaryDirectory() as directory:
+        cases = [
+            (f"{path.parent.name}/{path.name}", GameSave, decompressed(path, directory))
+            for path in sorted((DATA_DIR / "dat").rglob("*.dat"))
+            ]
+        cases.append((f"synthetic ({SYNTHETIC_LEVELS} levels)", LevelSave, synthetic_save(directory)))
+
+        print(
+            f"{'file':<36}{'MB':>7}"
+            f"{'tree s':>9}{'stream s':>10}"
+            f"{'tree RSS MB':>13}{'stream RSS MB':>15}"
+            )
+
+        for name, cls, path in cases:
+            size = os.path.getsize(path)
+            tree_time, tree_rss = run(tree_load, cls, path)
+            stream_time, stream_rss = run(stream_load, cls, path)
+
+            print(
+                f"{name:<36}{size/2**20:>7.2f}"
+                f"{tree_time:>9.3f}{stream_time:>10.3f}"
+                f"{tree_rss/2**20:>13.1f}{stream_rss/2**20:>15.1f}"
+                )
+
+
+if __name__ == "__main__":
+    main()
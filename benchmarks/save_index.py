@@ -0,0 +1,79 @@
+# Imports
+import os
+import time
+import gc
+import tempfile
+import multiprocessing
+import tracemalloc
+from pathlib import Path
+
+# Package Imports
+from gmdkit.models.level import Level, LevelList
+from gmdkit.models.save.level_manager import LevelSave
+from gmdkit.mappings import lvl_save, lvl_prop
+
+
+DATA_DIR = Path(__file__).parent.parent / "data"
+SYNTHETIC_LEVELS = 400
+
+
+def measure(path:str, kwargs:dict, queue):
+    # runs in a fresh process, so that the traced peak only covers this load
+    gc.collect()
+    start = time.perf_counter()
+    save = LevelSave.from_file(path, index=True, **kwargs)
+    elapsed = time.perf_counter() - start
+    del save
+
+    gc.collect()
+    tracemalloc.start()
+    save = LevelSave.from_file(path, index=True, **kwargs)
+    current, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    # the index keeps the level text, the retained size is the floor of the peak
+    queue.put((elapsed, peak, current, len(save[lvl_save.LEVELS])))
+
+
+def run(path:str, kwargs:dict) -> tuple[float, int, int, int]:
+    context = multiprocessing.get_context("spawn")
+    queue = context.Queue()
+    process = context.Process(target=measure, args=(path, kwargs, queue))
+    process.start()
+    result = queue.get()
+    process.join()
+    return result
+
+
+def synthetic_save(directory:str) -> tuple[str, str, int]:
+    levels = [Level.from_file(path, load_content=False) for path in sorted((DATA_DIR / "gmd").rglob("*.gmd"))]
+    save = LevelSave()
+    save[lvl_save.LEVELS] = LevelList(levels[i % len(levels)] for i in range(SYNTHETIC_LEVELS))
+
+    compressed = os.path.join(directory, "CCLocalLevels.dat")
+    plain = os.path.join(directory, "CCLocalLevels-plain.dat")
+    save.to_file(compressed)
+    save.to_file(plain, compressed=False)
+    return compressed, plain, os.path.getsize(plain)
+
+
+def main():
+    with tempfile.TemporaryDirectory() as directory:
+        compressed, plain, text_size = synthetic_save(directory)
+        cases = [
+            ("compressed", compressed, {}),
+            ("plain text", plain, {"compressed": False}),
+            ("plain mapped", plain, {"compressed": False, "mapped": True}),
+            ]
+
+        print(f"synthetic save: {SYNTHETIC_LEVELS} levels, {text_size/2**20:.1f} MB of plist text\n")
+        print(f"{'file':<16}{'index s':>9}{'peak MB':>9}{'retained MB':>13}{'peak/text':>11}")
+
+        for name, path, kwargs in cases:
+            elapsed, peak, current, count = run(path, kwargs)
+            assert count == SYNTHETIC_LEVELS
+            print(f"{name:<16}{elapsed:>9.3f}{peak/2**20:>9.1f}{current/2**20:>13.1f}{peak/text_size:>10.2f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,51 @@
+# Imports
+import os
+import time
+import gc
+from pathlib import Path
+
+# Package Imports
+from gmdkit.models.level import Level, LevelList
+from gmdkit.models.save.level_manager import LevelSave
+from gmdkit.mappings import lvl_save
+
+
+LEVELS_DIR = Path(__file__).parent.parent / "data" / "gmd"
+SAVE_LEVELS = 200
+# larger levels are skipped, so that the loaded save fits in memory
+MAX_SIZE = 2**20
+WORKERS = (None, 2, 4, os.cpu_count())
+
+
+def synthetic_save() -> str:
+    paths = [path for path in sorted(LEVELS_DIR.rglob("*.gmd")) if path.stat().st_size <= MAX_SIZE]
+    levels = [Level.from_file(path, load_content=False) for path in paths]
+    save = LevelSave()
+    save[lvl_save.LEVELS] = LevelList(levels[i % len(levels)] for i in range(SAVE_LEVELS))
+    return save.to_string(compressed=False)
+
+
+def measure(string:str, **kwargs) -> float:
+    save = LevelSave.from_string(string, compressed=False)
+    gc.collect()
+    start = time.perf_counter()
+    save.load(**kwargs)
+    return time.perf_counter() - start
+
+
+def main():
+    string = synthetic_save()
+    
+    print(f"{SAVE_LEVELS} levels, {os.cpu_count()} cpus")
+    print(f"{'workers':<9}{'load s':>9}{'lazy s':>9}{'compact s':>11}")
+    
+    for workers in dict.fromkeys(workers or 1 for workers in WORKERS):
+        load = measure(string, workers=workers)
+        lazy = measure(string, workers=workers, lazy=True)
+        compact = measure(string, workers=workers, compact=True)
+        
+        print(f"{workers:<9}{load:>9.3f}{lazy:>9.3f}{compact:>11.3f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,86 @@
+# Imports
+import time
+import gc
+import os
+import tempfile
+import multiprocessing
+
+# Package Imports
+from gmdkit.models.save.level_manager import LevelSave
+from plist_reader import read_status, synthetic_save
+
+
+def reset_peak():
+    # resets VmHWM to the current RSS
+    with open("/proc/self/clear_refs", "w") as file:
+        file.write("5")
+
+
+def string_load(path:str):
+    # loading path used before the streaming pipeline
+    with open(path, "r", encoding="utf-8") as file:
+        return LevelSave.from_string(file.read(), load_content=False)
+
+
+def stream_load(path:str):
+    return LevelSave.from_file(path, load_content=False)
+
+
+def string_save(save:LevelSave, path:str):
+    string = save.to_string(save_content=False)
+    with open(path, "w", encoding="utf-8") as file:
+        file.write(string)
+
+
+def stream_save(save:LevelSave, path:str):
+    save.to_file(path, save_content=False)
+
+
+def measure(load, save, path:str, queue):
+    # runs in a fresh process, so that peak RSS only covers this load and save
+    gc.collect()
+    before = read_status("VmRSS")
+    start = time.perf_counter()
+    level_save = load(path)
+    load_time = time.perf_counter() - start
+    load_peak = read_status("VmHWM") - before
+
+    gc.collect()
+    reset_peak()
+    before = read_status("VmRSS")
+    start = time.perf_counter()
+    save(level_save, os.path.join(os.path.dirname(path), "output.dat"))
+    save_time = time.perf_counter() - start
+    save_peak = read_status("VmHWM") - before
+
+    queue.put((load_time, load_peak, save_time, save_peak))
+
+
+def run(load, save, path:str) -> tuple[float, int, float, int]:
+    context = multiprocessing.get_context("spawn")
+    queue = context.Queue()
+    process = context.Process(target=measure, args=(load, save, path, queue))
+    process.start()
+    result = queue.get()
+    process.join()
+    return result
+
+
+def main():
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, "CCLocalLevels.dat")
+        LevelSave.from_file(synthetic_save(directory), extension="xml", compressed=False).to_file(path)
+
+        print(f"compressed save: {os.path.getsize(path)/2**20:.1f} MB")
+        print(f"{'':<8}{'load s':>9}{'load RSS MB':>13}{'save s':>9}{'save RSS MB':>13}")
+
+        for name, load, save in (("string", string_load, string_save), ("stream", stream_load, stream_save)):
+            load_time, load_peak, save_time, save_peak = run(load, save, path)
+            print(
+                f"{name:<8}{load_time:>9.3f}{load_peak/2**20:>13.1f}"
+                f"{save_time:>9.3f}{save_peak/2**20:>13.1f}"
+                )
+
+
+if __name__ == "__main__":
+    main()
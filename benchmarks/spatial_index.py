@@ -0,0 +1,83 @@
+# Imports
+import time
+import gc
+import random
+from pathlib import Path
+
+# Package Imports
+from gmdkit.models.level import Level
+from gmdkit.models.spatial_index import SpatialIndex
+from gmdkit.mappings import obj_prop
+
+
+LEVELS_DIR = Path(__file__).parent.parent / "data" / "gmd"
+QUERIES = 200
+
+
+def scan_query(objects, min_x, min_y, max_x, max_y):
+    # region query without an index
+    result = []
+    for obj in objects:
+        x = obj.get(obj_prop.X, 0)
+        y = obj.get(obj_prop.Y, 0)
+        if min_x <= x <= max_x and min_y <= y <= max_y:
+            result.append(obj)
+    return result
+
+
+def scan_nearest(objects, x, y, k):
+    return sorted(objects, key=lambda obj: (obj.get(obj_prop.X, 0) - x) ** 2 + (obj.get(obj_prop.Y, 0) - y) ** 2)[:k]
+
+
+def rectangles(index:SpatialIndex) -> list[tuple[float,float,float,float]]:
+    # screen sized rectangles over the level
+    rng = random.Random(0)
+    min_x, max_x = index.x.min(), index.x.max()
+    min_y, max_y = index.y.min(), index.y.max()
+    result = []
+    for _ in range(QUERIES):
+        x = rng.uniform(min_x, max_x)
+        y = rng.uniform(min_y, max_y)
+        result.append((x, y, x + 600, y + 320))
+    return result
+
+
+def measure(function) -> float:
+    gc.collect()
+    start = time.perf_counter()
+    function()
+    return time.perf_counter() - start
+
+
+def main():
+    print(
+        f"{'level':<28}{'objects':>9}{'build s':>9}"
+        f"{'scan query ms':>15}{'index ms':>10}"
+        f"{'scan nearest ms':>17}{'index ms':>10}"
+        )
+
+    for path in sorted(LEVELS_DIR.rglob("*.gmd")):
+        objects = Level.from_file(path).objects
+
+        if len(objects) < 20000:
+            continue
+
+        build = measure(lambda: SpatialIndex(objects))
+        index = SpatialIndex(objects)
+        rects = rectangles(index)
+        few = rects[:10]
+
+        scan = measure(lambda: [scan_query(objects, *rect) for rect in few]) / len(few)
+        query = measure(lambda: [index.query(*rect) for rect in rects]) / len(rects)
+        scan_k = measure(lambda: [scan_nearest(objects, x, y, 10) for x, y, _, _ in few]) / len(few)
+        nearest = measure(lambda: [index.nearest(x, y, 10) for x, y, _, _ in rects]) / len(rects)
+
+        print(
+            f"{path.stem[:27]:<28}{len(objects):>9}{build:>9.3f}"
+            f"{scan*1000:>15.2f}{query*1000:>10.3f}"
+            f"{scan_k*1000:>17.2f}{nearest*1000:>10.3f}"
+            )
+
+
+if __name__ == "__main__":
+    main()
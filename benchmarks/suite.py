@@ -0,0 +1,293 @@
+"""
+Times the serialization hot paths and compares them to the committed baselines.
+
+The other scripts in this folder compare an optimization to the code it replaced,
+this suite only times the current code, so that a slowdown is noticed offline.
+
+    python benchmarks/suite.py                  compare to baselines.json
+    python benchmarks/suite.py -k object        only cases containing "object"
+    python benchmarks/suite.py --save           record new baselines
+
+Exits with status 1 if a case is slower than its baseline by more than the threshold.
+Baselines are only comparable on the machine and Python version that recorded them.
+"""
+
+# Imports
+import argparse
+import gc
+import json
+import math
+import platform
+import sys
+import time
+from pathlib import Path
+from typing import Callable, Optional
+
+# Package Imports
+from gmdkit.models.level import Level
+from gmdkit.models.object import Object, ObjectList
+from gmdkit.models.level_index import LevelIndex
+from gmdkit.models.prop.gzip import ObjectString
+from gmdkit.models.save.game_manager import GameSave
+from gmdkit.serialization.functions import compress_string, decompress_string, COMPRESS_BLOCK_SIZE
+from gmdkit.remapping.functions import remap_objects_copy, remap_objects_regroup
+from gmdkit.functions.object_list import compile_groups
+
+
+DATA_DIR = Path(__file__).parent.parent / "data"
+LARGE_LEVEL = DATA_DIR / "gmd" / "online" / "Skeletal Shenanigans.gmd"
+REMAP_LEVEL = DATA_DIR / "gmd" / "official" / "Clubstep.gmd"
+BASELINES = Path(__file__).parent / "baselines.json"
+
+THRESHOLD = 0.25
+REPEAT = 5
+# cheap cases are called until a sample takes this long
+MIN_SAMPLE_TIME = 0.1
+
+CASES = {}
+
+
+def case(name:str):
+    """
+    Registers a case setup, which returns the timed function,
+    or a (prepare, function) pair where prepare runs untimed before each call.
+    """
+    def decorator(setup:Callable):
+        CASES[name] = setup
+        return setup
+    return decorator
+
+
+def large_string() -> str:
+    return decompress_string(Level.from_file(LARGE_LEVEL, load_content=False)["k4"].string)
+
+
+@case("level.from_file")
+def level_from_file():
+    return lambda: Level.from_file(LARGE_LEVEL)
+
+
+@case("level.from_file.official")
+def level_from_file_official():
+    paths = sorted((DATA_DIR / "gmd" / "official").glob("*.gmd"))
+    return lambda: [Level.from_file(path) for path in paths]
+
+
+@case("object_string.load")
+def object_string_load():
+    string = Level.from_file(LARGE_LEVEL, load_content=False)["k4"].string
+    instance = None
+
+    def prepare():
+        nonlocal instance
+        instance = ObjectString(string)
+
+    return prepare, lambda: instance.load()
+
+
+@case("object_string.save")
+def object_string_save():
+    instance = Level.from_file(LARGE_LEVEL)["k4"]
+    return lambda: instance.save()
+
+
+@case("object_string.save.modified")
+def object_string_save_modified():
+    instance = Level.from_file(LARGE_LEVEL)["k4"]
+
+    def prepare():
+        # drops the cached object strings, so every object is encoded
+        for obj in instance.objects:
+            obj._string = None
+
+    return prepare, lambda: instance.save()
+
+
+@case("object.from_string")
+def object_from_string():
+    strings = [string for string in large_string().split(";")[1:] if string]
+    return lambda: [Object.from_string(string) for string in strings]
+
+
+@case("object.to_string")
+def object_to_string():
+    objects = [Object.from_string(string) for string in large_string().split(";")[1:] if string]
+
+    def prepare():
+        for obj in objects:
+            obj._string = None
+
+    return prepare, lambda: [obj.to_string() for obj in objects]
+
+
+@case("compress_string")
+def compress():
+    string = large_string()
+    return lambda: compress_string(string)
+
+
+@case("compress_string.blocks")
+def compress_blocks():
+    string = large_string()
+    return lambda: compress_string(string, block_size=COMPRESS_BLOCK_SIZE)
+
+
+@case("decompress_string")
+def decompress():
+    string = compress_string(large_string())
+    return lambda: decompress_string(string)
+
+
+@case("game_save.from_file")
+def game_save_from_file():
+    paths = sorted((DATA_DIR / "dat").rglob("*.dat"))
+    return lambda: [GameSave.from_file(path) for path in paths]
+
+
+@case("remap_objects.copy")
+def remap_copy():
+    objects = Level.from_file(REMAP_LEVEL).objects
+    return lambda: remap_objects_copy(objects, objects)
+
+
+@case("remap_objects.regroup")
+def remap_regroup():
+    objects = Level.from_file(REMAP_LEVEL).objects
+    return lambda: remap_objects_regroup(objects, objects)
+
+
+@case("compile_groups")
+def groups():
+    objects = Level.from_file(LARGE_LEVEL).objects
+    return lambda: compile_groups(objects)
+
+
+@case("level_index")
+def level_index():
+    objects = Level.from_file(LARGE_LEVEL).objects
+    return lambda: LevelIndex(objects)
+
+
+@case("object_list.dedupe")
+def dedupe():
+    objects = Level.from_file(LARGE_LEVEL).objects
+    objects = ObjectList(objects + [obj.copy() for obj in objects[::4]])
+
+    def prepare():
+        # drops the cached hashes, so every object is hashed
+        for obj in objects:
+            obj._hash = None
+
+    return prepare, lambda: objects.dedupe()
+
+
+def measure(setup:Callable, repeat:int=REPEAT) -> float:
+    """Returns the best time of one call in seconds, out of repeat samples."""
+    prepared = setup()
+    prepare, function = prepared if isinstance(prepared, tuple) else (None, prepared)
+
+    def sample(number:int) -> float:
+        elapsed = 0.0
+        gc.collect()
+        for _ in range(number):
+            if prepare is not None:
+                prepare()
+            start = time.perf_counter()
+            function()
+            elapsed += time.perf_counter() - start
+        return elapsed / number
+
+    # the first call also warms up caches, it is not kept
+    number = max(1, math.ceil(MIN_SAMPLE_TIME / max(sample(1), 1e-9)))
+
+    return min(sample(number) for _ in range(repeat))
+
+
+def machine() -> dict:
+    return {
+        "python": platform.python_version(),
+        "implementation": platform.python_implementation(),
+        "platform": platform.platform(),
+        "processor": platform.machine(),
+        }
+
+
+def load_baselines(path:Path) -> Optional[dict]:
+    if not path.exists():
+        return None
+
+    with open(path, "r", encoding="utf-8") as file:
+        return json.load(file)
+
+
+def main(argv:Optional[list[str]]=None) -> int:
+    parser = argparse.ArgumentParser(description="Times serialization hot paths against recorded baselines.")
+    parser.add_argument("-k", dest="keyword", default="", help="only run cases whose name contains this")
+    parser.add_argument("--save", action="store_true", help="record the results as the new baselines")
+    parser.add_argument("--baseline", type=Path, default=BASELINES, help="baselines file")
+    parser.add_argument("--threshold", type=float, default=None, help=f"allowed slowdown ratio, defaults to the file's or {THRESHOLD}")
+    parser.add_argument("--repeat", type=int, default=REPEAT, help="samples per case")
+    args = parser.parse_args(argv)
+
+    baselines = load_baselines(args.baseline)
+    recorded = (baselines or {}).get("cases", {})
+    threshold = args.threshold
+    if threshold is None:
+        threshold = (baselines or {}).get("threshold", THRESHOLD)
+
+    if baselines is not None and not args.save:
+        current = machine()
+        differs = [key for key, value in baselines.get("machine", {}).items() if current.get(key) != value]
+        if differs:
+            print(f"warning: baselines were recorded with a different {', '.join(differs)}, ratios are not comparable\n")
+
+    names = [name for name in CASES if args.keyword in name]
+    results = {}
+    regressions = []
+
+    print(f"{'case':<30}{'baseline ms':>13}{'current ms':>12}{'ratio':>8}  status")
+
+    for name in names:
+        elapsed = measure(CASES[name], args.repeat)
+        results[name] = elapsed
+        base = recorded.get(name)
+
+        if base is None:
+            status = "new"
+            ratio = ""
+            base_ms = ""
+        else:
+            ratio = elapsed / base
+            status = "ok"
+            if ratio > 1 + threshold:
+                status = "REGRESSION"
+                regressions.append(name)
+            elif ratio < 1 - threshold:
+                status = "faster"
+            ratio = f"{ratio:.2f}"
+            base_ms = f"{base*1000:.2f}"
+
+        print(f"{name:<30}{base_ms:>13}{elapsed*1000:>12.2f}{ratio:>8}  {status}", flush=True)
+
+    if args.save:
+        # keeps the baselines of cases that were not run
+        new = {
+            "machine": machine(),
+            "threshold": threshold,
+            "cases": {**recorded, **results},
+            }
+        with open(args.baseline, "w", encoding="utf-8") as file:
+            json.dump(new, file, indent=4)
+            file.write("\n")
+        print(f"\nbaselines saved to {args.baseline}")
+        return 0
+
+    if regressions:
+        print(f"\n{len(regressions)} case(s) slower than baseline by more than {threshold:.0%}: {', '.join(regressions)}")
+        return 1
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
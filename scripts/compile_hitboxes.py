@@ -0,0 +1,18 @@
+import csv
+
+with open("../data/csv/hitbox_table.csv", newline="") as file:
+    rows = [row for row in csv.DictReader(file) if row["ID"].strip()]
+
+type_map = {int(row["ID"]): row["Type"].strip() for row in rows}
+size_map = {int(row["ID"]): (row["Width"].strip(), row["Height"].strip()) for row in rows}
+
+with open("../src/gmdkit/defaults/hitboxes.py","w") as file:
+    file.write("HITBOX_TYPE = {\n")
+    file.write(",\n".join([f"    {k}: \"{v}\"" for k,v in type_map.items()]))
+    file.write("\n")
+    file.write("    }\n")
+    file.write("\n\n")
+    file.write("HITBOX_SIZE = {\n")
+    file.write(",\n".join([f"    {k}: ({w}, {h})" for k,(w,h) in size_map.items()]))
+    file.write("\n")
+    file.write("    }")
@@ -0,0 +1,648 @@
+HITBOX_TYPE = {
+    1: "Block",
+    2: "Block",
+    3: "Block",
+    4: "Block",
+    6: "Block",
+    7: "Block",
+    63: "Block",
+    69: "Block",
+    70: "Block",
+    71: "Block",
+    72: "Block",
+    74: "Block",
+    75: "Block",
+    76: "Block",
+    77: "Block",
+    78: "Block",
+    81: "Block",
+    82: "Block",
+    83: "Block",
+    90: "Block",
+    91: "Block",
+    92: "Block",
+    93: "Block",
+    94: "Block",
+    95: "Block",
+    96: "Block",
+    116: "Block",
+    117: "Block",
+    118: "Block",
+    119: "Block",
+    121: "Block",
+    122: "Block",
+    146: "Block",
+    160: "Block",
+    161: "Block",
+    162: "Block",
+    163: "Block",
+    165: "Block",
+    166: "Block",
+    167: "Block",
+    168: "Block",
+    169: "Block",
+    173: "Block",
+    175: "Block",
+    207: "Block",
+    208: "Block",
+    209: "Block",
+    210: "Block",
+    212: "Block",
+    213: "Block",
+    247: "Block",
+    248: "Block",
+    249: "Block",
+    250: "Block",
+    252: "Block",
+    253: "Block",
+    254: "Block",
+    255: "Block",
+    256: "Block",
+    257: "Block",
+    258: "Block",
+    260: "Block",
+    261: "Block",
+    263: "Block",
+    264: "Block",
+    265: "Block",
+    267: "Block",
+    268: "Block",
+    269: "Block",
+    270: "Block",
+    271: "Block",
+    272: "Block",
+    274: "Block",
+    275: "Block",
+    467: "Block",
+    469: "Block",
+    470: "Block",
+    471: "Block",
+    1203: "Block",
+    1204: "Block",
+    1209: "Block",
+    1210: "Block",
+    1221: "Block",
+    1222: "Block",
+    1226: "Block",
+    64: "Block",
+    195: "Block",
+    206: "Block",
+    220: "Block",
+    661: "Block",
+    1155: "Block",
+    1156: "Block",
+    1157: "Block",
+    1208: "Block",
+    1910: "Block",
+    40: "Block",
+    147: "Block",
+    215: "Block",
+    369: "Block",
+    370: "Block",
+    1903: "Block",
+    1904: "Block",
+    1905: "Block",
+    170: "Block",
+    171: "Block",
+    172: "Block",
+    174: "Block",
+    192: "Block",
+    468: "Block",
+    475: "Block",
+    1260: "Block",
+    62: "Block",
+    65: "Block",
+    66: "Block",
+    68: "Block",
+    1202: "Block",
+    1262: "Block",
+    1220: "Block",
+    1264: "Block",
+    196: "Block",
+    219: "Block",
+    1911: "Block",
+    204: "Block",
+    662: "Block",
+    663: "Block",
+    664: "Block",
+    1561: "Block",
+    1567: "Block",
+    1566: "Block",
+    1565: "Block",
+    1227: "Block",
+    328: "Block",
+    197: "Block",
+    194: "Block",
+    176: "Block",
+    1562: "Block",
+    1343: "Block",
+    1340: "Block",
+    34: "Block",
+    720: "Hazard",
+    991: "Hazard",
+    1731: "Hazard",
+    1733: "Hazard",
+    61: "Hazard",
+    446: "Hazard",
+    1719: "Hazard",
+    1728: "Hazard",
+    365: "Hazard",
+    667: "Hazard",
+    1716: "Hazard",
+    1730: "Hazard",
+    392: "Hazard",
+    458: "Hazard",
+    459: "Hazard",
+    8: "Hazard",
+    144: "Hazard",
+    177: "Hazard",
+    216: "Hazard",
+    103: "Hazard",
+    145: "Hazard",
+    218: "Hazard",
+    39: "Hazard",
+    205: "Hazard",
+    217: "Hazard",
+    768: "Hazard",
+    1727: "Hazard",
+    447: "Hazard",
+    1729: "Hazard",
+    135: "Hazard",
+    1711: "Hazard",
+    422: "Hazard",
+    1726: "Hazard",
+    244: "Hazard",
+    1721: "Hazard",
+    243: "Hazard",
+    1720: "Hazard",
+    421: "Hazard",
+    1725: "Hazard",
+    9: "Hazard",
+    1715: "Hazard",
+    989: "Hazard",
+    1732: "Hazard",
+    1714: "Hazard",
+    1712: "Hazard",
+    368: "Hazard",
+    1722: "Hazard",
+    1713: "Hazard",
+    178: "Hazard",
+    919: "Hazard",
+    179: "Hazard",
+    88: "Sawblade",
+    186: "Sawblade",
+    740: "Sawblade",
+    1705: "Sawblade",
+    89: "Sawblade",
+    1706: "Sawblade",
+    98: "Sawblade",
+    183: "Sawblade",
+    184: "Sawblade",
+    185: "Sawblade",
+    187: "Sawblade",
+    741: "Sawblade",
+    188: "Sawblade",
+    742: "Sawblade",
+    397: "Sawblade",
+    1708: "Sawblade",
+    398: "Sawblade",
+    1709: "Sawblade",
+    399: "Sawblade",
+    1710: "Sawblade",
+    675: "Sawblade",
+    1734: "Sawblade",
+    676: "Sawblade",
+    1735: "Sawblade",
+    677: "Sawblade",
+    1736: "Sawblade",
+    678: "Sawblade",
+    679: "Sawblade",
+    680: "Sawblade",
+    918: "Sawblade",
+    1582: "Sawblade",
+    1583: "Sawblade",
+    1619: "Sawblade",
+    1620: "Sawblade",
+    1707: "Sawblade",
+    1701: "Sawblade",
+    1702: "Sawblade",
+    1703: "Sawblade",
+    35: "Pad",
+    140: "Pad",
+    67: "Pad",
+    36: "Orb",
+    84: "Orb",
+    141: "Orb",
+    12: "VehiclePortal",
+    13: "VehiclePortal",
+    47: "VehiclePortal",
+    111: "VehiclePortal",
+    660: "VehiclePortal",
+    10: "GravityPortal",
+    11: "GravityPortal",
+    99: "SizePortal",
+    101: "SizePortal",
+    143: "BreakableBlock",
+    200: "SpeedPortal",
+    201: "SpeedPortal",
+    202: "SpeedPortal",
+    203: "SpeedPortal",
+    1334: "SpeedPortal",
+    289: "Slope",
+    294: "Slope",
+    299: "Slope",
+    305: "Slope",
+    309: "Slope",
+    315: "Slope",
+    321: "Slope",
+    326: "Slope",
+    331: "Slope",
+    337: "Slope",
+    343: "Slope",
+    349: "Slope",
+    353: "Slope",
+    371: "Slope",
+    483: "Slope",
+    492: "Slope",
+    651: "Slope",
+    665: "Slope",
+    673: "Slope",
+    709: "Slope",
+    711: "Slope",
+    726: "Slope",
+    728: "Slope",
+    886: "Slope",
+    1338: "Slope",
+    1341: "Slope",
+    1344: "Slope",
+    1723: "Slope",
+    1743: "Slope",
+    1745: "Slope",
+    1747: "Slope",
+    1749: "Slope",
+    1906: "Slope",
+    363: "SlopeHazard",
+    1717: "SlopeHazard",
+    291: "Slope",
+    295: "Slope",
+    301: "Slope",
+    307: "Slope",
+    311: "Slope",
+    317: "Slope",
+    323: "Slope",
+    327: "Slope",
+    333: "Slope",
+    339: "Slope",
+    345: "Slope",
+    351: "Slope",
+    355: "Slope",
+    367: "Slope",
+    372: "Slope",
+    484: "Slope",
+    493: "Slope",
+    652: "Slope",
+    666: "Slope",
+    674: "Slope",
+    710: "Slope",
+    712: "Slope",
+    727: "Slope",
+    729: "Slope",
+    887: "Slope",
+    1339: "Slope",
+    1342: "Slope",
+    1345: "Slope",
+    1724: "Slope",
+    1744: "Slope",
+    1746: "Slope",
+    1748: "Slope",
+    1750: "Slope",
+    1907: "Slope",
+    364: "SlopeHazard",
+    366: "SlopeHazard",
+    1718: "SlopeHazard"
+    }
+
+
+HITBOX_SIZE = {
+    1: (30, 30),
+    2: (30, 30),
+    3: (30, 30),
+    4: (30, 30),
+    6: (30, 30),
+    7: (30, 30),
+    63: (30, 30),
+    69: (30, 30),
+    70: (30, 30),
+    71: (30, 30),
+    72: (30, 30),
+    74: (30, 30),
+    75: (30, 30),
+    76: (30, 30),
+    77: (30, 30),
+    78: (30, 30),
+    81: (30, 30),
+    82: (30, 30),
+    83: (30, 30),
+    90: (30, 30),
+    91: (30, 30),
+    92: (30, 30),
+    93: (30, 30),
+    94: (30, 30),
+    95: (30, 30),
+    96: (30, 30),
+    116: (30, 30),
+    117: (30, 30),
+    118: (30, 30),
+    119: (30, 30),
+    121: (30, 30),
+    122: (30, 30),
+    146: (30, 30),
+    160: (30, 30),
+    161: (30, 30),
+    162: (30, 30),
+    163: (30, 30),
+    165: (30, 30),
+    166: (30, 30),
+    167: (30, 30),
+    168: (30, 30),
+    169: (30, 30),
+    173: (30, 30),
+    175: (30, 30),
+    207: (30, 30),
+    208: (30, 30),
+    209: (30, 30),
+    210: (30, 30),
+    212: (30, 30),
+    213: (30, 30),
+    247: (30, 30),
+    248: (30, 30),
+    249: (30, 30),
+    250: (30, 30),
+    252: (30, 30),
+    253: (30, 30),
+    254: (30, 30),
+    255: (30, 30),
+    256: (30, 30),
+    257: (30, 30),
+    258: (30, 30),
+    260: (30, 30),
+    261: (30, 30),
+    263: (30, 30),
+    264: (30, 30),
+    265: (30, 30),
+    267: (30, 30),
+    268: (30, 30),
+    269: (30, 30),
+    270: (30, 30),
+    271: (30, 30),
+    272: (30, 30),
+    274: (30, 30),
+    275: (30, 30),
+    467: (30, 30),
+    469: (30, 30),
+    470: (30, 30),
+    471: (30, 30),
+    1203: (30, 30),
+    1204: (30, 30),
+    1209: (30, 30),
+    1210: (30, 30),
+    1221: (30, 30),
+    1222: (30, 30),
+    1226: (30, 30),
+    64: (15, 15),
+    195: (15, 15),
+    206: (15, 15),
+    220: (15, 15),
+    661: (15, 15),
+    1155: (15, 15),
+    1156: (15, 15),
+    1157: (15, 15),
+    1208: (15, 15),
+    1910: (15, 15),
+    40: (30, 14),
+    147: (30, 14),
+    215: (30, 14),
+    369: (30, 14),
+    370: (30, 14),
+    1903: (30, 14),
+    1904: (30, 14),
+    1905: (30, 14),
+    170: (30, 21),
+    171: (30, 21),
+    172: (30, 21),
+    174: (30, 21),
+    192: (30, 21),
+    468: (30, 1.5),
+    475: (30, 1.5),
+    1260: (30, 1.5),
+    62: (30, 16),
+    65: (30, 16),
+    66: (30, 16),
+    68: (30, 16),
+    1202: (30, 3),
+    1262: (30, 3),
+    1220: (30, 6),
+    1264: (30, 6),
+    196: (15, 8),
+    219: (15, 8),
+    1911: (15, 8),
+    204: (8, 15),
+    662: (30, 15),
+    663: (30, 15),
+    664: (30, 15),
+    1561: (30, 10),
+    1567: (15, 10),
+    1566: (12, 12),
+    1565: (17, 17),
+    1227: (30, 7),
+    328: (22, 22),
+    197: (22, 21),
+    194: (21, 21),
+    176: (14, 21),
+    1562: (30, 2),
+    1343: (25, 3),
+    1340: (27, 2),
+    34: (37, 23),
+    720: (2.40039063, 3.20001221),
+    991: (2.40039063, 3.20001221),
+    1731: (2.40039063, 3.20001221),
+    1733: (2.40039063, 3.20001221),
+    61: (9, 7.2),
+    446: (9, 7.2),
+    1719: (9, 7.2),
+    1728: (9, 7.2),
+    365: (9, 6),
+    667: (9, 6),
+    1716: (9, 6),
+    1730: (9, 6),
+    392: (2.6, 4.8),
+    458: (2.6, 4.8),
+    459: (2.6, 4.8),
+    8: (6, 12),
+    144: (6, 12),
+    177: (6, 12),
+    216: (6, 12),
+    103: (4, 7.6),
+    145: (4, 7.6),
+    218: (4, 7.6),
+    39: (6, 5.6),
+    205: (6, 5.6),
+    217: (6, 5.6),
+    768: (4.5, 5.2),
+    1727: (4.5, 5.2),
+    447: (5.2, 7.2),
+    1729: (5.2, 7.2),
+    135: (14.1, 20),
+    1711: (14.1, 20),
+    422: (6, 4.4),
+    1726: (6, 4.4),
+    244: (6, 6.8),
+    1721: (6, 6.8),
+    243: (6, 7.2),
+    1720: (6, 7.2),
+    421: (9, 5.2),
+    1725: (9, 5.2),
+    9: (9, 10.8),
+    1715: (9, 10.8),
+    989: (9, 12),
+    1732: (9, 12),
+    1714: (11.4, 16.4),
+    1712: (13.5, 22.4),
+    368: (9, 4),
+    1722: (9, 4),
+    1713: (11.7, 20),
+    178: (6, 6.4),
+    919: (25, 6),
+    179: (4, 8),
+    88: (32.3, 32.3),
+    186: (32.3, 32.3),
+    740: (32.3, 32.3),
+    1705: (32.3, 32.3),
+    89: (21.6, 21.6),
+    1706: (21.6, 21.6),
+    98: (12, 12),
+    183: (15.660001, 15.660001),
+    184: (20.4, 20.4),
+    185: (2.8500001, 2.8500001),
+    187: (21.960001, 21.960001),
+    741: (21.960001, 21.960001),
+    188: (12.6000004, 12.6000004),
+    742: (12.6000004, 12.6000004),
+    397: (28.9, 28.9),
+    1708: (28.9, 28.9),
+    398: (17.44, 17.44),
+    1709: (17.44, 17.44),
+    399: (12.900001, 12.900001),
+    1710: (12.900001, 12.900001),
+    675: (32, 32),
+    1734: (32, 32),
+    676: (17.5100002, 17.5100002),
+    1735: (17.5100002, 17.5100002),
+    677: (12.479999, 12.479999),
+    1736: (12.479999, 12.479999),
+    678: (30.4, 30.4),
+    679: (18.54, 18.54),
+    680: (10.8, 10.8),
+    918: (24, 24),
+    1582: (4, 4),
+    1583: (4, 4),
+    1619: (25, 25),
+    1620: (15, 15),
+    1707: (12, 12),
+    1701: (6, 6),
+    1702: (6, 6),
+    1703: (6, 6),
+    35: (25, 4),
+    140: (25, 5),
+    67: (25, 6),
+    36: (36, 36),
+    84: (36, 36),
+    141: (36, 36),
+    12: (34, 86),
+    13: (34, 86),
+    47: (34, 86),
+    111: (34, 86),
+    660: (34, 86),
+    10: (25, 75),
+    11: (25, 75),
+    99: (31, 90),
+    101: (31, 90),
+    143: (30, 30),
+    200: (35, 44),
+    201: (33, 56),
+    202: (51, 56),
+    203: (65, 56),
+    1334: (69, 56),
+    289: (30, 30),
+    294: (30, 30),
+    299: (30, 30),
+    305: (30, 30),
+    309: (30, 30),
+    315: (30, 30),
+    321: (30, 30),
+    326: (30, 30),
+    331: (30, 30),
+    337: (30, 30),
+    343: (30, 30),
+    349: (30, 30),
+    353: (30, 30),
+    371: (30, 30),
+    483: (30, 30),
+    492: (30, 30),
+    651: (30, 30),
+    665: (30, 30),
+    673: (30, 30),
+    709: (30, 30),
+    711: (30, 30),
+    726: (30, 30),
+    728: (30, 30),
+    886: (30, 30),
+    1338: (30, 30),
+    1341: (30, 30),
+    1344: (30, 30),
+    1723: (30, 30),
+    1743: (30, 30),
+    1745: (30, 30),
+    1747: (30, 30),
+    1749: (30, 30),
+    1906: (30, 30),
+    363: (30, 30),
+    1717: (30, 30),
+    291: (60, 30),
+    295: (60, 30),
+    301: (60, 30),
+    307: (60, 30),
+    311: (60, 30),
+    317: (60, 30),
+    323: (60, 30),
+    327: (60, 30),
+    333: (60, 30),
+    339: (60, 30),
+    345: (60, 30),
+    351: (60, 30),
+    355: (60, 30),
+    367: (60, 30),
+    372: (60, 30),
+    484: (60, 30),
+    493: (60, 30),
+    652: (60, 30),
+    666: (60, 30),
+    674: (60, 30),
+    710: (60, 30),
+    712: (60, 30),
+    727: (60, 30),
+    729: (60, 30),
+    887: (60, 30),
+    1339: (60, 30),
+    1342: (60, 30),
+    1345: (60, 30),
+    1724: (60, 30),
+    1744: (60, 30),
+    1746: (60, 30),
+    1748: (60, 30),
+    1750: (60, 30),
+    1907: (60, 30),
+    364: (60, 30),
+    366: (60, 30),
+    1718: (60, 30)
+    }
\ No newline at end of file
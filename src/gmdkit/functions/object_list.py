@@ -7,6 +7,7 @@ import math
 from gmdkit.mappings import obj_prop, obj_id
 from gmdkit.models.object import ObjectList, Object
 from gmdkit.models.prop.groups import IDList
+from gmdkit.models.spatial_index import SpatialIndex
 from gmdkit.functions.object import get_keyframe_id
 
 ObjectListMapping = dict[Optional[int],ObjectList]
@@ -54,7 +55,7 @@ def add_groups(obj_list:ObjectList, *groups:Sequence[int]):
 # TODO REVIEW
 def group_objects(
         obj_list:ObjectList, 
-        key_func:Callable=lambda obj: obj.get(obj_prop.ID),
+        key_func:Callable=lambda obj: obj.peek(obj_prop.ID),
         value_func:Callable=ObjectList
         ):
     
@@ -116,7 +117,7 @@ def compile_groups(obj_list:ObjectList) -> ObjectListMapping:
     
     for obj in obj_list:
         
-        gids = obj.get(obj_prop.GROUPS,[])
+        gids = obj.peek(obj_prop.GROUPS,[])
         
         if gids:
             for gid in gids:
@@ -165,7 +166,7 @@ def compile_parents(
     
     for obj in obj_list:
         
-        if (parents:=obj.get(obj_prop.PARENT_GROUPS)):
+        if (parents:=obj.peek(obj_prop.PARENT_GROUPS)):
         
             for parent in parents:
             
@@ -174,14 +175,14 @@ def compile_parents(
         
     for gid, parent in gid_parents.items():
         
-        if parent.get(obj_prop.GROUP_PARENT):
+        if parent.peek(obj_prop.GROUP_PARENT):
             group_parents[gid] = parent
         
-        if parent.get(obj_prop.AREA_PARENT):
+        if parent.peek(obj_prop.AREA_PARENT):
             area_parents[gid] = parent
     
     
-    priority = lambda obj: (obj.get(obj_prop.X,0),obj.get(obj_prop.Y,0))
+    priority = lambda obj: (obj.peek(obj_prop.X,0),obj.peek(obj_prop.Y,0))
     
     for gid, group in groups.items():
         
@@ -192,14 +193,16 @@ def compile_parents(
         ap = area_parents.get(gid)
         
         if gp is None:
-            gp = group.where(lambda obj: obj.get(obj_prop.GROUP_PARENT) is not None)
+            gp = group.where(lambda obj: obj.peek(obj_prop.GROUP_PARENT) is not None)
+            gp = min(gp, key=priority) if gp else None
             
-            if gp: group_parents[gid] = min(gp, key=priority)
+            if gp is not None: group_parents[gid] = gp
         
         if ap is None:
-            ap = group.where(lambda obj: obj.get(obj_prop.AREA_PARENT) is not None)
+            ap = group.where(lambda obj: obj.peek(obj_prop.AREA_PARENT) is not None)
+            ap = min(ap, key=priority) if ap else None
             
-            if ap: area_parents[gid] = min(ap, key=priority)
+            if ap is not None: area_parents[gid] = ap
         
         if gp is None and ap is not None:
             group_parents[gid] = ap
@@ -243,8 +246,8 @@ def compile_chunks(
     result = dict()
     
     for obj in obj_list:
-        x = int(((obj.get(obj_prop.X,ox))-ox)/chunk_size)
-        y = int((obj.get(obj_prop.Y,oy)-oy)/chunk_size)
+        x = int(((obj.peek(obj_prop.X,ox))-ox)/chunk_size)
+        y = int((obj.peek(obj_prop.Y,oy)-oy)/chunk_size)
         
         chunk = result.setdefault((x,y),[])
         chunk.append(obj)
@@ -270,10 +273,10 @@ def compile_keyframe_ids(obj_list:ObjectList) -> ObjectListMapping:
     
     for obj in obj_list:
         
-        if obj_id.trigger.KEYFRAME != obj.get(obj_prop.ID):
+        if obj_id.trigger.KEYFRAME != obj.peek(obj_prop.ID):
             continue
         
-        if (key_id:=obj.get(obj_prop.trigger.keyframe.KEY_ID, 0)) is not None:
+        if (key_id:=obj.peek(obj_prop.trigger.keyframe.KEY_ID, 0)) is not None:
             
             pool = result.setdefault(key_id,ObjectList())
             
@@ -281,7 +284,7 @@ def compile_keyframe_ids(obj_list:ObjectList) -> ObjectListMapping:
             
     for value in result.values():
         
-        value.sort(key=lambda obj: obj.get(obj_prop.trigger.keyframe.INDEX,0))
+        value.sort(key=lambda obj: obj.peek(obj_prop.trigger.keyframe.INDEX,0))
         
     return result
 
@@ -312,11 +315,11 @@ def compile_keyframe_groups(
     
     for obj in obj_list:
         
-        if obj_id.trigger.KEYFRAME != obj.get(obj_prop.ID):
+        if obj_id.trigger.KEYFRAME != obj.peek(obj_prop.ID):
             continue
         
         if function is not None and callable(function) and (value:=function(obj)) is not None:
-            groups = obj.get(obj_prop.GROUPS)
+            groups = obj.peek(obj_prop.GROUPS)
             
             if groups:
                 no_group.discard(value)
@@ -366,23 +369,23 @@ def compile_links(obj_list:ObjectList) -> tuple[ObjectListMapping,ObjectMapping,
     
     for obj in obj_list:
         
-        if (link_id:=obj.get(obj_prop.LINKED_GROUP)):
+        if (link_id:=obj.peek(obj_prop.LINKED_GROUP)):
         
             link = links.setdefault(link_id,ObjectList())
             link.append(obj)
     
     
-    priority = lambda obj: (obj.get(obj_prop.X,0),obj.get(obj_prop.Y,0))
+    priority = lambda obj: (obj.peek(obj_prop.X,0),obj.peek(obj_prop.Y,0))
     
     for link_id, link in links.items():
         
         if link_id is None: continue
         
-        gp = link.where(lambda obj: obj.get(obj_prop.GROUP_PARENT) is not None)
+        gp = link.where(lambda obj: obj.peek(obj_prop.GROUP_PARENT) is not None)
             
         if gp: group_parents[link_id] = min(gp, key=priority)
         
-        ap = link.where(lambda obj: obj.get(obj_prop.AREA_PARENT) is not None)
+        ap = link.where(lambda obj: obj.peek(obj_prop.AREA_PARENT) is not None)
             
         if ap: area_parents[link_id] = min(ap, key=priority)
             
@@ -403,13 +406,13 @@ def compile_spawn_groups(obj_list:ObjectList) -> ObjectListMapping:
         A dictionary mapping all spawn trigger objects to a group ID.
 
     """
-    spawn_triggers = obj_list.where(lambda obj: obj.get(obj_prop.trigger.SPAWN_TRIGGER,False))
+    spawn_triggers = obj_list.where(lambda obj: obj.peek(obj_prop.trigger.SPAWN_TRIGGER,False))
     
     spawn_groups = compile_groups(obj_list=spawn_triggers)
     
     for gid, group in spawn_groups.items():
 
-        group.sort(key=lambda obj: obj.get(obj_prop.X,0))
+        group.sort(key=lambda obj: obj.peek(obj_prop.X,0))
     
     return spawn_groups
          
@@ -420,6 +423,7 @@ def boundaries(
     """
     Compiles the boundaries of a group of objects.
     Only the center position is considered, the object's texture is ignored.
+    Use functions.object_table.level_extents to include hitboxes.
 
     Parameters
     ----------
@@ -443,9 +447,9 @@ def boundaries(
     y = []
     
     for obj in obj_list:
-        if (pos_x:=obj.get(obj_prop.X)) is not None:
+        if (pos_x:=obj.peek(obj_prop.X)) is not None:
             x.append(pos_x)
-        if (pos_y:=obj.get(obj_prop.Y)) is not None:
+        if (pos_y:=obj.peek(obj_prop.Y)) is not None:
             y.append(pos_y)
     
     if x:
@@ -714,15 +718,20 @@ def align_objects(
     if y_axis: per_axis('y', obj_prop.Y)
 
 # TODO
-def group_objects_x(obj_list:ObjectList, function:Callable=ObjectList, forward_limit:float=0):
+def group_objects_x(obj_list:ObjectList|SpatialIndex, function:Callable=ObjectList, forward_limit:float=0):
     
-    objs = sorted(obj_list, key=lambda obj: obj.get(obj_prop.X,0))
+    if isinstance(obj_list, SpatialIndex):
+        # the index is already sorted and holds the positions
+        objs = obj_list.sorted_x()
+        positions = obj_list.sorted_x_positions()
+    else:
+        objs = sorted(obj_list, key=lambda obj: obj.peek(obj_prop.X,0))
+        positions = [obj.peek(obj_prop.X) for obj in objs]
     
     groups = {}
     
     x = None
-    for obj in objs:
-        ox = obj.get(obj_prop.X)
+    for obj, ox in zip(objs, positions):
         if x is None or ox is not None and ox-x > forward_limit:
             x = ox
         gx = groups.setdefault(x, [])
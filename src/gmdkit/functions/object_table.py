@@ -0,0 +1,507 @@
+# Imports
+from typing import Optional, Callable
+import math
+import numpy as np
+
+# Package Imports
+from gmdkit.mappings import obj_prop
+from gmdkit.models.object import ObjectList
+from gmdkit.models.object_table import ObjectTable, DEFAULT_COLUMNS, HITBOX_COLUMNS
+
+ObjectSource = ObjectList|ObjectTable
+
+VECTOR_SNAP = {round: np.rint, math.floor: np.floor, math.ceil: np.ceil, math.trunc: np.trunc}
+# bounds the candidate pairs held at once by overlapping_pairs
+PAIR_CHUNK = 1 << 21
+
+
+def map_math(func:Callable, *arrays:np.ndarray) -> np.ndarray:
+    """
+    Maps a math function over arrays.
+    
+    NumPy's transcendental functions may differ from the math module in the last bit,
+    mapping the math function keeps results identical to the scalar functions.
+    """
+    return np.fromiter(map(func, *(array.tolist() for array in arrays)), dtype=np.float64, count=len(arrays[0]))
+
+
+def as_table(objects:ObjectSource, *keys:int) -> ObjectTable:
+    """
+    Returns the given table, or builds a table of the given property columns from an object list.
+    
+    Properties added to objects on write back are inserted in column order.
+    """
+    if isinstance(objects, ObjectTable):
+        return objects
+
+    return ObjectTable(objects, columns={key: DEFAULT_COLUMNS[key] for key in keys}, groups=False)
+
+
+def offset_table(
+        objects:ObjectSource,
+        offset_x:float=0,
+        offset_y:float=0
+        ) -> None:
+    """
+    Offsets the position of every object, same as offset_position.
+
+    Object lists are written back immediately, tables must be written back by the caller.
+
+    Parameters
+    ----------
+    objects : ObjectList | ObjectTable
+        The objects to modify.
+    offset_x : float, optional
+        The horizontal offset. Default to 0.
+    offset_y : float, optional
+        The vertical offset. Defaults to 0.
+
+    Returns
+    -------
+    None.
+
+    """
+    table = as_table(objects, obj_prop.X, obj_prop.Y)
+
+    for key, offset in ((obj_prop.X, offset_x), (obj_prop.Y, offset_y)):
+        mask = table.present[key]
+        table.set(key, table[key][mask] + offset, mask)
+
+    if table is not objects:
+        table.write_back()
+
+
+def scale_table(
+        objects:ObjectSource,
+        scale_x:float=1.00,
+        scale_y:float=1.00,
+        center_x:Optional[float]=None,
+        center_y:Optional[float]=None,
+        lock_scale:bool=False
+        ) -> None:
+    """
+    Scales and moves every object relative to a position, same as scale_position.
+
+    Object lists are written back immediately, tables must be written back by the caller.
+
+    Parameters
+    ----------
+    objects : ObjectList | ObjectTable
+        The objects to modify.
+    scale_x : float, optional
+        The X scaling applied, defaults to 1.00.
+    scale_y : float, optional
+        The Y scaling applied, defaults to 1.00.
+    center_x : Optional[float], optional
+        The X position of the center reference, movement is not applied on X axis if left as None.
+    center_y : Optional[float], optional
+        The Y position of the center reference, movement is not applied on X axis if left as None.
+    lock_scale : bool, optional
+        Only moves the objects without scaling if True, defaults to False.
+
+    Returns
+    -------
+    None.
+
+    """
+    table = as_table(objects, obj_prop.SCALE_X, obj_prop.SCALE_Y, obj_prop.X, obj_prop.Y)
+
+    if not lock_scale:
+        table.set(obj_prop.SCALE_X, table[obj_prop.SCALE_X] * scale_x)
+        table.set(obj_prop.SCALE_Y, table[obj_prop.SCALE_Y] * scale_y)
+
+    for key, scale, center in ((obj_prop.X, scale_x, center_x), (obj_prop.Y, scale_y, center_y)):
+        if center is None:
+            continue
+
+        mask = table.present[key]
+        table.set(key, center + scale * (table[key][mask] - center), mask)
+
+    if table is not objects:
+        table.write_back()
+
+
+def rotate_table(
+        objects:ObjectSource,
+        angle:float=0,
+        center_x:Optional[float]=None,
+        center_y:Optional[float]=None,
+        lock_rotation:bool=False
+        ) -> None:
+    """
+    Rotates and moves every object relative to a position, same as rotate_position.
+
+    Object lists are written back immediately, tables must be written back by the caller.
+
+    Parameters
+    ----------
+    objects : ObjectList | ObjectTable
+        The objects to modify.
+    angle : float, optional
+        The angle of the rotation that will be applied, defaults to 0.
+    center_x : Optional[float], optional
+        The X position of the center reference, movement is not applied if left as None.
+    center_y : Optional[float], optional
+        The Y position of the center reference, movement is not applied if left as None.
+    lock_rotation : bool, optional
+        Only moves the objects without rotation if True, defaults to False.
+
+    Returns
+    -------
+    None.
+
+    """
+    table = as_table(
+        objects,
+        obj_prop.SKEW_X, obj_prop.SKEW_Y, obj_prop.ROTATION, obj_prop.X, obj_prop.Y
+        )
+
+    if not lock_rotation:
+        skew_x = table[obj_prop.SKEW_X]
+        skew_y = table[obj_prop.SKEW_Y]
+        skewed = table.present[obj_prop.SKEW_X] | table.present[obj_prop.SKEW_Y]
+        unskewed = ~skewed
+
+        table.set(obj_prop.ROTATION, table[obj_prop.ROTATION][unskewed] + angle, unskewed)
+        # matches the scalar path, zero or missing skews are replaced by the angle
+        table.set(obj_prop.SKEW_X, np.where(skew_x != 0, skew_x, 0 + angle)[skewed], skewed)
+        table.set(obj_prop.SKEW_Y, np.where(skew_y != 0, skew_y, 0 + angle)[skewed], skewed)
+
+    if center_x is not None and center_y is not None:
+        th = math.radians(angle)
+        cos_th = math.cos(th)
+        sin_th = math.sin(th)
+
+        mask = table.present[obj_prop.X] & table.present[obj_prop.Y]
+        dx = table[obj_prop.X][mask] - center_x
+        dy = table[obj_prop.Y][mask] - center_y
+
+        table.set(obj_prop.X, dx * cos_th - dy * sin_th, mask)
+        table.set(obj_prop.Y, dx * sin_th + dy * cos_th, mask)
+
+    if table is not objects:
+        table.write_back()
+
+
+def grid_align_table(
+        objects:ObjectSource,
+        unit_x:Optional[float]=None,
+        unit_y:Optional[float]=None,
+        offset_x:float=0,
+        offset_y:float=0,
+        snap_func:Callable=round
+        ) -> None:
+    """
+    Aligns every object to a grid of a given size, same as grid_align.
+
+    Object lists are written back immediately, tables must be written back by the caller.
+
+    Parameters
+    ----------
+    objects : ObjectList | ObjectTable
+        The objects to modify.
+    unit_x : Optional[float], optional
+        The grid's X width. The default is None.
+    unit_y : Optional[float], optional
+        The grid's Y width. The default is None.
+    offset_x : float, optional
+        The grid's X offset. The default is 0.
+    offset_y : float, optional
+        The grid's Y offset. The default is 0.
+    snap_func : Callable, optional
+        The function used to snap the position of the objects. Uses round() by default.
+        round, math.floor, math.ceil and math.trunc are vectorized,
+        other functions are called on the whole column, or on each value if that fails.
+
+    Returns
+    -------
+    None.
+
+    """
+    if not (unit_x or unit_y) or not callable(snap_func): return
+
+    table = as_table(objects, obj_prop.X, obj_prop.Y)
+
+    def snap(values:np.ndarray) -> np.ndarray:
+        if (func := VECTOR_SNAP.get(snap_func)) is not None:
+            return func(values)
+        try:
+            return np.asarray(snap_func(values), dtype=np.float64)
+        except TypeError:
+            return np.array([snap_func(value) for value in values.tolist()], dtype=np.float64)
+
+    for key, unit, offset in ((obj_prop.X, unit_x, offset_x), (obj_prop.Y, unit_y, offset_y)):
+        if unit is None:
+            continue
+
+        mask = table.present[key]
+        table.set(key, snap((table[key][mask] - offset) / unit) * unit + offset, mask)
+
+    if table is not objects:
+        table.write_back()
+
+
+def warp_table(
+        objects:ObjectSource,
+        only_move:bool=False,
+        rotation:float|None=None,
+        skew:float|None=None,
+        center_x:float|None=None,
+        center_y:float|None=None,
+        center_rotation:float|None=None
+        ) -> None:
+    """
+    Warps every object around a position, same as warp_objects.
+
+    Object lists are written back immediately, tables must be written back by the caller.
+
+    Parameters
+    ----------
+    objects : ObjectList | ObjectTable
+        The objects to modify.
+    only_move : bool, optional
+        Only moves the objects without transforming them if True, defaults to False.
+    rotation : float | None, optional
+        The rotation of the warp.
+    skew : float | None, optional
+        The skew of the warp.
+    center_x : float | None, optional
+        The X position of the warp center, defaults to 0.
+    center_y : float | None, optional
+        The Y position of the warp center, defaults to 0.
+    center_rotation : float | None, optional
+        A rotation subtracted from the warp rotation.
+
+    Returns
+    -------
+    None.
+
+    """
+    table = as_table(
+        objects,
+        obj_prop.SCALE_X, obj_prop.SCALE_Y, obj_prop.SKEW_X, obj_prop.SKEW_Y, 
+        obj_prop.ROTATION, obj_prop.X, obj_prop.Y
+        )
+
+    if center_rotation is not None:
+        rotation = (rotation or 0) - center_rotation
+
+    center_x = center_x or 0.0
+    center_y = center_y or 0.0
+
+    r = math.radians(rotation or 0)
+    cos_r = math.cos(r)
+    sin_r = math.sin(r)
+    tx = math.tan(math.radians(rotation or 0))
+    ty = math.tan(math.radians(skew or 0))
+
+    m00 = cos_r
+    m01 = -sin_r + tx
+    m10 = sin_r + ty
+    m11 = cos_r
+
+    if not only_move and len(table):
+        rotated = table.present[obj_prop.ROTATION]
+        rot = table[obj_prop.ROTATION]
+        skew_x = table[obj_prop.SKEW_X]
+        skew_y = table[obj_prop.SKEW_Y]
+
+        obj_tx = np.radians(np.where(rotated, skew_x + rot, skew_x))
+        obj_ty = np.radians(np.where(rotated, skew_y + rot, skew_y))
+        
+        scale_x = table[obj_prop.SCALE_X]
+        scale_y = table[obj_prop.SCALE_Y]
+        
+        vx = scale_x * map_math(math.cos, obj_tx)
+        vy = scale_x * map_math(math.sin, obj_tx)
+        wx = scale_y * map_math(math.cos, obj_ty)
+        wy = scale_y * map_math(math.sin, obj_ty)
+        
+        vx, vy = vx * cos_r - vy * sin_r,  vx * sin_r + vy * cos_r
+        wx, wy = wx * cos_r - wy * sin_r, wx * sin_r + wy * cos_r
+        
+        wx += tx * vx
+        wy += tx * vy
+        vx += ty * wx
+        vy += ty * wy
+        
+        new_scale_x = map_math(math.hypot, vx, vy)
+        new_scale_y = map_math(math.hypot, wx, wy)
+        new_skew_x = np.degrees(map_math(math.atan2, vy, vx))
+        new_skew_y = np.degrees(map_math(math.atan2, wy, wx))
+
+        for key, values in ((obj_prop.SCALE_X, new_scale_x), (obj_prop.SCALE_Y, new_scale_y)):
+            unit = values == 1
+            table.drop(key, unit)
+            table.set(key, values[~unit], ~unit)
+
+        same = new_skew_x == new_skew_y
+        table.drop(obj_prop.SKEW_X, same)
+        table.drop(obj_prop.SKEW_Y, same)
+        table.set(obj_prop.ROTATION, new_skew_x[same], same)
+        table.set(obj_prop.SKEW_X, new_skew_x[~same], ~same)
+        table.set(obj_prop.SKEW_Y, new_skew_y[~same], ~same)
+
+    dx = table[obj_prop.X] - center_x
+    dy = table[obj_prop.Y] - center_y
+
+    table.set(obj_prop.X, m00 * dx + m01 * dy + center_x)
+    table.set(obj_prop.Y, m10 * dx + m11 * dy + center_y)
+
+    if table is not objects:
+        table.write_back()
+
+
+def object_bounds(objects:ObjectSource) -> np.ndarray:
+    """
+    Returns the axis aligned bounding box of every object's hitbox, see ObjectTable.bounds().
+
+    Parameters
+    ----------
+    objects : ObjectList | ObjectTable
+        The objects to measure. Tables must hold the HITBOX_COLUMNS.
+
+    Returns
+    -------
+    np.ndarray
+        An array of shape (len(objects), 4) holding min_x, min_y, max_x, max_y per object.
+
+    """
+    return as_table(objects, *HITBOX_COLUMNS).bounds()
+
+
+def level_extents(objects:ObjectSource) -> dict[str,float]:
+    """
+    Compiles the extents of a group of objects, including their hitboxes.
+    
+    Unlike boundaries, the object's hitbox is considered.
+
+    Parameters
+    ----------
+    objects : ObjectList | ObjectTable
+        The objects to measure.
+
+    Returns
+    -------
+    extents : dict
+        A dictionary containing min_x, min_y, max_x, max_y, all 0.0 if there are no objects.
+
+    """
+    bounds = object_bounds(objects)
+
+    if not len(bounds):
+        return {"min_x": 0.0, "min_y": 0.0, "max_x": 0.0, "max_y": 0.0}
+
+    min_x, min_y = bounds[:,:2].min(axis=0).tolist()
+    max_x, max_y = bounds[:,2:].max(axis=0).tolist()
+
+    return {"min_x": min_x, "min_y": min_y, "max_x": max_x, "max_y": max_y}
+
+
+def overlapping_pairs(
+        objects:ObjectSource,
+        touching:bool=False,
+        bounds:Optional[np.ndarray]=None
+        ) -> np.ndarray:
+    """
+    Finds every pair of objects whose hitboxes overlap, using sweep and prune.
+
+    Boxes are sorted by their left edge, each box is only compared with
+    the boxes starting before its right edge.
+
+    Parameters
+    ----------
+    objects : ObjectList | ObjectTable
+        The objects to check.
+    touching : bool, optional
+        If True, boxes sharing an edge or a corner also overlap,
+        which includes objects without a hitbox stacked on the same position. Defaults to False.
+    bounds : np.ndarray, optional
+        Precomputed bounds of the objects, as returned by object_bounds.
+
+    Returns
+    -------
+    np.ndarray
+        An array of shape (pairs, 2) of object indices, 
+        each pair holding the lower index first, sorted by the first then the second index.
+
+    """
+    if bounds is None:
+        bounds = object_bounds(objects)
+
+    count = len(bounds)
+    order = np.argsort(bounds[:,0], kind="stable")
+    min_x, min_y, max_x, max_y = bounds[order].T
+
+    # boxes after i in sweep order that start before i ends
+    starts = np.arange(1, count + 1)
+    ends = np.searchsorted(min_x, max_x, side="right" if touching else "left")
+    counts = np.maximum(ends - starts, 0)
+    totals = np.cumsum(counts)
+
+    pairs = []
+    first = 0
+
+    while first < count:
+        # splits the sweep so that a chunk holds about PAIR_CHUNK candidates
+        done = totals[first - 1] if first else 0
+        last = max(int(np.searchsorted(totals, done + PAIR_CHUNK, side="right")), first + 1)
+
+        i = np.repeat(np.arange(first, last), counts[first:last])
+        offsets = np.arange(len(i)) - np.repeat(np.cumsum(counts[first:last]) - counts[first:last], counts[first:last])
+        j = starts[i] + offsets
+
+        if touching:
+            hits = (min_x[j] <= max_x[i]) & (min_y[j] <= max_y[i]) & (min_y[i] <= max_y[j]) & (min_x[i] <= max_x[j])
+        else:
+            hits = (min_x[j] < max_x[i]) & (min_y[j] < max_y[i]) & (min_y[i] < max_y[j]) & (min_x[i] < max_x[j])
+
+        pairs.append(np.stack((order[i[hits]], order[j[hits]]), axis=1))
+        first = last
+
+    if not pairs:
+        return np.empty((0, 2), dtype=np.int64)
+
+    pairs = np.concatenate(pairs)
+    pairs.sort(axis=1)
+
+    return pairs[np.lexsort((pairs[:,1], pairs[:,0]))]
+
+
+def stacked_objects(objects:ObjectSource, same_id:bool=True) -> list[np.ndarray]:
+    """
+    Finds objects placed on the same position.
+
+    Parameters
+    ----------
+    objects : ObjectList | ObjectTable
+        The objects to check.
+    same_id : bool, optional
+        If True, stacked objects must also share their object ID. Defaults to True.
+
+    Returns
+    -------
+    list[np.ndarray]
+        Arrays of the indices of objects sharing a position, in list order,
+        sorted by their first index.
+
+    """
+    table = as_table(objects, obj_prop.ID, obj_prop.X, obj_prop.Y)
+    keys = [table[obj_prop.X], table[obj_prop.Y]]
+
+    if same_id:
+        keys.append(table[obj_prop.ID])
+
+    # lexsort is stable, indices stay in list order within a stack
+    order = np.lexsort(keys[::-1])
+    same = np.ones(max(len(order) - 1, 0), dtype=np.bool_)
+
+    for key in keys:
+        values = key[order]
+        same &= values[1:] == values[:-1]
+
+    edges = np.flatnonzero(np.diff(np.concatenate(([False], same, [False])).astype(np.int8)))
+    stacks = [order[start:end + 1] for start, end in zip(edges[::2].tolist(), edges[1::2].tolist())]
+    stacks.sort(key=lambda stack: stack[0])
+
+    return stacks
@@ -6,11 +6,20 @@ __all__ = (
     "MusicLibrary",
     "SFXLibrary",
     "Level",
+    "LazyLevel",
     "LevelList",
     "Object",
+    "LazyObject",
+    "SharedObject",
+    "CompactObject",
     "ObjectList",
     "ObjectGroup",
     "ObjectGroupDict",
+    "ObjectTable",
+    "LevelIndex",
+    "SpatialIndex",
+    "ObjectDiff",
+    "LevelDiff",
     "LevelPack",
     "LevelPackList",
     "TemplatePosition",
@@ -28,8 +37,12 @@ from .save.game_manager import GameSave
 from .save.level_manager import LevelSave
 from .save.music_library import MusicLibrary
 from .save.sfx_library import SFXLibrary
-from .level import Level, LevelList
-from .object import Object, ObjectList, ObjectGroup, ObjectGroupDict
+from .level import Level, LazyLevel, LevelList
+from .object import Object, LazyObject, SharedObject, CompactObject, ObjectList, ObjectGroup, ObjectGroupDict
+from .object_table import ObjectTable
+from .level_index import LevelIndex
+from .spatial_index import SpatialIndex
+from .level_diff import ObjectDiff, LevelDiff
 from .level_pack import LevelPack, LevelPackList
 from .template import (
     TemplatePosition, TemplateType, 
@@ -1,5 +1,6 @@
 # Imports
-from typing import Any
+from typing import Any, Optional, Self, Callable
+import xml.etree.ElementTree as ET
 
 # Package Imports
 from gmdkit.utils.types import ListClass, DictClass
@@ -7,17 +8,22 @@ from gmdkit.models.object import Object, ObjectList
 from gmdkit.models.prop.gzip import ObjectString
 from gmdkit.serialization.mixins import FilePathMixin, PlistLoaderMixin, FolderLoaderMixin, DictDefaultsMixin
 from gmdkit.serialization.functions import (
-    dict_cast, from_node_dict, to_node_dict, read_plist, write_plist, get_load_keys, kv_wrap, args_wrap
+    from_node_dict, to_node_dict, read_plist, write_plist, get_load_keys, kv_wrap, args_wrap,
+    iter_dict_node, iter_dict_spans, write_plist_node, StreamNode, RawNode
     )
+from gmdkit.serialization.type_cast import CompiledDecoder, CompiledEncoder
 from gmdkit.casting.level_props import LEVEL_ENCODERS, LEVEL_DECODERS, LEVEL_TYPES
 from gmdkit.defaults.level import LEVEL_DEFAULT
 from gmdkit.mappings import lvl_prop
 
 
+INDEX_KEYS = frozenset({lvl_prop.ID, lvl_prop.NAME, lvl_prop.CREATOR, lvl_prop.ATTEMPTS})
+
+
 class Level(FilePathMixin,DictDefaultsMixin,PlistLoaderMixin,DictClass[str,Any]):
     
-    DECODER = staticmethod(dict_cast(from_node_dict(LEVEL_DECODERS),default=read_plist))
-    ENCODER = staticmethod(dict_cast(to_node_dict(LEVEL_ENCODERS),default=write_plist))
+    DECODER = CompiledDecoder(from_node_dict(LEVEL_DECODERS),default=read_plist)
+    ENCODER = CompiledEncoder(to_node_dict(LEVEL_ENCODERS),default=write_plist)
     TYPES = LEVEL_TYPES
     ENCODER_KEY = 4
     EXTENSION = "gmd"
@@ -32,41 +38,34 @@ class Level(FilePathMixin,DictDefaultsMixin,PlistLoaderMixin,DictClass[str,Any])
             return str(data[lvl_prop.ID])
         return name   
     
-    @property
-    def start(self) -> Object:
+    def _object_string(self) -> ObjectString:
         objstr = self.setdefault(lvl_prop.OBJECT_STRING, ObjectString())
-                
-        if not hasattr(objstr, "start"):
+        
+        if isinstance(objstr, RawNode):
+            # left undecoded by a key projection, decoded on first access
+            _, objstr = objstr.decode(type(self).DECODER, lvl_prop.OBJECT_STRING)
+            self[lvl_prop.OBJECT_STRING] = objstr
+        
+        if not hasattr(objstr, "objects"):
             objstr.load()
-
-        return getattr(objstr, "start")
+        
+        return objstr
+    
+    @property
+    def start(self) -> Object:
+        return self._object_string().start
     
     @start.setter
     def start(self, value: Object):
-        objstr = self.setdefault(lvl_prop.OBJECT_STRING, ObjectString())
-        
-        if not hasattr(objstr, "start"):
-            objstr.load()
-            
-        setattr(objstr, "start", value)
+        self._object_string().start = value
         
     @property
     def objects(self) -> ObjectList:
-        objstr = self.setdefault(lvl_prop.OBJECT_STRING, ObjectString())
-        
-        if not hasattr(objstr, "objects"):
-            objstr.load()
-
-        return getattr(objstr, "objects")
+        return self._object_string().objects
     
     @objects.setter
     def objects(self, value: ObjectList):
-        objstr = self.setdefault(lvl_prop.OBJECT_STRING, ObjectString())
-        
-        if not hasattr(objstr, "objects"):
-            objstr.load()
-            
-        setattr(objstr, "objects", value)
+        self._object_string().objects = value
         
     @classmethod
     def default(cls, name:str, **kwargs):
@@ -75,6 +74,277 @@ class Level(FilePathMixin,DictDefaultsMixin,PlistLoaderMixin,DictClass[str,Any])
         new[lvl_prop.NAME] = name
                 
         return new
+    
+    
+    @classmethod
+    def from_node(cls, node:ET.Element, index:bool=False, **kwargs):
+        
+        if index:
+            return LazyLevel.from_index(node)
+        
+        return super().from_node(node, **kwargs)
+
+
+class LazyLevel(Level):
+    """
+    A level indexed from a plist node or a span of plist text, 
+    which only decodes a few header keys until first use.
+    
+    Reading an indexed key is instant, any other access decodes the full level.
+    Levels that were never decoded are saved as their original node or text.
+    """
+    
+    _node: Optional[ET.Element] = None
+    _span: Optional[tuple[str,int,int]] = None
+    _indexed: frozenset = frozenset()
+    
+    @classmethod
+    def from_index(cls, node:ET.Element, keys:frozenset=INDEX_KEYS) -> Self:
+        
+        if isinstance(node, StreamNode):
+            node = node.finish()
+        
+        new = cls()
+        decoder = cls.DECODER
+        remaining = set(keys)
+        
+        try:
+            for key_el, value in iter_dict_node(node, encoder_key=cls.ENCODER_KEY):
+                key = key_el.text
+                
+                if key in remaining:
+                    dict.__setitem__(new, *decoder(key, value))
+                    remaining.discard(key)
+                    
+                    if not remaining:
+                        break
+        except Exception as e:
+            raise RuntimeError(f"[{cls.__name__}] failed to index node") from e
+        
+        new._node = node
+        new._indexed = keys
+        
+        return new
+    
+    
+    @classmethod
+    def from_span(
+            cls, 
+            string:str, 
+            start:int, 
+            end:int, 
+            values:Optional[dict[str,tuple[int,int]]]=None,
+            keys:frozenset=INDEX_KEYS
+            ) -> Self:
+        """
+        Indexes the level element spanning string[start:end].
+        
+        values maps keys to the spans of their values, as found by scan_dict_items,
+        if not given the spans of the indexed keys are looked up.
+        """
+        if values is None:
+            values = {
+                key: (value_start, value_end)
+                for key, value_start, value_end in iter_dict_spans(string, start)
+                if key in keys
+                }
+        
+        new = cls()
+        decoder = cls.DECODER
+        
+        try:
+            for key, (value_start, value_end) in values.items():
+                if key in keys:
+                    dict.__setitem__(new, *decoder(key, ET.fromstring(string[value_start:value_end])))
+        except Exception as e:
+            raise RuntimeError(f"[{cls.__name__}] failed to index span") from e
+        
+        new._span = (string, start, end)
+        new._indexed = keys
+        
+        return new
+    
+    
+    def is_indexed(self) -> bool:
+        return self._node is not None or self._span is not None
+    
+    
+    def _source_node(self) -> ET.Element:
+        
+        if self._node is not None:
+            return self._node
+        
+        string, start, end = self._span
+        
+        return ET.fromstring(string[start:end])
+    
+    
+    def _load(self):
+        
+        if not self.is_indexed():
+            return
+        
+        level = Level.from_node(self._source_node())
+        
+        self._node = self._span = None
+        dict.clear(self)
+        dict.update(self, level)
+    
+    
+    def _require(self, key:Any):
+        if self.is_indexed() and key not in self._indexed:
+            self._load()
+    
+    
+    def __getitem__(self, key:Any) -> Any:
+        self._require(key)
+        return super().__getitem__(key)
+    
+    
+    def get(self, key:Any, default:Any=None) -> Any:
+        self._require(key)
+        return super().get(key, default)
+    
+    
+    def __contains__(self, key:Any) -> bool:
+        self._require(key)
+        return super().__contains__(key)
+    
+    
+    def __iter__(self):
+        self._load()
+        return super().__iter__()
+    
+    
+    def __len__(self) -> int:
+        self._load()
+        return super().__len__()
+    
+    
+    def keys(self):
+        self._load()
+        return super().keys()
+    
+    
+    def values(self):
+        self._load()
+        return super().values()
+    
+    
+    def items(self):
+        self._load()
+        return super().items()
+    
+    
+    def __eq__(self, other):
+        self._load()
+        if isinstance(other, LazyLevel):
+            other._load()
+        return super().__eq__(other)
+    
+    
+    def __ne__(self, other):
+        result = self.__eq__(other)
+        return result if result is NotImplemented else not result
+    
+    
+    def __repr__(self):
+        self._load()
+        return super().__repr__()
+    
+    
+    def __reduce_ex__(self, protocol):
+        self._load()
+        return super().__reduce_ex__(protocol)
+    
+    
+    def __setitem__(self, key:Any, value:Any):
+        self._load()
+        super().__setitem__(key, value)
+    
+    
+    def __delitem__(self, key:Any):
+        self._load()
+        super().__delitem__(key)
+    
+    
+    def pop(self, *args) -> Any:
+        self._load()
+        return super().pop(*args)
+    
+    
+    def popitem(self) -> tuple[str, Any]:
+        self._load()
+        return super().popitem()
+    
+    
+    def clear(self):
+        self._node = self._span = None
+        super().clear()
+    
+    
+    def update(self, *args, **kwargs):
+        self._load()
+        super().update(*args, **kwargs)
+    
+    
+    def __ior__(self, other):
+        self._load()
+        return super().__ior__(other)
+    
+    
+    def load(self, *args, **kwargs):
+        self._load()
+        super().load(*args, **kwargs)
+    
+    
+    def save(self, *args, **kwargs):
+        # an indexed level has no loaded content to save
+        if not self.is_indexed():
+            super().save(*args, **kwargs)
+    
+    
+    def save_data(self, encoder:Optional=None, container:Optional[int]=None, **kwargs):
+        
+        if self.is_indexed() and encoder is None and container is None:
+            return self._source_node()
+        
+        self._load()
+        return super().save_data(encoder=encoder, container=container, **kwargs)
+    
+    
+    def write_data(
+            self,
+            write:Callable[[str],Any],
+            tag:str="d",
+            encoder:Optional=None,
+            container:Optional[int]=None,
+            **kwargs
+            ):
+        
+        if not self.is_indexed() or encoder is not None or container is not None:
+            self._load()
+            return super().write_data(write, tag=tag, encoder=encoder, container=container, **kwargs)
+        
+        if self._span is not None:
+            string, start, end = self._span
+            
+            if string.startswith(f"<{tag}", start) and string[start+len(tag)+1] in "> /":
+                write(string[start:end])
+                return
+        
+        node = self._source_node()
+        
+        if not len(node):
+            write(f"<{tag} />")
+            return
+        
+        write(f"<{tag}>")
+        
+        for child in node:
+            write_plist_node(child, write)
+        
+        write(f"</{tag}>")
    
     
 class LevelList(FolderLoaderMixin,FilePathMixin,PlistLoaderMixin,ListClass[Level]):
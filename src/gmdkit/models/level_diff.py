@@ -0,0 +1,467 @@
+# Imports
+from typing import Any, Optional, Self
+from collections.abc import Mapping
+from copy import deepcopy
+from hashlib import blake2b
+import json
+import xml.etree.ElementTree as ET
+
+# Package Imports
+from gmdkit.mappings import obj_prop, lvl_prop
+from gmdkit.models.object import Object, ObjectList, hash_items
+from gmdkit.models.level import Level
+from gmdkit.serialization.functions import write_plist_node
+
+# property changes by key, as (old value, new value), None if the property is absent
+PropertyChanges = dict[Any,tuple[Any,Any]]
+
+POSITION_KEYS = frozenset((obj_prop.X, obj_prop.Y))
+
+
+def property_changes(old:Mapping, new:Mapping) -> PropertyChanges:
+    """
+    Compares the properties of two objects or levels.
+
+    Properties are read with peek() where available, comparing does not mark objects as modified.
+
+    Returns
+    -------
+    PropertyChanges
+        The (old value, new value) of every differing property, None where a property is absent.
+    """
+    old_peek = getattr(old, "peek", old.get)
+    new_peek = getattr(new, "peek", new.get)
+    changes = {}
+
+    for key in old:
+        old_value = old_peek(key)
+        new_value = new_peek(key)
+        if new_value is None or old_value != new_value:
+            changes[key] = (old_value, new_value)
+
+    for key in new:
+        if key not in old:
+            changes[key] = (None, new_peek(key))
+
+    return changes
+
+
+def apply_changes(target, changes:PropertyChanges):
+    """
+    Applies property changes to an object or level in place, new values are copied.
+    """
+    for key, (_, value) in changes.items():
+        if value is None:
+            target.pop(key, None)
+        else:
+            target[key] = deepcopy(value)
+
+
+def object_digest(obj:Mapping) -> str:
+    """
+    Returns a digest of an object's encoded properties, independent of their order.
+
+    Unlike canonical_hash(), the digest does not depend on the process, 
+    so it can be stored and compared in another process. Properties are read with peek().
+    """
+    it = iter(Object.ENCODER.encode_items([(key, obj.peek(key)) for key in obj]))
+    string = ",".join(f"{key},{value}" for key, value in sorted(zip(it, it)))
+    
+    return blake2b(string.encode(), digest_size=16).hexdigest()
+
+
+def _changes_to_strings(changes:PropertyChanges) -> tuple[str,str]:
+    # old and new values are stored as objects holding only the changed properties
+    old = Object({key: value for key, (value, _) in changes.items() if value is not None})
+    new = Object({key: value for key, (_, value) in changes.items() if value is not None})
+    
+    return old.to_string(), new.to_string()
+
+
+def _changes_from_strings(old:str, new:str) -> PropertyChanges:
+    old = Object.from_string(old)
+    new = Object.from_string(new)
+    
+    return {key: (old.peek(key), new.peek(key)) for key in dict.fromkeys([*old, *new])}
+
+
+def _level_value_to_string(key:str, value:Any) -> Optional[str]:
+    if value is None:
+        return None
+    
+    _, node = Level.ENCODER(key, value)
+    
+    if node is None:
+        return None
+    
+    parts = []
+    write_plist_node(node, parts.append)
+    
+    return "".join(parts)
+
+
+def _level_value_from_string(key:str, string:Optional[str]) -> Any:
+    if string is None:
+        return None
+    
+    return Level.DECODER(key, ET.fromstring(string))[1]
+
+
+def _moved_hash(obj:Object) -> int:
+    # hashes every property but the position, matching objects that were only moved
+    return hash_items((key, obj.peek(key)) for key in obj if key not in POSITION_KEYS)
+
+
+class ObjectDiff:
+    """
+    The differences between two object lists, as removed, changed and added objects.
+
+    Objects are first paired with an equal object, then unpaired objects are paired
+    by object ID and position, then by every property but the position.
+    Remaining objects are removed or added. Each step is a hash lookup,
+    a diff takes linear time in the number of objects.
+
+    The diff does not record list order, apply() keeps the order of the old objects
+    and appends the added objects. Removed and changed objects are checked 
+    against a digest of the old object, so a diff can be saved with to_string() 
+    and applied in another process.
+    """
+
+    def __init__(
+            self,
+            length:int=0,
+            removed:Optional[dict[int,int]]=None,
+            changed:Optional[dict[int,PropertyChanges]]=None,
+            added:Optional[ObjectList]=None,
+            digests:Optional[dict[int,str]]=None
+            ):
+        """
+        Creates an object diff, use from_objects() to compare two object lists.
+
+        Parameters
+        ----------
+        length : int, optional
+            The number of old objects.
+        removed : dict[int,str], optional
+            The removed objects, as old index to old object digest.
+        changed : dict[int,PropertyChanges], optional
+            The property changes of changed objects, by old index.
+        added : ObjectList, optional
+            The added objects.
+        digests : dict[int,str], optional
+            The digests of the changed objects before the changes, by old index.
+        """
+        self.length = length
+        self.removed = removed or {}
+        self.changed = changed or {}
+        self.added = added if added is not None else ObjectList()
+        self.digests = digests or {}
+
+
+    @classmethod
+    def from_objects(cls, old:ObjectList, new:ObjectList) -> Self:
+        """
+        Compares two object lists.
+
+        Parameters
+        ----------
+        old : ObjectList
+            The objects before the changes.
+        new : ObjectList
+            The objects after the changes.
+
+        Returns
+        -------
+        ObjectDiff
+            The changes turning the old objects into the new objects.
+        """
+        get = list.__getitem__
+        unpaired = {}
+
+        # candidates are stored last first, so that pairing in list order pops from the end
+        for i in range(len(old) - 1, -1, -1):
+            unpaired.setdefault(get(old, i).canonical_hash(), []).append(i)
+
+        new_unpaired = []
+
+        for obj in new:
+            candidates = unpaired.get(obj.canonical_hash())
+
+            if candidates:
+                # equal hashes are confirmed by comparing the objects
+                for n in range(len(candidates) - 1, -1, -1):
+                    if get(old, candidates[n]) == obj:
+                        del candidates[n]
+                        break
+                else:
+                    new_unpaired.append(obj)
+            else:
+                new_unpaired.append(obj)
+
+        old_unpaired = sorted(i for indices in unpaired.values() for i in indices)
+
+        changed = {}
+        digests = {}
+
+        for key in (
+                lambda obj: (obj.peek(obj_prop.ID), obj.peek(obj_prop.X), obj.peek(obj_prop.Y)),
+                _moved_hash
+                ):
+            if not old_unpaired or not new_unpaired:
+                break
+
+            by_key = {}
+            for i in reversed(old_unpaired):
+                by_key.setdefault(key(get(old, i)), []).append(i)
+
+            remaining = []
+
+            for obj in new_unpaired:
+                candidates = by_key.get(key(obj))
+
+                if not candidates:
+                    remaining.append(obj)
+                    continue
+
+                # objects sharing a key are paired in list order
+                i = candidates.pop()
+                changed[i] = property_changes(get(old, i), obj)
+                digests[i] = object_digest(get(old, i))
+
+            paired = changed.keys()
+            old_unpaired = [i for i in old_unpaired if i not in paired]
+            new_unpaired = remaining
+
+        removed = {i: object_digest(get(old, i)) for i in old_unpaired}
+
+        return cls(len(old), removed, changed, ObjectList(new_unpaired), digests)
+
+
+    @classmethod
+    def from_dict(cls, data:dict) -> Self:
+        """
+        Creates an object diff from the output of to_dict().
+        """
+        return cls(
+            data["length"],
+            {i: digest for i, digest in data["removed"]},
+            {i: _changes_from_strings(old, new) for i, _, old, new in data["changed"]},
+            ObjectList.from_string(data["added"]),
+            {i: digest for i, digest, _, _ in data["changed"]}
+            )
+
+
+    def to_dict(self) -> dict:
+        """
+        Returns the diff as a dictionary of JSON compatible values.
+
+        Property values are stored as object strings and added objects as an object list string.
+        """
+        return {
+            "length": self.length,
+            "removed": [[i, digest] for i, digest in self.removed.items()],
+            "changed": [
+                [i, self.digests[i], *_changes_to_strings(changes)] 
+                for i, changes in self.changed.items()
+                ],
+            "added": self.added.to_string(),
+            }
+
+
+    @classmethod
+    def from_string(cls, string:str) -> Self:
+        """
+        Creates an object diff from a JSON string returned by to_string().
+        """
+        return cls.from_dict(json.loads(string))
+
+
+    def to_string(self) -> str:
+        """
+        Returns the diff as a JSON string.
+        """
+        return json.dumps(self.to_dict())
+
+
+    def __bool__(self) -> bool:
+        return bool(self.removed or self.changed or self.added)
+
+
+    def __repr__(self) -> str:
+        return (
+            f"{type(self).__name__}(removed={len(self.removed)}, "
+            f"changed={len(self.changed)}, added={len(self.added)})"
+            )
+
+
+    def apply(self, objects:ObjectList) -> ObjectList:
+        """
+        Applies the diff to a list equal to the old objects.
+
+        Unchanged objects are kept as they are, changed objects are copied before the changes.
+
+        Parameters
+        ----------
+        objects : ObjectList
+            The objects to patch, equal to and in the order of the old objects.
+
+        Raises
+        ------
+        ValueError
+            If the objects do not match the old objects.
+
+        Returns
+        -------
+        ObjectList
+            The patched objects.
+        """
+        if len(objects) != self.length:
+            raise ValueError(f"[{type(self).__name__}] expected {self.length} objects, got {len(objects)}")
+
+        get = list.__getitem__
+
+        for expected in (self.removed, self.digests):
+            for i, value in expected.items():
+                if object_digest(get(objects, i)) != value:
+                    raise ValueError(f"[{type(self).__name__}] object {i} does not match the old object")
+
+        removed = self.removed
+        changed = self.changed
+        result = []
+
+        for i, obj in enumerate(objects):
+            if i in removed:
+                continue
+
+            changes = changed.get(i)
+
+            if changes is not None:
+                obj = obj.copy()
+                apply_changes(obj, changes)
+
+            result.append(obj)
+
+        result.extend(deepcopy(obj) for obj in self.added)
+
+        return ObjectList(result)
+
+
+class LevelDiff:
+    """
+    The differences between two levels, as level property changes,
+    start object changes and an object diff.
+    """
+
+    def __init__(
+            self,
+            properties:Optional[PropertyChanges]=None,
+            start:Optional[PropertyChanges]=None,
+            objects:Optional[ObjectDiff]=None
+            ):
+        self.properties = properties or {}
+        self.start = start or {}
+        self.objects = objects if objects is not None else ObjectDiff()
+
+
+    @classmethod
+    def from_levels(cls, old:Level, new:Level) -> Self:
+        """
+        Compares two levels.
+
+        Parameters
+        ----------
+        old : Level
+            The level before the changes.
+        new : Level
+            The level after the changes.
+
+        Returns
+        -------
+        LevelDiff
+            The changes turning the old level into the new level.
+        """
+        # the object string is compared through its objects
+        skip = lvl_prop.OBJECT_STRING
+        properties = property_changes(
+            {key: value for key, value in old.items() if key != skip},
+            {key: value for key, value in new.items() if key != skip}
+            )
+
+        return cls(
+            properties,
+            property_changes(old.start, new.start),
+            ObjectDiff.from_objects(old.objects, new.objects)
+            )
+
+
+    @classmethod
+    def from_dict(cls, data:dict) -> Self:
+        """
+        Creates a level diff from the output of to_dict().
+        """
+        return cls(
+            {
+                key: (_level_value_from_string(key, old), _level_value_from_string(key, new))
+                for key, old, new in data["properties"]
+                },
+            _changes_from_strings(*data["start"]),
+            ObjectDiff.from_dict(data["objects"])
+            )
+
+
+    def to_dict(self) -> dict:
+        """
+        Returns the diff as a dictionary of JSON compatible values.
+
+        Level property values are stored as plist text, start object values as object strings.
+        """
+        return {
+            "properties": [
+                [key, _level_value_to_string(key, old), _level_value_to_string(key, new)] 
+                for key, (old, new) in self.properties.items()
+                ],
+            "start": _changes_to_strings(self.start),
+            "objects": self.objects.to_dict(),
+            }
+
+
+    @classmethod
+    def from_string(cls, string:str) -> Self:
+        """
+        Creates a level diff from a JSON string returned by to_string().
+        """
+        return cls.from_dict(json.loads(string))
+
+
+    def to_string(self) -> str:
+        """
+        Returns the diff as a JSON string.
+        """
+        return json.dumps(self.to_dict())
+
+
+    def __bool__(self) -> bool:
+        return bool(self.properties or self.start or self.objects)
+
+
+    def __repr__(self) -> str:
+        return (
+            f"{type(self).__name__}(properties={len(self.properties)}, "
+            f"start={len(self.start)}, objects={self.objects!r})"
+            )
+
+
+    def apply(self, level:Level):
+        """
+        Applies the diff to a level equal to the old level, in place.
+
+        Raises
+        ------
+        ValueError
+            If the level objects do not match the old objects.
+        """
+        # objects are checked first, a mismatching level is left unchanged
+        objects = self.objects.apply(level.objects)
+        apply_changes(level, self.properties)
+        apply_changes(level.start, self.start)
+        level.objects = objects
@@ -0,0 +1,390 @@
+# Imports
+from typing import Optional, Iterable, Callable
+
+# Package Imports
+from gmdkit.mappings import obj_prop, obj_id
+from gmdkit.models.object import Object, ObjectList
+from gmdkit.functions.object import get_keyframe_id
+from gmdkit.functions.object_list import (
+    compile_keyframe_ids,
+    compile_keyframe_groups,
+    compile_spawn_groups
+    )
+
+ObjectListMapping = dict[Optional[int],ObjectList]
+ObjectMapping = dict[int,Object]
+
+# properties read by the index, objects must be updated when one of them changes
+INDEXED_PROPERTIES = (
+    obj_prop.ID,
+    obj_prop.GROUPS,
+    obj_prop.PARENT_GROUPS,
+    obj_prop.LINKED_GROUP,
+    obj_prop.GROUP_PARENT,
+    obj_prop.AREA_PARENT,
+    obj_prop.trigger.SPAWN_TRIGGER,
+    )
+
+
+def _record(obj:Object) -> tuple:
+    # Object.peek is dict.get, binding it directly saves a call per property
+    peek = dict.get.__get__(obj) if type(obj).peek is Object.peek else obj.peek
+    return (
+        peek(obj_prop.ID),
+        tuple(dict.fromkeys(peek(obj_prop.GROUPS) or ())),
+        tuple(dict.fromkeys(peek(obj_prop.PARENT_GROUPS) or ())),
+        peek(obj_prop.LINKED_GROUP),
+        peek(obj_prop.GROUP_PARENT) is not None,
+        peek(obj_prop.AREA_PARENT) is not None,
+        bool(peek(obj_prop.trigger.SPAWN_TRIGGER)),
+        )
+
+
+def _priority(obj:Object) -> tuple[float,float]:
+    return (obj.peek(obj_prop.X, 0), obj.peek(obj_prop.Y, 0))
+
+
+class LevelIndex:
+    """
+    An index of an object list by group, parent group, linked group and object ID,
+    giving the same mappings as the compile functions of functions.object_list.
+
+    The index is built in one pass and updated per object,
+    add(), discard() and update() must be called when objects are added, removed
+    or have one of the INDEXED_PROPERTIES changed, including in place changes to group lists.
+    refresh() re-synchronizes the index with its object list.
+
+    Objects are kept in the order they were indexed,
+    an object updated into a new group is placed last in that group.
+    Unlike compile_groups, an object listing a group twice appears once in it.
+    Properties are read with peek(), indexing does not mark objects as modified.
+    """
+
+    def __init__(self, objects:Iterable[Object]):
+        """
+        Builds an index of a list of objects.
+
+        Parameters
+        ----------
+        objects : Iterable[Object]
+            The objects to index. refresh() synchronizes the index with this list.
+        """
+        self.objects = objects if isinstance(objects, ObjectList) else ObjectList(objects)
+        self._records = {}
+        self._objects = {}
+        self._groups = {None: {}}
+        self._parent_groups = {}
+        self._links = {}
+        self._ids = {}
+        self._group_parents = {}
+        self._area_parents = {}
+        self._spawn_triggers = {}
+
+        self.add(*self.objects)
+
+
+    def __len__(self) -> int:
+        return len(self._objects)
+
+
+    def __contains__(self, obj:Object) -> bool:
+        return id(obj) in self._objects
+
+
+    def _insert(self, key:int, obj:Object, record:tuple, previous:tuple=None):
+
+        object_id, groups, parents, link, group_parent, area_parent, spawn = record
+
+        if previous is None:
+            # new objects skip the comparisons with a previous record
+            self._ids.setdefault(object_id, {})[key] = obj
+
+            if groups:
+                for gid in groups:
+                    self._groups.setdefault(gid, {})[key] = obj
+            else:
+                self._groups[None][key] = obj
+
+            for gid in parents:
+                self._parent_groups.setdefault(gid, {})[key] = obj
+
+            if link:
+                self._links.setdefault(link, {})[key] = obj
+
+            if group_parent:
+                self._group_parents[key] = obj
+
+            if area_parent:
+                self._area_parents[key] = obj
+
+            if spawn:
+                self._spawn_triggers[key] = obj
+
+            return
+
+        old = previous
+
+        if object_id != old[0]:
+            self._ids.setdefault(object_id, {})[key] = obj
+
+        for gid in groups:
+            if gid not in old[1]:
+                self._groups.setdefault(gid, {})[key] = obj
+
+        if not groups and old[1]:
+            self._groups[None][key] = obj
+
+        for gid in parents:
+            if gid not in old[2]:
+                self._parent_groups.setdefault(gid, {})[key] = obj
+
+        if link and link != old[3]:
+            self._links.setdefault(link, {})[key] = obj
+
+        for flag, old_flag, mapping in (
+                (group_parent, old[4], self._group_parents),
+                (area_parent, old[5], self._area_parents),
+                (spawn, old[6], self._spawn_triggers)
+                ):
+            if flag and not old_flag:
+                mapping[key] = obj
+
+
+    def _remove(self, key:int, record:tuple, current:tuple=None):
+
+        object_id, groups, parents, link, group_parent, area_parent, spawn = record
+        new = current or (None, (), (), None, False, False, False)
+
+        def pop(mapping:dict, value):
+            members = mapping[value]
+            del members[key]
+            # objects without groups are always keyed by None
+            if not members and not (value is None and mapping is self._groups):
+                del mapping[value]
+
+        if object_id != new[0] or current is None:
+            pop(self._ids, object_id)
+
+        for gid in groups:
+            if gid not in new[1]:
+                pop(self._groups, gid)
+
+        if not groups and (new[1] or current is None):
+            pop(self._groups, None)
+
+        for gid in parents:
+            if gid not in new[2]:
+                pop(self._parent_groups, gid)
+
+        if link and link != new[3]:
+            pop(self._links, link)
+
+        for flag, new_flag, mapping in (
+                (group_parent, new[4], self._group_parents),
+                (area_parent, new[5], self._area_parents),
+                (spawn, new[6], self._spawn_triggers)
+                ):
+            if flag and not new_flag:
+                del mapping[key]
+
+
+    def add(self, *objects:Object):
+        """
+        Indexes new objects, objects that are already indexed are updated instead.
+        """
+        for obj in objects:
+            key = id(obj)
+
+            if key in self._objects:
+                self.update(obj)
+                continue
+
+            record = _record(obj)
+            self._objects[key] = obj
+            self._records[key] = record
+            self._insert(key, obj, record)
+
+
+    def discard(self, *objects:Object):
+        """
+        Removes objects from the index, objects that are not indexed are ignored.
+        """
+        for obj in objects:
+            key = id(obj)
+
+            if key not in self._objects:
+                continue
+
+            self._remove(key, self._records.pop(key))
+            del self._objects[key]
+
+
+    def update(self, *objects:Object) -> int:
+        """
+        Re-reads the indexed properties of objects, only applying the differences.
+
+        Raises
+        ------
+        ValueError
+            If an object is not indexed.
+
+        Returns
+        -------
+        int
+            The number of objects whose indexed properties changed.
+        """
+        changed = 0
+
+        for obj in objects:
+            key = id(obj)
+
+            if key not in self._objects:
+                raise ValueError(f"[{type(self).__name__}] object is not indexed")
+
+            old = self._records[key]
+            new = _record(obj)
+
+            if old == new:
+                continue
+
+            self._remove(key, old, new)
+            self._insert(key, obj, new, old)
+            self._records[key] = new
+            changed += 1
+
+        return changed
+
+
+    def refresh(self) -> int:
+        """
+        Synchronizes the index with its object list,
+        indexing new objects, removing missing ones and updating changed ones.
+
+        Returns
+        -------
+        int
+            The number of objects that were added, removed or changed.
+        """
+        current = {id(obj): obj for obj in self.objects}
+        removed = [obj for key, obj in self._objects.items() if key not in current]
+        added = [obj for key, obj in current.items() if key not in self._objects]
+
+        self.discard(*removed)
+        changed = self.update(*(obj for key, obj in current.items() if key in self._objects))
+        self.add(*added)
+
+        return len(removed) + len(added) + changed
+
+
+    def group(self, gid:Optional[int]) -> ObjectList:
+        """
+        Returns the objects of a group, or the objects without groups if gid is None.
+        """
+        return ObjectList(self._groups.get(gid, {}).values())
+
+
+    def ids(self, object_id:int) -> ObjectList:
+        """
+        Returns the objects with an object ID.
+        """
+        return ObjectList(self._ids.get(object_id, {}).values())
+
+
+    def groups(self) -> ObjectListMapping:
+        """
+        Returns the objects by group ID, same as compile_groups.
+        """
+        return {gid: ObjectList(members.values()) for gid, members in self._groups.items()}
+
+
+    def _parent(self, members:dict, flagged:dict) -> Optional[Object]:
+        # parent candidates are few, the smaller mapping is iterated
+        if len(flagged) < len(members):
+            candidates = [obj for key, obj in flagged.items() if key in members]
+        else:
+            candidates = [obj for key, obj in members.items() if key in flagged]
+
+        return min(candidates, key=_priority) if candidates else None
+
+
+    def parents(self) -> tuple[ObjectListMapping,ObjectMapping,ObjectMapping,ObjectMapping]:
+        """
+        Returns the objects by group ID and the group's parents, same as compile_parents.
+        """
+        groups = self.groups()
+        gid_parents = {gid: next(iter(members.values())) for gid, members in self._parent_groups.items()}
+        group_parents = {}
+        area_parents = {}
+
+        for gid, parent in gid_parents.items():
+
+            if parent.peek(obj_prop.GROUP_PARENT):
+                group_parents[gid] = parent
+
+            if parent.peek(obj_prop.AREA_PARENT):
+                area_parents[gid] = parent
+
+        for gid in groups:
+
+            if gid not in gid_parents:
+                continue
+
+            gp = group_parents.get(gid)
+            ap = area_parents.get(gid)
+
+            if gp is None:
+                gp = self._parent(self._groups[gid], self._group_parents)
+                if gp is not None: group_parents[gid] = gp
+
+            if ap is None:
+                ap = self._parent(self._groups[gid], self._area_parents)
+                if ap is not None: area_parents[gid] = ap
+
+            if gp is None and ap is not None:
+                group_parents[gid] = ap
+
+            elif ap is None and gp is not None:
+                area_parents[gid] = gp
+
+        return groups, gid_parents, group_parents, area_parents
+
+
+    def links(self) -> tuple[ObjectListMapping,ObjectMapping,ObjectMapping]:
+        """
+        Returns the objects by linked group ID and the link's parents, same as compile_links.
+        """
+        links = {}
+        group_parents = {}
+        area_parents = {}
+
+        for link_id, members in self._links.items():
+            links[link_id] = ObjectList(members.values())
+
+            if (gp := self._parent(members, self._group_parents)) is not None:
+                group_parents[link_id] = gp
+
+            if (ap := self._parent(members, self._area_parents)) is not None:
+                area_parents[link_id] = ap
+
+        return links, group_parents, area_parents
+
+
+    def keyframe_ids(self) -> ObjectListMapping:
+        """
+        Returns keyframe objects by keyframe ID, same as compile_keyframe_ids.
+        """
+        return compile_keyframe_ids(self.ids(obj_id.trigger.KEYFRAME))
+
+
+    def keyframe_groups(self, function:Callable=get_keyframe_id) -> dict[int|None,list]:
+        """
+        Returns keyframe IDs by the groups that reference them, same as compile_keyframe_groups.
+        """
+        return compile_keyframe_groups(self.ids(obj_id.trigger.KEYFRAME), function=function)
+
+
+    def spawn_groups(self) -> ObjectListMapping:
+        """
+        Returns spawn triggers by group ID, same as compile_spawn_groups.
+        """
+        return compile_spawn_groups(ObjectList(self._spawn_triggers.values()))
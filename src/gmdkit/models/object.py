@@ -1,5 +1,10 @@
 # Imports
-from typing import Self, Optional, Any
+from typing import Self, Optional, Any, Iterator, Iterable
+from collections.abc import Mapping, MutableMapping, Hashable
+from dataclasses import is_dataclass, fields
+from operator import methodcaller
+from enum import Enum
+from copy import deepcopy
 
 # Package Imports
 from gmdkit.utils.types import ListClass, DictClass
@@ -13,19 +18,82 @@ from gmdkit.serialization.mixins import (
     PlistLoaderMixin,
     DictDefaultsMixin
     )
-from gmdkit.serialization.type_cast import serialize, to_numkey
-from gmdkit.serialization.functions import dict_cast, write_plist, kv_wrap
+from gmdkit.serialization.type_cast import serialize, to_numkey, numkey_cache, CompiledDecoder, CompiledEncoder
+from gmdkit.serialization.functions import write_plist, kv_wrap, iter_split
 from gmdkit.casting.object_props import PROPERTY_DECODERS, PROPERTY_ENCODERS, PROPERTY_TYPES
 from gmdkit.defaults.objects import OBJECT_DEFAULT
 
 
+IMMUTABLE_TYPES = (int, float, str, Enum)
+
+
+# dataclass field names by type, fields() is too slow to call per value
+FIELD_NAMES: dict[type,tuple[str,...]] = {}
+
+
+def _freeze_items(items:tuple) -> tuple:
+    # most lists only hold numbers and are returned as they are
+    for item in items:
+        if not isinstance(item, IMMUTABLE_TYPES):
+            return tuple(map(freeze, items))
+    return items
+
+
+def freeze(value:Any) -> Hashable:
+    """
+    Returns a hashable form of a property value, equal for equal values.
+    """
+    if value is None or isinstance(value, IMMUTABLE_TYPES):
+        return value
+    
+    if isinstance(value, (list, tuple)):
+        return _freeze_items(tuple(value))
+    
+    if isinstance(value, Mapping):
+        return frozenset((key, freeze(item)) for key, item in value.items())
+    
+    if is_dataclass(value):
+        cls = type(value)
+        names = FIELD_NAMES.get(cls)
+        if names is None:
+            names = FIELD_NAMES[cls] = tuple(field.name for field in fields(value))
+        return (cls, _freeze_items(tuple([getattr(value, name) for name in names])))
+    
+    try:
+        hash(value)
+    except TypeError:
+        return (type(value), repr(value))
+    
+    return value
+
+
+def hash_items(items:Iterable[tuple[NumKey,Any]]) -> int:
+    """
+    Returns a hash of property items that does not depend on their order.
+    """
+    immutable = IMMUTABLE_TYPES
+    return hash(frozenset([
+        (key, value if isinstance(value, immutable) else freeze(value)) 
+        for key, value in items
+        ]))
+
+
 class Object(DelimiterMixin,DictDefaultsMixin,DictDecoderMixin,DictClass[NumKey,Any]):
+    """
+    A level object, mapping property IDs to property values.
+    
+    Objects remember the string they were loaded or last serialized from,
+    and reuse it on serialization while they are not modified.
+    """
+    
+    # the cached string and hash are unset for new objects, read them with getattr
+    __slots__ = ("_string", "_hash")
     
     SEPARATOR = ","
     END_DELIMITER = ";"
     TYPES = PROPERTY_TYPES
-    DECODER = staticmethod(dict_cast(PROPERTY_DECODERS,key_start=to_numkey))
-    ENCODER = staticmethod(dict_cast(PROPERTY_ENCODERS,key_end=str,default=serialize))
+    DECODER = CompiledDecoder(PROPERTY_DECODERS,key_start=to_numkey,default=str,tokens=True)
+    ENCODER = CompiledEncoder(PROPERTY_ENCODERS,key_end=str,default=serialize)
     
     @classmethod
     def default(cls, object_id:int) -> Self:
@@ -35,23 +103,862 @@ class Object(DelimiterMixin,DictDefaultsMixin,DictDecoderMixin,DictClass[NumKey,
         return cls.from_string(string)
     
     
+    @classmethod
+    def from_tokens(cls, tokens:list[str], decoder=None, container=None) -> Self:
+        
+        if container is not None:
+            return super().from_tokens(tokens, decoder=decoder, container=container)
+        
+        decoder = cls.DECODER if decoder is None else decoder
+        
+        length = len(tokens)
+        if length % 2 != 0:
+            raise ValueError(
+                f"[{cls.__name__}] expected an even number of key-value tokens, got {length}"
+                )
+        
+        result = cls()
+        decode_tokens = getattr(decoder, "decode_tokens", None)
+        
+        if decode_tokens is None:
+            it = iter(tokens)
+            pairs = map(decoder, it, it)
+        else:
+            pairs = decode_tokens(tokens)
+        
+        # bypasses __setitem__, a freshly decoded object has nothing to invalidate
+        try:
+            dict.update(result, pairs)
+        except Exception as e:
+            raise ValueError(f"[{cls.__name__}] failed to decode") from e
+        
+        return result
+    
+    
+    def to_tokens(self, encoder=None, condition=None, container=None, sort_keys:bool=False) -> list[str]:
+        
+        cls = type(self)
+        encode_items = getattr(cls.ENCODER, "encode_items", None)
+        
+        if encoder is not None or condition is not None or container is not None or sort_keys or encode_items is None:
+            return super().to_tokens(
+                encoder=encoder, condition=condition, container=container, sort_keys=sort_keys
+                )
+        
+        try:
+            return encode_items(dict.items(self))
+        except Exception as e:
+            raise ValueError(f"[{cls.__name__}] failed to encode") from e
+    
+    
+    @classmethod
+    def from_string(cls, string:str, **kwargs) -> Self:
+        
+        new = super().from_string(string, **kwargs)
+        
+        if not kwargs:
+            new._string = string.removesuffix(cls.END_DELIMITER)
+        
+        return new
+    
+    
+    def to_string(self, **kwargs) -> str:
+        
+        string = getattr(self, "_string", None)
+        
+        if kwargs:
+            # encoding does not modify the object, keep its cached string
+            result = super().to_string(**kwargs)
+            self._string = string
+            return result
+        
+        if string is not None:
+            return string + type(self).END_DELIMITER if string else string
+        
+        result = super().to_string()
+        self._string = result.removesuffix(type(self).END_DELIMITER)
+        
+        return result
+    
+    
+    def canonical_hash(self) -> int:
+        """
+        Returns a hash of the decoded properties, independent of their order.
+        
+        Equal objects have equal hashes. The hash is cached and dropped together with 
+        the cached string, when a property is assigned or a mutable value is accessed.
+        """
+        result = getattr(self, "_hash", None)
+        
+        if result is None:
+            result = self._hash = hash_items(dict.items(self))
+        
+        return result
+    
+    
+    def __getstate__(self):
+        # string hashes differ between processes, the cached hash is not pickled
+        return None, {"_string": getattr(self, "_string", None)}
+    
+    
+    def is_modified(self) -> bool:
+        """
+        Checks whether the object may have been modified since it was last loaded or serialized.
+        
+        Assigning or removing a property marks the object as modified, 
+        as does accessing a mutable value (such as a group list), 
+        since it can then be modified in place. Read-only code should use peek().
+
+        Returns
+        -------
+        bool
+            True if the object must be re-encoded, False if the cached string can be reused.
+        """
+        return getattr(self, "_string", None) is None
+    
+    
+    def _access(self, value:Any) -> Any:
+        if not isinstance(value, IMMUTABLE_TYPES):
+            self._string = self._hash = None
+        return value
+    
+    
+    def _access_all(self):
+        if any(not isinstance(value, IMMUTABLE_TYPES) for value in dict.values(self)):
+            self._string = self._hash = None
+    
+    
+    def __getitem__(self, key:NumKey) -> Any:
+        return self._access(dict.__getitem__(self, key))
+    
+    
+    def get(self, key:NumKey, default:Any=None) -> Any:
+        # inlined, get is the most common property read
+        value = dict.get(self, key, default)
+        if not isinstance(value, IMMUTABLE_TYPES) and (value is not default or key in self):
+            self._string = self._hash = None
+        return value
+    
+    
+    # peek(key, default=None) returns a property value without marking the object as modified,
+    # the returned value must not be modified in place. It is dict.get itself, for read-only helpers
+    peek = dict.get
+    
+    
+    def __iter__(self):
+        # overriding __iter__ makes dict(), ** and | read values through __getitem__,
+        # which marks mutable values as accessed and decodes lazy values
+        return dict.__iter__(self)
+    
+    
+    def values(self):
+        self._access_all()
+        return dict.values(self)
+    
+    
+    def items(self):
+        self._access_all()
+        return dict.items(self)
+    
+    
+    def copy(self) -> Self:
+        new = super().copy()
+        # a shallow copy shares mutable values, neither cache can be trusted then
+        self._access_all()
+        new._string = getattr(self, "_string", None)
+        new._hash = getattr(self, "_hash", None)
+        return new
+    
+    
+    def __setitem__(self, key:NumKey, value:Any):
+        dict.__setitem__(self, key, value)
+        self._string = self._hash = None
+    
+    
+    def __delitem__(self, key:NumKey):
+        dict.__delitem__(self, key)
+        self._string = self._hash = None
+    
+    
+    def pop(self, key:NumKey, *args) -> Any:
+        if key in self:
+            self._string = self._hash = None
+        return dict.pop(self, key, *args)
+    
+    
+    def popitem(self) -> tuple[NumKey, Any]:
+        item = dict.popitem(self)
+        self._string = self._hash = None
+        return item
+    
+    
+    def clear(self):
+        dict.clear(self)
+        self._string = self._hash = None
+    
+    
+    def update(self, *args, **kwargs):
+        dict.update(self, *args, **kwargs)
+        self._string = self._hash = None
+    
+    
+    def __ior__(self, other):
+        self.update(other)
+        return self
+    
+    
+class LazyObject(Object):
+    """
+    An object that keeps its raw token values and only decodes a property on first access.
+    
+    Objects that were not modified are re-emitted as their original string,
+    untouched properties of modified objects are re-emitted as their original tokens.
+    """
+    
+    __slots__ = ("_decoded",)
+    
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        # None: no value decoded yet, True: every value decoded, set: decoded keys
+        self._decoded = True
+        
+    
+    @classmethod
+    def from_string(cls, string:str, **kwargs) -> Self:
+        
+        if kwargs:
+            return cls(Object.from_string(string, **kwargs))
+        
+        string = string.removesuffix(cls.END_DELIMITER)
+        
+        new = cls.__new__(cls)
+        new._decoded = None
+        new._string = string
+        
+        if string:
+            tokens = string.split(cls.SEPARATOR)
+            
+            if len(tokens) % 2 != 0:
+                raise ValueError(
+                    f"[{cls.__name__}] expected an even number of key-value tokens, got {len(tokens)}"
+                    )
+            
+            it = iter(tokens)
+            dict.update(new, zip(map(numkey_cache.__getitem__, it), it))
+        
+        return new
+    
+    
+    def _decode(self, key:NumKey) -> Any:
+        
+        value = dict.__getitem__(self, key)
+        decoded = self._decoded
+        
+        if decoded is True or (decoded is not None and key in decoded):
+            return value
+        
+        func = PROPERTY_DECODERS.get(key)
+        
+        if func is None:
+            return value
+        
+        try:
+            value = func(value)
+        except Exception as e:
+            raise ValueError(f"[{type(self).__name__}] failed to decode key '{key}'") from e
+        
+        dict.__setitem__(self, key, value)
+        
+        if decoded is None:
+            self._decoded = {key}
+        else:
+            decoded.add(key)
+        
+        return value
+    
+    
+    def _decode_all(self):
+        
+        if self._decoded is True:
+            return
+        
+        decode = self._decode
+        
+        for key in dict.keys(self):
+            decode(key)
+        
+        self._decoded = True
+    
+    
+    def canonical_hash(self) -> int:
+        self._decode_all()
+        return super().canonical_hash()
+    
+    
+    def _touch(self, key:NumKey):
+        
+        self._string = self._hash = None
+        decoded = self._decoded
+        
+        if decoded is None:
+            self._decoded = {key}
+        elif decoded is not True:
+            decoded.add(key)
+    
+    
+    def __getitem__(self, key:NumKey) -> Any:
+        return self._access(self._decode(key))
+    
+    
+    def get(self, key:NumKey, default:Any=None) -> Any:
+        return self._access(self._decode(key)) if key in self else default
+    
+    
+    def peek(self, key:NumKey, default:Any=None) -> Any:
+        return self._decode(key) if key in self else default
+    
+    
+    def values(self):
+        self._decode_all()
+        return super().values()
+    
+    
+    def items(self):
+        self._decode_all()
+        return super().items()
+    
+    
+    def __eq__(self, other):
+        self._decode_all()
+        if isinstance(other, LazyObject):
+            other._decode_all()
+        return dict.__eq__(self, other)
+    
+    
+    def __ne__(self, other):
+        result = self.__eq__(other)
+        return result if result is NotImplemented else not result
+    
+    
+    def __repr__(self):
+        self._decode_all()
+        return super().__repr__()
+    
+    
+    def __reduce__(self):
+        return (type(self).from_string, (self.to_string(),))
+    
+    
+    def copy(self) -> Self:
+        if not self.is_modified():
+            return type(self).from_string(self._string)
+        # the copy is created as fully decoded, raw tokens would be encoded as values
+        self._decode_all()
+        # a shallow copy shares mutable values, neither object can keep a cached string then
+        self._access_all()
+        return type(self)(dict.items(self))
+    
+    
+    def __setitem__(self, key:NumKey, value:Any):
+        dict.__setitem__(self, key, value)
+        self._touch(key)
+    
+    
+    def pop(self, key:NumKey, *args) -> Any:
+        if key in self:
+            value = self._decode(key)
+            dict.__delitem__(self, key)
+            self._string = self._hash = None
+            return value
+        return dict.pop(self, key, *args)
+    
+    
+    def popitem(self) -> tuple[NumKey, Any]:
+        if not self:
+            raise KeyError("popitem(): dictionary is empty")
+        key = next(reversed(dict.keys(self)))
+        return key, self.pop(key)
+    
+    
+    def clear(self):
+        super().clear()
+        self._decoded = True
+    
+    
+    def update(self, *args, **kwargs):
+        for key, value in dict(*args, **kwargs).items():
+            self[key] = value
+    
+    
+    def to_tokens(self, encoder=None, condition=None, container=None, sort_keys:bool=False) -> list[str]:
+        
+        if encoder is not None or condition is not None or container is not None or sort_keys:
+            self._decode_all()
+            return super().to_tokens(
+                encoder=encoder, condition=condition, container=container, sort_keys=sort_keys
+                )
+        
+        cls = type(self)
+        encoder = cls.ENCODER
+        decoded = self._decoded
+        decoders = PROPERTY_DECODERS
+        
+        result = []
+        extend = result.extend
+        
+        try:
+            for key, value in dict.items(self):
+                if decoded is True or (decoded is not None and key in decoded) or key not in decoders:
+                    extend(encoder(key, value))
+                else:
+                    extend((str(key), value))
+        except Exception as e:
+            raise ValueError(f"[{cls.__name__}] failed to encode") from e
+        
+        return result
+
+
+class SharedObject(Object):
+    """
+    An object decoded with interning, whose mutable values may be shared with other objects.
+    
+    Mutable values are copied before they can be modified in place, 
+    the object then becomes a plain Object.
+    """
+    
+    __slots__ = ()
+    
+    def _unshare(self):
+        for key, value in dict.items(self):
+            if not isinstance(value, IMMUTABLE_TYPES):
+                dict.__setitem__(self, key, deepcopy(value))
+        self.__class__ = Object
+    
+    
+    def __getitem__(self, key:NumKey) -> Any:
+        if not isinstance(dict.__getitem__(self, key), IMMUTABLE_TYPES):
+            self._unshare()
+        return Object.__getitem__(self, key)
+    
+    
+    def get(self, key:NumKey, default:Any=None) -> Any:
+        return self[key] if key in self else default
+    
+    
+    def values(self):
+        self._unshare()
+        return Object.values(self)
+    
+    
+    def items(self):
+        self._unshare()
+        return Object.items(self)
+    
+    
+    def copy(self) -> Object:
+        self._unshare()
+        return Object.copy(self)
+    
+    
+    def pop(self, key:NumKey, *args) -> Any:
+        self._unshare()
+        return Object.pop(self, key, *args)
+    
+    
+    def popitem(self) -> tuple[NumKey, Any]:
+        self._unshare()
+        return Object.popitem(self)
+
+
+# key tuples shared between compact objects with the same keys
+KEY_TUPLES: dict[tuple,tuple] = {}
+
+
+class CompactObject(MutableMapping):
+    """
+    A compact level object, storing its property IDs and values as two tuples instead of a dict.
+    
+    Objects with the same properties in the same order share one key tuple,
+    a compact object costs an instance and a value tuple on top of its values.
+    Lookups scan the keys, which is fast for the few properties objects have.
+    
+    Implements the same mapping API and caching as Object, 
+    but is not a dict, use to_object() where a dict is required.
+    """
+    
+    __slots__ = ("_keys", "_values", "_string", "_hash")
+    
+    SEPARATOR = Object.SEPARATOR
+    END_DELIMITER = Object.END_DELIMITER
+    TYPES = Object.TYPES
+    DECODER = Object.DECODER
+    ENCODER = Object.ENCODER
+    
+    def __init__(self, *args, **kwargs):
+        self._set_items(dict(*args, **kwargs))
+        self._string = self._hash = None
+    
+    
+    def _set_items(self, data:dict):
+        keys = tuple(data)
+        self._keys = KEY_TUPLES.setdefault(keys, keys)
+        self._values = tuple(data.values())
+    
+    
+    @classmethod
+    def default(cls, object_id:int) -> Self:
+        return cls.from_string(OBJECT_DEFAULT.get(object_id, f"1,{object_id},2,0,3,0;"))
+    
+    
+    @classmethod
+    def from_object(cls, obj:Mapping) -> Self:
+        new = cls.__new__(cls)
+        if isinstance(obj, Object):
+            # the values are shared with the object, as with copy()
+            obj._access_all()
+            new._set_items(dict.copy(obj))
+        else:
+            new._set_items(dict(obj))
+        new._string = getattr(obj, "_string", None)
+        new._hash = getattr(obj, "_hash", None)
+        return new
+    
+    
+    def to_object(self) -> Object:
+        obj = Object()
+        dict.update(obj, zip(self._keys, self._values))
+        obj._string = self._string
+        obj._hash = getattr(self, "_hash", None)
+        return obj
+    
+    
+    @classmethod
+    def from_tokens(cls, tokens:list[str], decoder=None) -> Self:
+        
+        decoder = cls.DECODER if decoder is None else decoder
+        
+        length = len(tokens)
+        if length % 2 != 0:
+            raise ValueError(
+                f"[{cls.__name__}] expected an even number of key-value tokens, got {length}"
+                )
+        
+        decode_tokens = getattr(decoder, "decode_tokens", None)
+        
+        if decode_tokens is None:
+            it = iter(tokens)
+            pairs = map(decoder, it, it)
+        else:
+            pairs = decode_tokens(tokens)
+        
+        new = cls.__new__(cls)
+        
+        try:
+            new._set_items(dict(pairs))
+        except Exception as e:
+            raise ValueError(f"[{cls.__name__}] failed to decode") from e
+        
+        new._string = None
+        
+        return new
+    
+    
+    @classmethod
+    def from_string(cls, string:str) -> Self:
+        
+        string = string.removesuffix(cls.END_DELIMITER)
+        
+        if string:
+            new = cls.from_tokens(string.split(cls.SEPARATOR))
+        else:
+            new = cls()
+        
+        new._string = string
+        
+        return new
+    
+    
+    def to_tokens(self, **kwargs) -> list[str]:
+        
+        if kwargs:
+            return self.to_object().to_tokens(**kwargs)
+        
+        cls = type(self)
+        
+        try:
+            return cls.ENCODER.encode_items(zip(self._keys, self._values))
+        except Exception as e:
+            raise ValueError(f"[{cls.__name__}] failed to encode") from e
+    
+    
+    def to_string(self, **kwargs) -> str:
+        
+        end_delimiter = type(self).END_DELIMITER
+        
+        if kwargs:
+            string = type(self).SEPARATOR.join(self.to_tokens(**kwargs))
+            return string + end_delimiter if string else string
+        
+        string = self._string
+        
+        if string is None:
+            string = self._string = type(self).SEPARATOR.join(self.to_tokens())
+        
+        return string + end_delimiter if string else string
+    
+    
+    def is_modified(self) -> bool:
+        return self._string is None
+    
+    
+    def canonical_hash(self) -> int:
+        result = getattr(self, "_hash", None)
+        
+        if result is None:
+            result = self._hash = hash_items(zip(self._keys, self._values))
+        
+        return result
+    
+    
+    def _index(self, key:NumKey) -> int:
+        try:
+            return self._keys.index(key)
+        except ValueError:
+            raise KeyError(key) from None
+    
+    
+    def __getitem__(self, key:NumKey) -> Any:
+        value = self._values[self._index(key)]
+        if not isinstance(value, IMMUTABLE_TYPES):
+            self._string = self._hash = None
+        return value
+    
+    
+    def get(self, key:NumKey, default:Any=None) -> Any:
+        return self[key] if key in self._keys else default
+    
+    
+    def peek(self, key:NumKey, default:Any=None) -> Any:
+        """
+        Returns a property value without marking the object as modified.
+        
+        The returned value must not be modified in place.
+        """
+        keys = self._keys
+        return self._values[keys.index(key)] if key in keys else default
+    
+    
+    def __setitem__(self, key:NumKey, value:Any):
+        keys = self._keys
+        
+        if key in keys:
+            i = keys.index(key)
+            values = self._values
+            self._values = (*values[:i], value, *values[i+1:])
+        else:
+            keys = (*keys, key)
+            self._keys = KEY_TUPLES.setdefault(keys, keys)
+            self._values = (*self._values, value)
+        
+        self._string = self._hash = None
+    
+    
+    def __delitem__(self, key:NumKey):
+        i = self._index(key)
+        keys = (*self._keys[:i], *self._keys[i+1:])
+        self._keys = KEY_TUPLES.setdefault(keys, keys)
+        self._values = (*self._values[:i], *self._values[i+1:])
+        self._string = self._hash = None
+    
+    
+    def __contains__(self, key:Any) -> bool:
+        return key in self._keys
+    
+    
+    def __iter__(self) -> Iterator[NumKey]:
+        return iter(self._keys)
+    
+    
+    def __len__(self) -> int:
+        return len(self._keys)
+    
+    
+    def clear(self):
+        self._keys = ()
+        self._values = ()
+        self._string = self._hash = None
+    
+    
+    def copy(self) -> Self:
+        new = type(self).__new__(type(self))
+        new._keys = self._keys
+        new._values = self._values
+        # a shallow copy shares mutable values, neither cache can be trusted then
+        if not all(isinstance(value, IMMUTABLE_TYPES) for value in self._values):
+            self._string = self._hash = None
+        new._string = self._string
+        new._hash = getattr(self, "_hash", None)
+        return new
+    
+    
+    def __eq__(self, other:Any) -> bool:
+        if isinstance(other, CompactObject):
+            return dict(zip(self._keys, self._values)) == dict(zip(other._keys, other._values))
+        if isinstance(other, Mapping):
+            return dict(zip(self._keys, self._values)) == other
+        return NotImplemented
+    
+    
+    def __repr__(self):
+        return f"{type(self).__name__}({dict(zip(self._keys, self._values))!r})"
+    
+    
+    def __reduce__(self):
+        return (type(self).from_string, (self.to_string(),))
+
+
 class ObjectList(ArrayDecoderMixin,ListClass[Object]):
     
     SEPARATOR = ";"
     KEEP_SEPARATOR = True
     DECODER = Object.from_string
-    ENCODER = Object.to_string
+    # dispatches on the item, lists may hold compact objects
+    ENCODER = staticmethod(methodcaller("to_string"))
     
-    def difference(self, *obj_lists:Self):
-        to_string = Object.to_string
+    @classmethod
+    def iter_string(cls, string:str, lazy:bool=False, intern:bool=False, compact:bool=False) -> Iterator[Object|CompactObject]:
+        """
+        Lazily decodes an object string, yielding one object at a time.
+        
+        The string is scanned once, each object's tokens are split off 
+        the buffer directly and decoded without re-adding or stripping delimiters.
 
-        obj_set = {
-            to_string(obj, sort_keys=True)
-            for lst in obj_lists
-            for obj in lst
-        }
+        Parameters
+        ----------
+        string : str
+            The object string to decode.
+        lazy : bool, optional
+            If True, yields LazyObject instances which decode properties on first access. 
+            Defaults to False.
+        intern : bool, optional
+            If True, identical property tokens are decoded once and their value is shared, 
+            yielding SharedObject instances. Cannot be combined with lazy. Defaults to False.
+        compact : bool, optional
+            If True, yields CompactObject instances, which store their properties in tuples.
+            Cannot be combined with lazy or intern. Defaults to False.
 
-        return self.where(lambda obj: obj.to_string(sort_keys=True) not in obj_set)
+        Yields
+        ------
+        Object
+            The decoded objects, in order.
+        """
+        if lazy and intern:
+            raise ValueError(f"[{cls.__name__}] lazy objects cannot be interned")
+        
+        if compact and (lazy or intern):
+            raise ValueError(f"[{cls.__name__}] compact objects cannot be lazy or interned")
+        
+        if not string:
+            return
+        
+        separator = cls.SEPARATOR
+        end = len(string) - len(separator) if string.endswith(separator) else len(string)
+        
+        try:
+            if lazy or compact:
+                from_string = LazyObject.from_string if lazy else CompactObject.from_string
+                for token in iter_split(string, separator, end=end):
+                    yield from_string(token)
+            else:
+                delimiter = Object.SEPARATOR
+                from_tokens = SharedObject.from_tokens if intern else Object.from_tokens
+                decoder = Object.DECODER.interned() if intern else None
+                for token in iter_split(string, separator, end=end):
+                    obj = from_tokens(token.split(delimiter), decoder=decoder) if token else Object()
+                    obj._string = token
+                    yield obj
+        except Exception as e:
+            raise ValueError(f"[{cls.__name__}] failed to decode") from e
+    
+    
+    @classmethod
+    def from_string(cls, string:str, lazy:bool=False, intern:bool=False, compact:bool=False, **kwargs) -> Self:
+        
+        if kwargs:
+            return super().from_string(string, **kwargs)
+        
+        return cls(cls.iter_string(string, lazy=lazy, intern=intern, compact=compact))
+    
+    
+    @staticmethod
+    def _hash_table(objects:Iterable[Object]) -> dict[int,list[Object]]:
+        table = {}
+        for obj in objects:
+            table.setdefault(obj.canonical_hash(), []).append(obj)
+        return table
+    
+    
+    @staticmethod
+    def _in_table(table:dict[int,list[Object]], obj:Object) -> bool:
+        # equal hashes are confirmed by comparing the objects
+        candidates = table.get(obj.canonical_hash())
+        return candidates is not None and any(obj == other for other in candidates)
+    
+    
+    def dedupe(self) -> Self:
+        """
+        Returns the list without duplicate objects, keeping the first of equal objects.
+        
+        Objects are compared by their decoded properties, regardless of property order.
+        
+        Returns
+        -------
+        ObjectList
+            The unique objects, in list order.
+        """
+        seen = {}
+        result = []
+        
+        for obj in self:
+            candidates = seen.setdefault(obj.canonical_hash(), [])
+            
+            if any(obj == other for other in candidates):
+                continue
+            
+            candidates.append(obj)
+            result.append(obj)
+        
+        return type(self)(result)
+    
+    
+    def difference(self, *obj_lists:Self) -> Self:
+        """
+        Returns the objects that are not equal to any object of the other lists.
+        
+        Returns
+        -------
+        ObjectList
+            The remaining objects, in list order.
+        """
+        table = self._hash_table(obj for lst in obj_lists for obj in lst)
+        in_table = self._in_table
+        
+        return type(self)(obj for obj in self if not in_table(table, obj))
+    
+    
+    def intersection(self, *obj_lists:Self) -> Self:
+        """
+        Returns the objects that are equal to an object of every other list.
+        
+        Returns
+        -------
+        ObjectList
+            The common objects, in list order.
+        """
+        tables = [self._hash_table(lst) for lst in obj_lists]
+        in_table = self._in_table
+        
+        return type(self)(obj for obj in self if all(in_table(table, obj) for table in tables))
 
 
 class ObjectGroup(FileStringMixin):
@@ -62,11 +969,11 @@ class ObjectGroup(FileStringMixin):
         self.string = string or str()
     
     
-    def load(self, string:Optional[str]=None) -> ObjectList:
+    def load(self, string:Optional[str]=None, lazy:bool=False) -> ObjectList:
         
         string = self.string if string is None else string
         
-        self.objects = ObjectList.from_string(string)
+        self.objects = ObjectList.from_string(string, lazy=lazy)
         
         return self.objects
     
@@ -0,0 +1,360 @@
+# Imports
+from typing import Self, Optional, Any, Iterable
+from itertools import chain
+import numpy as np
+
+# Package Imports
+from gmdkit.utils.typing import NumKey
+from gmdkit.mappings import obj_prop
+from gmdkit.models.object import Object, ObjectList
+from gmdkit.defaults.hitboxes import HITBOX_SIZE, HITBOX_TYPE
+
+
+DEFAULT_COLUMNS = {
+    obj_prop.ID: (np.int32, 0),
+    obj_prop.X: (np.float64, 0.0),
+    obj_prop.Y: (np.float64, 0.0),
+    obj_prop.FLIP_X: (np.bool_, False),
+    obj_prop.FLIP_Y: (np.bool_, False),
+    obj_prop.SCALE_X: (np.float64, 1.0),
+    obj_prop.SCALE_Y: (np.float64, 1.0),
+    obj_prop.SKEW_X: (np.float64, 0.0),
+    obj_prop.SKEW_Y: (np.float64, 0.0),
+    obj_prop.ROTATION: (np.float64, 0.0),
+    obj_prop.Z_LAYER: (np.int32, 0),
+    obj_prop.Z_ORDER: (np.int32, 0),
+    obj_prop.COLOR_1: (np.int32, 0),
+    obj_prop.COLOR_2: (np.int32, 0),
+    }
+
+# columns read by ObjectTable.bounds()
+HITBOX_COLUMNS = (
+    obj_prop.ID, obj_prop.X, obj_prop.Y, obj_prop.SCALE_X, obj_prop.SCALE_Y,
+    obj_prop.SKEW_X, obj_prop.SKEW_Y, obj_prop.ROTATION
+    )
+
+# hitbox width and height by object ID, sawblade hitboxes are circles sized by their radius
+HITBOX_LOOKUP = np.zeros((max(HITBOX_SIZE) + 1, 2), dtype=np.float64)
+HITBOX_LOOKUP[list(HITBOX_SIZE)] = list(HITBOX_SIZE.values())
+HITBOX_CIRCLE = np.zeros(len(HITBOX_LOOKUP), dtype=np.bool_)
+HITBOX_CIRCLE[[key for key, value in HITBOX_TYPE.items() if value == "Sawblade"]] = True
+
+
+class ObjectTable:
+    """
+    A columnar view of an object list, storing selected properties as NumPy arrays.
+
+    Each column holds one value per object, missing properties are filled with
+    the column's fill value and tracked by a presence mask.
+    Groups are stored in CSR form, the groups of row i are
+    group_ids[group_offsets[i]:group_offsets[i+1]].
+
+    Columns can be filtered and updated with vectorized operations,
+    write_back() applies the changed values to the underlying objects.
+    Groups are read-only.
+    """
+
+    def __init__(
+            self,
+            objects:Iterable[Object],
+            columns:Optional[dict[NumKey,tuple[Any,Any]]]=None,
+            groups:bool=True
+            ):
+        """
+        Builds a table from a list of objects.
+
+        Parameters
+        ----------
+        objects : Iterable[Object]
+            The objects to view. Changes are written back to these objects.
+        columns : dict[NumKey,tuple[Any,Any]], optional
+            Maps property IDs to a (dtype, fill value) pair. Defaults to DEFAULT_COLUMNS.
+        groups : bool, optional
+            Whether to compile object groups. Defaults to True.
+        """
+        self.objects = objects if isinstance(objects, ObjectList) else ObjectList(objects)
+        self.fill = {}
+        self.columns = {}
+        self.present = {}
+
+        for key, (dtype, fill) in (DEFAULT_COLUMNS if columns is None else columns).items():
+            self._load_column(key, dtype, fill)
+
+        if groups:
+            self._load_groups()
+        else:
+            self.group_offsets = self.group_ids = None
+
+        self._snapshot()
+
+
+    def _load_column(self, key:NumKey, dtype:Any, fill:Any):
+
+        values = [obj.peek(key) for obj in self.objects]
+        present = np.fromiter((value is not None for value in values), dtype=np.bool_, count=len(values))
+
+        if not present.all():
+            values = [fill if value is None else value for value in values]
+
+        self.fill[key] = fill
+        self.columns[key] = np.array(values, dtype=dtype)
+        self.present[key] = present
+
+
+    def _load_groups(self):
+
+        groups = [obj.peek(obj_prop.GROUPS) or () for obj in self.objects]
+        offsets = np.zeros(len(groups) + 1, dtype=np.int64)
+        np.cumsum([len(g) for g in groups], out=offsets[1:])
+
+        self.group_offsets = offsets
+        self.group_ids = np.fromiter(chain.from_iterable(groups), dtype=np.int32, count=offsets[-1])
+
+
+    def _snapshot(self):
+        self._original = {key: (column.copy(), self.present[key].copy()) for key, column in self.columns.items()}
+
+
+    def __len__(self) -> int:
+        return len(self.objects)
+
+
+    def __contains__(self, key:NumKey) -> bool:
+        return key in self.columns
+
+
+    def __getitem__(self, key:NumKey) -> np.ndarray:
+        return self.columns[key]
+
+
+    def __setitem__(self, key:NumKey, value:Any):
+        self.set(key, value)
+
+
+    def keys(self):
+        return self.columns.keys()
+
+
+    def set(self, key:NumKey, value:Any, mask:Optional[np.ndarray]=None):
+        """
+        Sets the values of a column, marking them as present.
+
+        Parameters
+        ----------
+        key : NumKey
+            The property ID of the column. New columns are created with a fill value of None.
+        value : Any
+            A scalar or array of values, broadcast to the selected rows.
+        mask : np.ndarray, optional
+            A boolean mask or index array selecting the rows to set. Defaults to all rows.
+        """
+        if key not in self.columns:
+            value = np.asarray(value)
+            self.fill[key] = None
+            self.columns[key] = np.zeros(len(self), dtype=value.dtype)
+            self.present[key] = np.zeros(len(self), dtype=np.bool_)
+            self._original[key] = (self.columns[key].copy(), self.present[key].copy())
+
+        if mask is None:
+            mask = slice(None)
+
+        self.columns[key][mask] = value
+        self.present[key][mask] = True
+
+
+    def drop(self, key:NumKey, mask:Optional[np.ndarray]=None):
+        """
+        Marks the values of a column as missing, removing them from the objects on write back.
+
+        Parameters
+        ----------
+        key : NumKey
+            The property ID of the column.
+        mask : np.ndarray, optional
+            A boolean mask or index array selecting the rows to drop. Defaults to all rows.
+        """
+        if mask is None:
+            mask = slice(None)
+
+        self.present[key][mask] = False
+
+        if (fill := self.fill[key]) is not None:
+            self.columns[key][mask] = fill
+
+
+    def group_counts(self) -> np.ndarray:
+        return np.diff(self.group_offsets)
+
+
+    def groups(self, row:int) -> np.ndarray:
+        return self.group_ids[self.group_offsets[row]:self.group_offsets[row+1]]
+
+
+    def has_groups(self, *groups:int) -> np.ndarray:
+        """
+        Returns a boolean mask of the rows that belong to any of the given groups.
+        """
+        rows = np.repeat(np.arange(len(self)), self.group_counts())
+
+        mask = np.zeros(len(self), dtype=np.bool_)
+        mask[rows[np.isin(self.group_ids, groups)]] = True
+
+        return mask
+
+
+    def bounds(self) -> np.ndarray:
+        """
+        Returns the axis aligned bounding box of each object's hitbox.
+
+        Hitboxes are sized by object ID from hitbox_table.csv, then scaled,
+        skewed and rotated around the object's position.
+        Objects without a known hitbox are reduced to their position.
+        Requires the HITBOX_COLUMNS.
+
+        Returns
+        -------
+        np.ndarray
+            An array of shape (len(self), 4) holding min_x, min_y, max_x, max_y per row.
+        """
+        ids = self[obj_prop.ID]
+        known = (ids >= 0) & (ids < len(HITBOX_LOOKUP))
+        index = np.where(known, ids, 0)
+        size = np.where(known[:,None], HITBOX_LOOKUP[index], 0.0)
+        circle = known & HITBOX_CIRCLE[index]
+
+        scale_x = np.abs(self[obj_prop.SCALE_X])
+        scale_y = np.abs(self[obj_prop.SCALE_Y])
+        rotation = self[obj_prop.ROTATION]
+
+        def turn(angle:np.ndarray) -> tuple[np.ndarray,np.ndarray]:
+            radians = np.radians(angle)
+            cos = np.abs(np.cos(radians))
+            sin = np.abs(np.sin(radians))
+            # quarter turns are exact, otherwise rounding would make adjacent hitboxes overlap
+            cos[cos < 1e-12] = 0
+            sin[sin < 1e-12] = 0
+            return cos, sin
+
+        # each axis is turned by the rotation and its own skew
+        cos_x, sin_x = turn(rotation + self[obj_prop.SKEW_X])
+        cos_y, sin_y = turn(rotation + self[obj_prop.SKEW_Y])
+
+        half_w = size[:,0] * scale_x / 2
+        half_h = size[:,1] * scale_y / 2
+
+        extent_x = cos_x * half_w + sin_y * half_h
+        extent_y = sin_x * half_w + cos_y * half_h
+
+        if circle.any():
+            # a circle only changes with scale, turned circles use the larger scale
+            turned = (sin_x != 0) | (sin_y != 0)
+            radius = size[:,0]
+            larger = np.maximum(scale_x, scale_y)
+            extent_x = np.where(circle, radius * np.where(turned, larger, scale_x), extent_x)
+            extent_y = np.where(circle, radius * np.where(turned, larger, scale_y), extent_y)
+
+        x = self[obj_prop.X]
+        y = self[obj_prop.Y]
+
+        return np.stack((x - extent_x, y - extent_y, x + extent_x, y + extent_y), axis=1)
+
+
+    def where(self, mask:np.ndarray) -> Self:
+        """
+        Returns a table of the selected rows.
+
+        The new table views the same objects but holds its own columns,
+        its changes only apply to the objects through its own write_back().
+
+        Parameters
+        ----------
+        mask : np.ndarray
+            A boolean mask or index array selecting the rows.
+
+        Returns
+        -------
+        ObjectTable
+            The filtered table.
+        """
+        index = np.arange(len(self))[mask]
+        objects = self.objects
+
+        new = type(self).__new__(type(self))
+        new.objects = ObjectList(objects[i] for i in index.tolist())
+        new.fill = self.fill.copy()
+        new.columns = {key: column[index] for key, column in self.columns.items()}
+        new.present = {key: present[index] for key, present in self.present.items()}
+        new._original = {
+            key: (column[index], present[index])
+            for key, (column, present) in self._original.items()
+            }
+
+        if self.group_offsets is None:
+            new.group_offsets = new.group_ids = None
+        else:
+            starts = self.group_offsets[index]
+            counts = self.group_offsets[index+1] - starts
+            new.group_offsets = np.zeros(len(index) + 1, dtype=np.int64)
+            np.cumsum(counts, out=new.group_offsets[1:])
+            # positions of each selected row's groups in the parent's group_ids
+            positions = np.repeat(starts - new.group_offsets[:-1], counts) + np.arange(new.group_offsets[-1])
+            new.group_ids = self.group_ids[positions]
+
+        return new
+
+
+    def to_list(self, mask:Optional[np.ndarray]=None) -> ObjectList:
+        """
+        Returns the objects of the selected rows, or all objects if no mask is given.
+        """
+        if mask is None:
+            return ObjectList(self.objects)
+
+        objects = self.objects
+
+        return ObjectList(objects[i] for i in np.arange(len(self))[mask].tolist())
+
+
+    def write_back(self) -> int:
+        """
+        Applies changed values to the underlying objects.
+
+        Only the cells that differ from the last write back are written,
+        unchanged objects keep their cached strings.
+
+        Returns
+        -------
+        int
+            The number of objects that were changed.
+        """
+        objects = self.objects
+        changed = np.zeros(len(self), dtype=np.bool_)
+
+        for key, column in self.columns.items():
+            present = self.present[key]
+            original, original_present = self._original[key]
+
+            dropped = original_present & ~present
+            modified = present & (~original_present | (column != original))
+
+            for i in np.flatnonzero(dropped).tolist():
+                objects[i].pop(key, None)
+
+            rows = np.flatnonzero(modified)
+
+            for i, value in zip(rows.tolist(), column[rows].tolist()):
+                objects[i][key] = value
+
+            changed |= dropped | modified
+
+        self._snapshot()
+
+        return int(changed.sum())
+
+
+    def to_string(self) -> str:
+        """
+        Writes back changes and serializes the objects.
+        """
+        self.write_back()
+        return self.objects.to_string()
@@ -1,16 +1,27 @@
 # Imports
-from typing import Optional, Self
+from typing import Optional, Self, Iterable
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
 
 # Package Imports
 from gmdkit.models.object import Object, ObjectList
-from gmdkit.serialization.mixins import FileStringMixin
-from gmdkit.serialization.functions import decompress_string, compress_string
+from gmdkit.serialization.mixins import FileStringMixin, _pool_chunksize
+from gmdkit.serialization.functions import decompress_string, compress_string, DEFERRED_COMPRESSION
 from gmdkit.models.prop.replay import ReplayInfo, ReplayEvents
 
 
 LevelObjects = tuple[Object,ObjectList]
 ReplayData = tuple[ReplayEvents,ReplayInfo]
 
+
+def _load_objects(kwargs:dict, string:str) -> LevelObjects|str:
+    # runs in a worker process, only the compressed string is sent and the decoded objects are pickled back
+    if kwargs.get("lazy"):
+        # lazy objects are rebuilt from their string when unpickled, sending the string skips encoding them again
+        return decompress_string(string)
+    
+    return ObjectString(string).load(**kwargs)
+
 class GzipString(FileStringMixin):
     """
     Lazy-loads a gzip compressed string and allows loading and saving it to a decompressed format.
@@ -44,7 +55,12 @@ class GzipString(FileStringMixin):
         self.decompressed = decompress_string(self.string)
         return self.decompressed
 
-    def save(self, string: Optional[str] = None) -> None:
+    def save(
+            self, 
+            string: Optional[str] = None, 
+            block_size: Optional[int] = None, 
+            workers: Optional[int] = None
+            ) -> None:
         """
         Compress and store the string.
         
@@ -52,6 +68,10 @@ class GzipString(FileStringMixin):
         ----------
         string : str, optional
             If provided, replaces the current decompressed value before saving.
+        block_size : int, optional
+            If provided, compresses the string in independent deflate blocks of this many bytes.
+        workers : int, optional
+            The number of threads compressing blocks, only used with block_size.
         
         Returns
         -------
@@ -61,8 +81,13 @@ class GzipString(FileStringMixin):
         if string is not None:
             self.decompressed = string
         
-        if self.decompressed is not None:
-            self.string = compress_string(self.decompressed)
+        if self.decompressed is None:
+            return
+        
+        if (deferred := DEFERRED_COMPRESSION.get()) is not None:
+            deferred.append(self)
+        else:
+            self.string = compress_string(self.decompressed, block_size=block_size, workers=workers)
 
     @classmethod
     def from_string(cls, string: str, load: bool = True) -> Self:
@@ -120,9 +145,21 @@ class ObjectString(GzipString):
         The level's objects, populated after calling load().
     """
     
-    def load(self) -> LevelObjects:
+    def load(self, lazy:bool=False, intern:bool=False, compact:bool=False) -> LevelObjects:
         """
         Decompresses and parses the level string into level objects.
+        
+        Parameters
+        ----------
+        lazy : bool, optional
+            If True, objects are loaded as LazyObject instances that keep their raw tokens 
+            and only decode a property on first access. Defaults to False.
+        intern : bool, optional
+            If True, identical property tokens share one decoded value, 
+            mutable values are copied when first accessed for modification. Defaults to False.
+        compact : bool, optional
+            If True, objects are loaded as CompactObject instances, 
+            which store their properties in tuples instead of a dict. Defaults to False.
 
         Returns
         -------
@@ -132,18 +169,72 @@ class ObjectString(GzipString):
         """
         string = super().load()
         
-        first, _, remainder = string.partition(";")
+        return self._parse(string, lazy=lazy, intern=intern, compact=compact)
+    
+    
+    def _parse(self, string:str, **kwargs) -> LevelObjects:
+        
+        objects = ObjectList.iter_string(string, **kwargs)
         
-        self.start = Object.from_string(first)
-        self.objects = ObjectList.from_string(remainder)
+        # an empty start object is falsy but valid, only a missing one is replaced
+        start = next(objects, None)
+        self.start = Object() if start is None else start
+        self.objects = ObjectList(objects)
     
         return self.start, self.objects
     
     
+    @classmethod
+    def load_all(
+            cls,
+            instances:Iterable[Self],
+            workers:Optional[int]=None,
+            **kwargs
+            ) -> None:
+        """
+        Loads several object strings, decoding them in worker processes.
+
+        Parameters
+        ----------
+        instances : Iterable[ObjectString]
+            The object strings to load.
+        workers : int, optional
+            The number of worker processes. Loads in this process if None or 1. Defaults to None.
+        **kwargs
+            Passed to load().
+
+        Returns
+        -------
+        None.
+
+        """
+        instances = list(instances)
+        
+        if workers is None or workers <= 1 or len(instances) <= 1:
+            for instance in instances:
+                instance.load(**kwargs)
+            return
+        
+        load = partial(_load_objects, kwargs)
+        strings = [instance.string for instance in instances]
+        chunksize = _pool_chunksize(len(strings), workers)
+        
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            for instance, result in zip(instances, executor.map(load, strings, chunksize=chunksize)):
+                if isinstance(result, str):
+                    instance.decompressed = result
+                    instance._parse(result, **kwargs)
+                else:
+                    # the decompressed string is not sent back with decoded objects, load() only keeps it as a cache
+                    instance.start, instance.objects = result
+    
+    
     def save(
             self,
             start: Optional[Object]=None,
             objects: Optional[ObjectList]=None,
+            block_size: Optional[int]=None,
+            workers: Optional[int]=None,
             ) -> str:
         """
         Serialize and compress the level data.
@@ -154,6 +245,10 @@ class ObjectString(GzipString):
             The start object to serialize. Defaults to the current start attribute.
         objects : ObjectList, optional
             The object list to serialize. Defaults to the current objects attribute.
+        block_size : int, optional
+            If provided, compresses the string in independent deflate blocks of this many bytes.
+        workers : int, optional
+            The number of threads compressing blocks, only used with block_size.
         
         Returns
         -------
@@ -166,8 +261,9 @@ class ObjectString(GzipString):
         if start is None or objects is None:
             return self.string
     
-        string = start.to_string() + objects.to_string()
-        super().save(string)
+        # an empty start object still ends with its delimiter, the first object would become the start object
+        string = (start.to_string() or type(start).END_DELIMITER) + objects.to_string()
+        super().save(string, block_size=block_size, workers=workers)
         return self.string
         
 
@@ -204,6 +300,8 @@ class ReplayString(GzipString):
             self,
             metadata: Optional[ReplayInfo]=None,
             events: Optional[ReplayEvents]=None,
+            block_size: Optional[int]=None,
+            workers: Optional[int]=None,
             ) -> str:
         """
         Serialize and compress the replay data.
@@ -214,6 +312,10 @@ class ReplayString(GzipString):
             The replay metadata to serialize. Defaults to the current start attribute.
         events : ReplayEvents, optional
             The replay events to serialize. Defaults to the current events attribute.
+        block_size : int, optional
+            If provided, compresses the string in independent deflate blocks of this many bytes.
+        workers : int, optional
+            The number of threads compressing blocks, only used with block_size.
         
         Returns
         -------
@@ -228,4 +330,4 @@ class ReplayString(GzipString):
         
         string = metadata.to_string() + events.to_string()
         
-        return super().save(string)
\ No newline at end of file
+        return super().save(string, block_size=block_size, workers=workers)
\ No newline at end of file
@@ -1,5 +1,5 @@
 # Imports
-from typing import Any
+from typing import Any, Iterable, Optional
 
 # Package Imports
 from gmdkit.utils.types import DictClass
@@ -7,16 +7,21 @@ from gmdkit.serialization.mixins import (
     CompressFileMixin, 
     FilePathMixin, 
     DefaultPathMixin,
-    PlistLoaderMixin
+    PlistLoaderMixin,
+    content_kwargs
     )
-from gmdkit.serialization.functions import dict_cast, read_plist, write_plist
+from gmdkit.serialization.functions import dict_cast, read_plist, write_plist, split_dict_items
+from gmdkit.models.level import Level, LazyLevel, INDEX_KEYS
+from gmdkit.models.prop.gzip import ObjectString
 from gmdkit.constants.paths.save import LOCAL_LEVELS_PATH
-from gmdkit.mappings import lvl_save
+from gmdkit.mappings import lvl_save, lvl_prop
 from gmdkit.casting.level_save import LEVEL_SAVE_DECODER, LEVEL_SAVE_ENCODER
 
 
 ALLOW_KWARGS = {"LLM_01","LLM_03"}
 
+EMPTY_LEVEL_LIST = "<d><k>_isArr</k><t /></d>"
+
 
 class LevelSave(DefaultPathMixin,FilePathMixin,CompressFileMixin,PlistLoaderMixin,DictClass[str,Any]):
     
@@ -32,6 +37,59 @@ class LevelSave(DefaultPathMixin,FilePathMixin,CompressFileMixin,PlistLoaderMixi
     def _name_fallback_(self):
         return "CCLocalLevels"
     
+    
+    @classmethod
+    def _from_plist(cls, source:str|Iterable[str], index:bool=False, **kwargs):
+        
+        if not index:
+            return super()._from_plist(source, **kwargs)
+        
+        # levels are cut out of the plist text while it is read and indexed as their own strings,
+        # the rest of the save is decoded as usual
+        try:
+            string, items = split_dict_items(source, lvl_save.LEVELS, EMPTY_LEVEL_LIST)
+        except ValueError as e:
+            raise RuntimeError(f"[{cls.__name__}] failed to load string") from e
+        
+        if items is None:
+            # falls back to indexing parsed level nodes
+            return super()._from_plist(string, index=True, **kwargs)
+        
+        try:
+            levels = [LazyLevel.from_span(item, 0, len(item)) for item in items]
+        except ValueError as e:
+            raise RuntimeError(f"[{cls.__name__}] failed to index levels") from e
+        
+        new = super()._from_plist(string, **kwargs)
+        new[lvl_save.LEVELS].extend(levels)
+        
+        return new
+    
+    
+    def load(self, selectors:Optional[set]=None, workers:Optional[int]=None, **kwargs):
+        
+        target = type(self).SELECTORS if selectors is None else selectors
+        levels = self.get(lvl_save.LEVELS)
+        
+        if workers is None or workers <= 1 or levels is None or (target is not None and lvl_save.LEVELS not in target):
+            super().load(selectors=selectors, **kwargs)
+            return
+        
+        # the rest of the save and the other level content is loaded in this process
+        self.invoke("load", target={key for key in self if key != lvl_save.LEVELS and (target is None or key in target)}, **kwargs)
+        
+        content = Level.SELECTORS - {lvl_prop.OBJECT_STRING}
+        object_strings = []
+        
+        for level in levels:
+            level.load(selectors=content, **kwargs)
+            object_string = level.get(lvl_prop.OBJECT_STRING)
+            
+            if isinstance(object_string, ObjectString):
+                object_strings.append(object_string)
+        
+        ObjectString.load_all(object_strings, workers=workers, **content_kwargs(ObjectString.load, kwargs))
+    
 
 if __name__ == "__main__":
     from gmdkit.utils.misc import Timer
@@ -0,0 +1,281 @@
+# Imports
+from typing import Iterable
+import numpy as np
+
+# Package Imports
+from gmdkit.mappings import obj_prop
+from gmdkit.models.object import Object, ObjectList
+from gmdkit.models.object_table import ObjectTable, HITBOX_COLUMNS, DEFAULT_COLUMNS
+
+
+class SpatialIndex:
+    """
+    A uniform grid over the positions of an object list, answering region queries without a full scan.
+
+    Objects are bucketed by the grid cell of their center,
+    cells are stored sorted so that a column of cells is one contiguous slice.
+    Objects larger than a cell are kept apart and checked on every query.
+
+    The index is a snapshot, it must be rebuilt after objects are moved or added.
+    """
+
+    def __init__(
+            self,
+            objects:Iterable[Object],
+            cell_size:float=150,
+            hitboxes:bool=False
+            ):
+        """
+        Builds a spatial index of a list of objects.
+
+        Parameters
+        ----------
+        objects : Iterable[Object]
+            The objects to index. Objects without a position are placed at 0.
+        cell_size : float, optional
+            The width and height of a grid cell. Defaults to 150 units.
+        hitboxes : bool, optional
+            If True, objects are indexed by their hitbox bounds instead of their center,
+            see ObjectTable.bounds(). Defaults to False.
+        """
+        if cell_size <= 0:
+            raise ValueError(f"[{type(self).__name__}] cell size must be positive, got {cell_size}")
+
+        self.objects = objects if isinstance(objects, ObjectList) else ObjectList(objects)
+        self.cell_size = cell_size
+
+        keys = HITBOX_COLUMNS if hitboxes else (obj_prop.X, obj_prop.Y)
+        table = ObjectTable(self.objects, columns={key: DEFAULT_COLUMNS[key] for key in keys}, groups=False)
+
+        self.x = table[obj_prop.X]
+        self.y = table[obj_prop.Y]
+        self.has_x = table.present[obj_prop.X]
+
+        if hitboxes:
+            # hitboxes are centered on the object
+            bounds = table.bounds()
+            self.half_w = (bounds[:,2] - bounds[:,0]) / 2
+            self.half_h = (bounds[:,3] - bounds[:,1]) / 2
+        else:
+            self.half_w = self.half_h = np.zeros(len(table), dtype=np.float64)
+
+        large = (self.half_w > cell_size) | (self.half_h > cell_size)
+        self.large = np.flatnonzero(large)
+        small = np.flatnonzero(~large)
+        # how far a small object can reach out of its cell
+        self.margin = float(max(self.half_w[small].max(initial=0), self.half_h[small].max(initial=0)))
+
+        cell_x = np.floor(self.x[small] / cell_size).astype(np.int64)
+        cell_y = np.floor(self.y[small] / cell_size).astype(np.int64)
+
+        if len(small):
+            self.min_cell = (int(cell_x.min()), int(cell_y.min()))
+            self.max_cell = (int(cell_x.max()), int(cell_y.max()))
+        else:
+            self.min_cell = self.max_cell = (0, 0)
+
+        self.rows = self.max_cell[1] - self.min_cell[1] + 1
+        keys = (cell_x - self.min_cell[0]) * self.rows + (cell_y - self.min_cell[1])
+        order = np.argsort(keys, kind="stable")
+
+        self.cell_keys = keys[order]
+        self.cell_items = small[order]
+
+        self.x_order = np.argsort(self.x, kind="stable")
+        self.x_sorted = self.x[self.x_order]
+
+
+    def __len__(self) -> int:
+        return len(self.objects)
+
+
+    def _objects(self, indices:np.ndarray) -> ObjectList:
+        # indexes the underlying list, skipping the slice check of ObjectList
+        get = list.__getitem__
+        objects = self.objects
+        return ObjectList([get(objects, i) for i in indices.tolist()])
+
+
+    def _cells(self, min_x:float, min_y:float, max_x:float, max_y:float) -> np.ndarray:
+        # indices of the small objects whose center cell overlaps the rectangle
+        size = self.cell_size
+        x0 = max(int(np.floor(min_x / size)), self.min_cell[0])
+        x1 = min(int(np.floor(max_x / size)), self.max_cell[0])
+        y0 = max(int(np.floor(min_y / size)), self.min_cell[1])
+        y1 = min(int(np.floor(max_y / size)), self.max_cell[1])
+
+        if x0 > x1 or y0 > y1 or not len(self.cell_keys):
+            return np.empty(0, dtype=np.int64)
+
+        columns = (np.arange(x0, x1 + 1) - self.min_cell[0]) * self.rows
+        starts = np.searchsorted(self.cell_keys, columns + (y0 - self.min_cell[1]), side="left")
+        ends = np.searchsorted(self.cell_keys, columns + (y1 - self.min_cell[1]), side="right")
+
+        return np.concatenate([self.cell_items[start:end] for start, end in zip(starts.tolist(), ends.tolist())])
+
+
+    def query_indices(self, min_x:float, min_y:float, max_x:float, max_y:float) -> np.ndarray:
+        """
+        Returns the sorted indices of the objects overlapping a rectangle.
+        """
+        # small objects may overlap the rectangle from a neighbouring cell
+        margin = self.margin
+        candidates = np.concatenate((
+            self._cells(min_x - margin, min_y - margin, max_x + margin, max_y + margin),
+            self.large
+            ))
+
+        x = self.x[candidates]
+        y = self.y[candidates]
+        half_w = self.half_w[candidates]
+        half_h = self.half_h[candidates]
+
+        hits = (
+            (x + half_w >= min_x) & (x - half_w <= max_x) &
+            (y + half_h >= min_y) & (y - half_h <= max_y)
+            )
+
+        return np.sort(candidates[hits])
+
+
+    def query(self, min_x:float, min_y:float, max_x:float, max_y:float) -> ObjectList:
+        """
+        Returns the objects overlapping a rectangle, in list order.
+
+        Parameters
+        ----------
+        min_x : float
+            The left edge of the rectangle.
+        min_y : float
+            The bottom edge of the rectangle.
+        max_x : float
+            The right edge of the rectangle.
+        max_y : float
+            The top edge of the rectangle.
+
+        Returns
+        -------
+        ObjectList
+            The objects whose center, or hitbox if indexed, is inside or touches the rectangle.
+        """
+        return self._objects(self.query_indices(min_x, min_y, max_x, max_y))
+
+
+    def nearest_indices(self, x:float, y:float, k:int=1) -> np.ndarray:
+        """
+        Returns the indices of the k objects whose center is nearest to a point, nearest first.
+        """
+        count = len(self)
+
+        if k <= 0 or not count:
+            return np.empty(0, dtype=np.int64)
+
+        if k >= count:
+            candidates = np.arange(count)
+        else:
+            # grows a square of cells around the point until it holds k objects,
+            # then searches the square that contains the circle through the k-th nearest
+            size = self.cell_size
+            extent = max(
+                abs(x - self.min_cell[0] * size), abs(x - (self.max_cell[0] + 1) * size),
+                abs(y - self.min_cell[1] * size), abs(y - (self.max_cell[1] + 1) * size)
+                )
+            radius = size
+
+            while True:
+                candidates = self._cells(x - radius, y - radius, x + radius, y + radius)
+
+                if len(candidates) + len(self.large) >= k or radius > extent:
+                    break
+
+                radius *= 2
+
+            candidates = np.concatenate((candidates, self.large))
+            distance = np.hypot(self.x[candidates] - x, self.y[candidates] - y)
+            reach = np.partition(distance, k - 1)[k - 1]
+            candidates = np.concatenate((self._cells(x - reach, y - reach, x + reach, y + reach), self.large))
+
+        distance = np.hypot(self.x[candidates] - x, self.y[candidates] - y)
+        # ties are broken by list order
+        order = np.lexsort((candidates, distance))
+
+        return candidates[order[:k]]
+
+
+    def nearest(self, x:float, y:float, k:int=1) -> ObjectList:
+        """
+        Returns the k objects whose center is nearest to a point.
+
+        Parameters
+        ----------
+        x : float
+            The X position of the point.
+        y : float
+            The Y position of the point.
+        k : int, optional
+            The number of objects to return. Defaults to 1.
+
+        Returns
+        -------
+        ObjectList
+            The nearest objects, nearest first, ties in list order.
+        """
+        return self._objects(self.nearest_indices(x, y, k))
+
+
+    def sweep_indices(self, min_x:float, max_x:float) -> np.ndarray:
+        """
+        Returns the indices of the objects overlapping a range of X positions, sorted by X.
+        """
+        margin = self.margin
+        start = np.searchsorted(self.x_sorted, min_x - margin, side="left")
+        end = np.searchsorted(self.x_sorted, max_x + margin, side="right")
+
+        candidates = self.x_order[start:end]
+        x = self.x[candidates]
+        half_w = self.half_w[candidates]
+        candidates = candidates[(x + half_w >= min_x) & (x - half_w <= max_x)]
+
+        if len(self.large):
+            x = self.x[self.large]
+            half_w = self.half_w[self.large]
+            large = self.large[(x + half_w >= min_x) & (x - half_w <= max_x)]
+            # large objects within the margin are already candidates
+            candidates = np.union1d(candidates, large) if len(large) else candidates
+            candidates = candidates[np.lexsort((candidates, self.x[candidates]))]
+
+        return candidates
+
+
+    def sweep(self, min_x:float, max_x:float) -> ObjectList:
+        """
+        Returns the objects overlapping a range of X positions, as a vertical band of the level.
+
+        Parameters
+        ----------
+        min_x : float
+            The start of the range.
+        max_x : float
+            The end of the range.
+
+        Returns
+        -------
+        ObjectList
+            The objects sorted by X position, ties in list order.
+        """
+        return self._objects(self.sweep_indices(min_x, max_x))
+
+
+    def sorted_x(self) -> ObjectList:
+        """
+        Returns every object sorted by X position, ties in list order.
+        """
+        return self._objects(self.x_order)
+
+
+    def sorted_x_positions(self) -> list[float|None]:
+        """
+        Returns the X position of every object in sorted_x() order, None for objects without one.
+        """
+        present = self.has_x[self.x_order].tolist()
+        return [x if has_x else None for x, has_x in zip(self.x_sorted.tolist(), present)]
@@ -154,7 +154,6 @@ class IdentifierList:
     
     def get_objects(self, condition: Optional[Callable] = None) -> ObjectList:
         
-        seen = set()  
         new = ObjectList()
         
         for i in self.values:
@@ -163,18 +162,12 @@ class IdentifierList:
             if obj is None:
                 continue
             
-            obj_str = obj.to_string(sort_keys=True)
-            
-            if obj_str in seen: 
-                continue
-            
             if condition is not None and callable(condition) and not condition(i):
                 continue
             
             new.append(obj)
-            seen.add(obj_str)
         
-        return new
+        return new.dedupe()
     
     @staticmethod
     def group_by_type(
@@ -239,7 +232,7 @@ class IDRule:
         return True
         
     def get_id(self, obj: Object):
-        val = obj.get(self.obj_prop_id)
+        val = obj.peek(self.obj_prop_id)
         
         default = self.default(obj) if callable(self.default) else self.default
 
@@ -325,7 +318,7 @@ class RuleHandler:
             ):
         
         result = []
-        oid = obj.get(obj_prop.ID, 0)
+        oid = obj.peek(obj_prop.ID, 0)
         rules = self.by_id.get(oid)
         
         if rules is not None:
@@ -338,7 +338,7 @@ def create_level_color_triggers(level:Level):
 def compile_keyframe_spawn_ids(obj_list:ObjectList):
     
     def key_func(obj):
-        spawn_id = obj.get(obj_prop.trigger.keyframe.SPAWN_ID)
+        spawn_id = obj.peek(obj_prop.trigger.keyframe.SPAWN_ID)
         return None if spawn_id == 0 else spawn_id
     
     return compile_keyframe_groups(obj_list,key_func)
@@ -350,10 +350,10 @@ def compile_spawn_groups(obj_list:ObjectList):
     
     for obj in obj_list:
         
-        if not obj.get(obj_prop.trigger.SPAWN_TRIGGER):
+        if not obj.peek(obj_prop.trigger.SPAWN_TRIGGER):
             continue
         
-        if (groups:=obj.get(obj_prop.GROUPS)) is not None:
+        if (groups:=obj.peek(obj_prop.GROUPS)) is not None:
             
             for i in set(groups):
                 spawn_groups.setdefault(i,ObjectList())
@@ -362,14 +362,14 @@ def compile_spawn_groups(obj_list:ObjectList):
             spawn_groups[0].append(obj)
     
     for v in spawn_groups.values():
-        v.sort(key=lambda obj: obj.get(obj_prop.X))
+        v.sort(key=lambda obj: obj.peek(obj_prop.X))
         
     return spawn_groups
 
 
 def create_common_group(objects:ObjectList, rules) -> tuple[int]:
     
-    common = objects.shared_values(lambda obj: obj.get(obj_prop.GROUPS))
+    common = objects.shared_values(lambda obj: obj.peek(obj_prop.GROUPS))
     
     if common:
         return tuple(common)
@@ -1,10 +1,19 @@
 # Imports
-from typing import Callable, Literal, Optional, Any, get_type_hints, TypeVar, overload
+from typing import Callable, Literal, Optional, Any, Iterable, Iterator, Sequence, Self, get_type_hints, TypeVar, overload
 import numpy as np
 from dataclasses import field, fields, dataclass, MISSING
 import sys
+import os
+import mmap
 import xml.etree.ElementTree as ET
+from contextlib import contextmanager
+from contextvars import ContextVar
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+from operator import call
+import re
 import base64
+import codecs
 import zlib
 import gzip
 from enum import Enum
@@ -48,22 +57,87 @@ def get_field(obj, key:str):
         raise KeyError(key)
     return getattr(obj, key)   
 
-def xor(data: bytes, key: bytes) -> bytes:
+def iter_split(
+        string:str,
+        separator:str,
+        start:int=0,
+        end:Optional[int]=None
+        ) -> Iterator[str]:
+    """
+    Lazily splits a string, equivalent to iter(string[start:end].split(separator)).
+    """
+    if not separator:
+        raise ValueError("empty separator")
+
+    find = string.find
+    step = len(separator)
+    end = len(string) if end is None else end
+
+    while (index:=find(separator, start, end)) != -1:
+        yield string[start:index]
+        start = index + step
+
+    yield string[start:end]
+
+
+def xor_inplace(data:bytearray|memoryview, key:bytes, offset:int=0) -> None:
+    """
+    XORs a writable buffer with a repeating key in place.
+
+    Parameters
+    ----------
+    data : bytearray | memoryview
+        The buffer to modify.
+    key : bytes
+        The key to XOR with.
+    offset : int, optional
+        The position of the buffer's first byte in the keyed data,
+        used to continue the key across chunks. Defaults to 0.
+
+    Returns
+    -------
+    None.
+
+    """
     d = np.frombuffer(data, dtype=np.uint8)
-    k = np.frombuffer(key * (len(data) // len(key) + 1), dtype=np.uint8)[:len(data)]
-    return (d ^ k).tobytes()
+    
+    if len(key) == 1:
+        np.bitwise_xor(d, key[0], out=d)
+        return
+    
+    offset %= len(key)
+    key = key[offset:] + key[:offset]
+    # rows span whole key periods, wide enough to vectorize well
+    k = np.frombuffer(key * max(1, 4096 // len(key)), dtype=np.uint8)
+    size = len(k)
+    
+    # xor whole rows, then the remainder
+    end = len(d) - len(d) % size
+    rows = d[:end].reshape(-1, size)
+    np.bitwise_xor(rows, k, out=rows)
+    
+    tail = d[end:]
+    np.bitwise_xor(tail, k[:len(tail)], out=tail)
+
+
+def xor(data: bytes, key: bytes) -> bytes:
+    result = bytearray(data)
+    xor_inplace(result, key)
+    return bytes(result)
 
 
 def decompress_string(
-        string:str,
+        string:str|bytes|memoryview,
         xor_key:Optional[bytes]=None,
         compression:Optional[Literal["zlib","gzip","deflate","auto"]]="auto",
         ) -> str:
     
-    byte_stream = string.encode()
-    
     if xor_key is not None:
-        byte_stream = xor(byte_stream, key=xor_key)
+        byte_stream = bytearray(string, "utf-8") if isinstance(string, str) else bytearray(string)
+        xor_inplace(byte_stream, key=xor_key)
+    else:
+        # bytes-like input, such as a slice of a mapped file, is decoded without a str copy
+        byte_stream = string.encode() if isinstance(string, str) else string
     
     byte_stream = base64.urlsafe_b64decode(byte_stream)
     
@@ -88,29 +162,528 @@ def compress_string(
         string:str,
         xor_key:Optional[bytes]=None,
         compression:Optional[Literal["zlib","gzip","deflate"]]="gzip",
-        level:int=6
+        level:int=6,
+        block_size:Optional[int]=None,
+        workers:Optional[int]=None
         ) -> str:
-    
+    """
+    Compresses and encodes a string.
+
+    Parameters
+    ----------
+    string : str
+        The string to compress.
+    xor_key : bytes, optional
+        The key to cipher the compressed string with.
+    compression : Literal["zlib","gzip","deflate"], optional
+        The compression method. Defaults to "gzip".
+    level : int, optional
+        The compression level. Defaults to 6.
+    block_size : int, optional
+        If provided, the string is compressed in independent deflate blocks of this many bytes,
+        see compress_blocks. Defaults to None.
+    workers : int, optional
+        The number of threads compressing blocks, only used with block_size. Defaults to None.
+
+    Returns
+    -------
+    str
+        The compressed string.
+
+    """
     byte_stream = string.encode()
     
+    if block_size is not None:
+        if workers is not None and workers > 1 and len(byte_stream) > block_size:
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                byte_stream = compress_blocks(byte_stream, compression, level, block_size, executor.map)
+        else:
+            byte_stream = compress_blocks(byte_stream, compression, level, block_size)
+    else:
+        match compression:
+            case 'zlib':
+                byte_stream = zlib.compress(byte_stream, wbits=zlib.MAX_WBITS, level=level)
+            case 'gzip':
+                byte_stream = gzip.compress(byte_stream, compresslevel=level, mtime=0)
+            case 'deflate':
+                byte_stream = zlib.compress(byte_stream, wbits=-zlib.MAX_WBITS, level=level)
+            case None:
+                pass
+            case _:
+                raise ValueError(f"unsupported compression method: {compression}")
+    
+    return encode_bytes(byte_stream, xor_key=xor_key)
+
+
+def encode_bytes(byte_stream:bytes, xor_key:Optional[bytes]=None) -> str:
+    
+    byte_stream = base64.urlsafe_b64encode(byte_stream)
+    
+    if xor_key is not None:
+        byte_stream = bytearray(byte_stream)
+        xor_inplace(byte_stream, key=xor_key)
+    
+    return byte_stream.decode()
+
+
+def compress_strings(
+        strings:Iterable[str],
+        workers:Optional[int]=None,
+        xor_key:Optional[bytes]=None,
+        compression:Optional[Literal["zlib","gzip","deflate"]]="gzip",
+        level:int=6,
+        block_size:Optional[int]=None
+        ) -> list[str]:
+    """
+    Compresses several strings concurrently, zlib releases the GIL while compressing.
+
+    Parameters
+    ----------
+    strings : Iterable[str]
+        The strings to compress.
+    workers : int, optional
+        The number of threads. Compresses in this thread if None or 1. Defaults to None.
+    xor_key : bytes, optional
+        The key to cipher the compressed strings with.
+    compression : Literal["zlib","gzip","deflate"], optional
+        The compression method. Defaults to "gzip".
+    level : int, optional
+        The compression level. Defaults to 6.
+    block_size : int, optional
+        If provided, strings longer than this are compressed in independent deflate blocks,
+        which are shared out between the threads like the other strings. Defaults to None.
+
+    Returns
+    -------
+    list[str]
+        The compressed strings, in order.
+
+    """
+    compress = partial(compress_string, xor_key=xor_key, compression=compression, level=level)
+    strings = list(strings)
+    # the output does not depend on the number of workers
+    large = [block_size is not None and len(string) > block_size for string in strings]
+    
+    if workers is None or workers <= 1:
+        return [
+            compress(string, block_size=block_size if is_large else None) 
+            for string, is_large in zip(strings, large)
+            ]
+    
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        futures = [
+            None if is_large else executor.submit(compress, string)
+            for string, is_large in zip(strings, large)
+            ]
+        # blocks of large strings are queued behind the small strings
+        return [
+            encode_bytes(
+                compress_blocks(string.encode(), compression, level, block_size, executor.map), xor_key=xor_key
+                ) if future is None else future.result()
+            for string, future in zip(strings, futures)
+            ]
+
+
+COMPRESS_BLOCK_SIZE = 1 << 20
+DEFLATE_WINDOW = 1 << 15
+
+# set to a list while content is saved with workers, see PlistLoaderMixin.save
+# gzip strings append themselves instead of compressing, and are compressed together afterwards
+DEFERRED_COMPRESSION: ContextVar[Optional[list]] = ContextVar("deferred_compression", default=None)
+
+
+def _deflate_block(level:int, block:memoryview, zdict:bytes, last:bool) -> bytes:
+    # a sync flush ends the block on a byte boundary, so that the next block can be appended to it
+    # the first block has no preceding window, zlib rejects an empty dictionary
+    kwargs = {"zdict": zdict} if zdict else {}
+    compressor = zlib.compressobj(level, zlib.DEFLATED, -zlib.MAX_WBITS, **kwargs)
+    return compressor.compress(block) + compressor.flush(zlib.Z_FINISH if last else zlib.Z_SYNC_FLUSH)
+
+
+def compress_blocks(
+        data:bytes,
+        compression:Optional[Literal["zlib","gzip","deflate"]]="gzip",
+        level:int=6,
+        block_size:int=COMPRESS_BLOCK_SIZE,
+        map_func:Callable=map
+        ) -> bytes:
+    """
+    Compresses data in independent deflate blocks, concatenated into a single valid stream.
+    
+    Each block is primed with the window preceding it, so blocks can be compressed concurrently 
+    at a small cost in ratio. The output only depends on the block size, not on how blocks are mapped.
+
+    Parameters
+    ----------
+    data : bytes
+        The data to compress.
+    compression : Literal["zlib","gzip","deflate"], optional
+        The stream format. Defaults to "gzip".
+    level : int, optional
+        The compression level. Defaults to 6.
+    block_size : int, optional
+        The number of bytes per block. Defaults to COMPRESS_BLOCK_SIZE.
+    map_func : Callable, optional
+        Maps the block compression function over the blocks, such as Executor.map. Defaults to map.
+
+    Returns
+    -------
+    bytes
+        The compressed data.
+
+    """
+    if compression not in COMPRESS_WBITS:
+        raise ValueError(f"unsupported compression method: {compression}")
+    
+    if compression is None:
+        return data
+    
+    if block_size <= 0:
+        raise ValueError(f"block size must be positive, got {block_size}")
+    
+    view = memoryview(data)
+    starts = range(0, len(data) or 1, block_size)
+    last = starts[-1]
+    
+    body = b"".join(map_func(
+        partial(_deflate_block, level),
+        (view[start:start+block_size] for start in starts),
+        (bytes(view[max(0, start-DEFLATE_WINDOW):start]) for start in starts),
+        (start == last for start in starts)
+        ))
+    
     match compression:
-        case 'zlib':
-            byte_stream = zlib.compress(byte_stream, wbits=zlib.MAX_WBITS, level=level)
         case 'gzip':
-            byte_stream = gzip.compress(byte_stream, compresslevel=level, mtime=0)
+            flags = 2 if level == 9 else 4 if level == 1 else 0
+            header = b"\x1f\x8b\x08\x00\x00\x00\x00\x00" + bytes((flags, 255))
+            trailer = zlib.crc32(data).to_bytes(4, "little") + (len(data) & 0xFFFFFFFF).to_bytes(4, "little")
+        case 'zlib':
+            flags = (0 if level in (0, 1) else 1 if 2 <= level < 6 else 2 if level in (6, -1) else 3) << 6
+            flags += (31 - (0x7800 + flags) % 31) % 31
+            header = bytes((0x78, flags))
+            trailer = zlib.adler32(data).to_bytes(4, "big")
         case 'deflate':
-            byte_stream = zlib.compress(byte_stream, wbits=-zlib.MAX_WBITS, level=level)
-        case None:
-            pass
-        case _:
-            raise ValueError(f"unsupported compression method: {compression}")
+            header = trailer = b""
+    
+    return header + body + trailer
+
+
+B64_ALPHABET = b"ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz0123456789+/-_="
+# bytes skipped by non-strict base64 decoding, removed before splitting input into aligned blocks
+B64_IGNORED = bytes(sorted(set(range(256)) - set(B64_ALPHABET)))
+
+DECOMPRESS_WBITS = {
+    "zlib": zlib.MAX_WBITS,
+    "gzip": 16 + zlib.MAX_WBITS,
+    "deflate": -zlib.MAX_WBITS,
+    "auto": 32 + zlib.MAX_WBITS,
+    None: None
+    }
+
+COMPRESS_WBITS = {
+    "zlib": zlib.MAX_WBITS,
+    "gzip": 16 + zlib.MAX_WBITS,
+    "deflate": -zlib.MAX_WBITS,
+    None: None
+    }
+
+
+class StringDecompressor:
+    """
+    Incrementally decompresses a string, streaming equivalent of decompress_string.
+    
+    Mirrors zlib decompression objects, decompress() may be called with chunks of any size.
+
+    Parameters
+    ----------
+    xor_key : bytes, optional
+        The key the compressed string is ciphered with.
+    compression : Literal["zlib","gzip","deflate","auto"], optional
+        The compression method. Defaults to "auto".
+    """
+    
+    def __init__(
+            self,
+            xor_key:Optional[bytes]=None,
+            compression:Optional[Literal["zlib","gzip","deflate","auto"]]="auto"
+            ):
+        
+        if compression not in DECOMPRESS_WBITS:
+            raise ValueError(f"unsupported decompression method: {compression}")
+        
+        self.xor_key = xor_key
+        self.compression = compression
+        self.wbits = DECOMPRESS_WBITS[compression]
+        self.decompressor = None if self.wbits is None else zlib.decompressobj(wbits=self.wbits)
+        self.decoder = codecs.getincrementaldecoder("utf-8")(errors="ignore")
+        self.offset = 0
+        self.carry = b""
+    
+    
+    def _inflate(self, data:bytes) -> bytes:
+        
+        decompressor = self.decompressor
+        
+        if decompressor is None:
+            return data
+        
+        result = decompressor.decompress(data)
+        
+        # gzip data may contain several members
+        while self.compression == "gzip" and decompressor.eof and decompressor.unused_data:
+            data = decompressor.unused_data
+            decompressor = self.decompressor = zlib.decompressobj(wbits=self.wbits)
+            result += decompressor.decompress(data)
             
-    byte_stream = base64.urlsafe_b64encode(byte_stream)
+        return result
     
-    if xor_key is not None:
-        byte_stream = xor(byte_stream, key=xor_key)
     
-    return byte_stream.decode()
+    def decompress(self, chunk:str|bytes) -> str:
+        
+        data = bytearray(chunk, "utf-8") if isinstance(chunk, str) else bytearray(chunk)
+        
+        if self.xor_key is not None:
+            xor_inplace(data, self.xor_key, self.offset)
+            self.offset += len(data)
+        
+        data = self.carry + data.translate(None, B64_IGNORED)
+        end = len(data) - len(data) % 4
+        self.carry = data[end:]
+        
+        if not end:
+            return ""
+        
+        return self.decoder.decode(self._inflate(base64.urlsafe_b64decode(data[:end])))
+    
+    
+    def flush(self) -> str:
+        
+        data = self._inflate(base64.urlsafe_b64decode(self.carry)) if self.carry else b""
+        self.carry = b""
+        
+        if (decompressor := self.decompressor) is not None:
+            data += decompressor.flush()
+            
+            if not decompressor.eof:
+                raise zlib.error("Error -5 while decompressing data: incomplete or truncated stream")
+        
+        return self.decoder.decode(data, final=True)
+
+
+class StringCompressor:
+    """
+    Incrementally compresses a string, streaming equivalent of compress_string.
+    
+    Mirrors zlib compression objects, the concatenated output is identical to compress_string.
+
+    Parameters
+    ----------
+    xor_key : bytes, optional
+        The key to cipher the compressed string with.
+    compression : Literal["zlib","gzip","deflate"], optional
+        The compression method. Defaults to "gzip".
+    level : int, optional
+        The compression level. Defaults to 6.
+    """
+    
+    def __init__(
+            self,
+            xor_key:Optional[bytes]=None,
+            compression:Optional[Literal["zlib","gzip","deflate"]]="gzip",
+            level:int=6
+            ):
+        
+        if compression not in COMPRESS_WBITS:
+            raise ValueError(f"unsupported compression method: {compression}")
+        
+        wbits = COMPRESS_WBITS[compression]
+        
+        self.xor_key = xor_key
+        self.compressor = None if wbits is None else zlib.compressobj(level, zlib.DEFLATED, wbits)
+        self.offset = 0
+        self.carry = b""
+    
+    
+    def _encode(self, data:bytes, final:bool=False) -> str:
+        
+        data = self.carry + data
+        end = len(data) if final else len(data) - len(data) % 3
+        self.carry = data[end:]
+        
+        data = bytearray(base64.urlsafe_b64encode(data[:end]))
+        
+        if self.xor_key is not None:
+            xor_inplace(data, self.xor_key, self.offset)
+            self.offset += len(data)
+        
+        return data.decode()
+    
+    
+    def compress(self, chunk:str) -> str:
+        data = chunk.encode()
+        
+        if self.compressor is not None:
+            data = self.compressor.compress(data)
+        
+        return self._encode(data)
+    
+    
+    def flush(self) -> str:
+        data = b"" if self.compressor is None else self.compressor.flush()
+        return self._encode(data, final=True)
+
+
+def iter_decompress(
+        chunks:Iterable[str|bytes],
+        xor_key:Optional[bytes]=None,
+        compression:Optional[Literal["zlib","gzip","deflate","auto"]]="auto"
+        ) -> Iterator[str]:
+    """
+    Decompresses an iterable of string chunks, yielding decompressed string chunks.
+    
+    Streaming equivalent of decompress_string, see StringDecompressor.
+    """
+    decompressor = StringDecompressor(xor_key=xor_key, compression=compression)
+    decompress = decompressor.decompress
+    
+    for chunk in chunks:
+        if string := decompress(chunk):
+            yield string
+    
+    if string := decompressor.flush():
+        yield string
+
+
+def read_chunks(stream, chunk_size:int=1<<20) -> Iterator[str|bytes]:
+    """
+    Reads a file object in chunks until the end of the file.
+    """
+    while chunk := stream.read(chunk_size):
+        yield chunk
+
+
+class ChunkReader:
+    """
+    A read-only file object over an iterable of string chunks.
+    """
+    
+    def __init__(self, chunks:Iterable[str]):
+        self.chunks = iter(chunks)
+        self.buffer = ""
+    
+    
+    def read(self, size:int=-1) -> str:
+        
+        if size is None or size < 0:
+            result = self.buffer + "".join(self.chunks)
+            self.buffer = ""
+            return result
+        
+        while not self.buffer:
+            if (chunk := next(self.chunks, None)) is None:
+                return ""
+            self.buffer = chunk
+        
+        result = self.buffer[:size]
+        self.buffer = self.buffer[size:]
+        
+        return result
+
+
+@contextmanager
+def map_file(path:PathString) -> Iterator[mmap.mmap|bytes]:
+    """
+    Memory maps a file for reading, empty files cannot be mapped and are returned as empty bytes.
+    """
+    with open(path, "rb") as file:
+        if not os.fstat(file.fileno()).st_size:
+            yield b""
+            return
+        
+        with mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+            yield mapped
+
+
+class MappedReader:
+    """
+    A read-only binary file object over a memory mapped file.
+    
+    read() returns memoryview slices of the mapping instead of copies, 
+    each slice is released when the next one is read or the reader is closed,
+    so that the mapping can be closed afterwards.
+    """
+    
+    def __init__(self, buffer:mmap.mmap|bytes, start:int=0):
+        self.view = memoryview(buffer)
+        self.position = start
+        self.chunk = None
+    
+    
+    def read(self, size:int=-1) -> memoryview:
+        
+        self._release_chunk()
+        start = self.position
+        end = len(self.view) if size is None or size < 0 else min(start + size, len(self.view))
+        self.position = end
+        self.chunk = self.view[start:end]
+        
+        return self.chunk
+    
+    
+    def _release_chunk(self):
+        if self.chunk is not None:
+            self.chunk.release()
+            self.chunk = None
+    
+    
+    def close(self):
+        self._release_chunk()
+        self.view.release()
+
+
+class CompressWriter:
+    """
+    A write-only file object that compresses its input into another file object.
+    
+    Writes are batched into chunks of about chunk_size characters before compression,
+    close() writes the remaining data without closing the underlying file.
+    """
+    
+    def __init__(self, stream, compressor:StringCompressor, chunk_size:int=1<<20):
+        self.stream = stream
+        self.compressor = compressor
+        self.chunk_size = chunk_size
+        self.buffer = []
+        self.size = 0
+    
+    
+    def _flush_buffer(self):
+        if self.buffer:
+            self.stream.write(self.compressor.compress("".join(self.buffer)))
+            self.buffer.clear()
+            self.size = 0
+    
+    
+    def write(self, string:str) -> int:
+        
+        self.buffer.append(string)
+        self.size += len(string)
+        
+        if self.size >= self.chunk_size:
+            self._flush_buffer()
+        
+        return len(string)
+    
+    
+    def writelines(self, strings:Iterable[str]):
+        write = self.write
+        for string in strings:
+            write(string)
+    
+    
+    def close(self):
+        self._flush_buffer()
+        self.stream.write(self.compressor.flush())
 
 
 def read_plist(node:Element) -> int|bool|float|str|dict|list:
@@ -146,8 +719,149 @@ def read_plist(node:Element) -> int|bool|float|str|dict|list:
             raise ValueError(f"unknown node tag: {node.tag} for node {node}")
             
 
+# set while a plist is written directly as text, see PlistDecoderMixin.to_string
+DIRECT_WRITE = ContextVar("direct_write", default=False)
+
+
+def escape_text(text:str) -> str:
+    # same escaping as ElementTree applies to element text
+    if "&" in text:
+        text = text.replace("&", "&amp;")
+    if "<" in text:
+        text = text.replace("<", "&lt;")
+    if ">" in text:
+        text = text.replace(">", "&gt;")
+    return text
+
+
+def write_plist_text(value:Any, write:Callable[[str],Any]) -> bool:
+    """
+    Writes a value as plist text, equivalent to serializing write_plist(value).
+
+    Parameters
+    ----------
+    value : Any
+        The value to write.
+    write : Callable[[str],Any]
+        The function called with each piece of text.
+
+    Returns
+    -------
+    bool
+        False if the value is omitted, same as write_plist returning None.
+    """
+    if isinstance(value, bool):
+        if value:
+            write("<t />")
+        return value
+    
+    elif isinstance(value, int):
+        write("<i>" + str(value) + "</i>")
+    
+    elif isinstance(value, float):
+        write("<r>" + from_float(value) + "</r>")
+    
+    elif isinstance(value, str):
+        if value:
+            # written separately, so that long strings are not copied
+            write("<s>")
+            write(escape_text(value))
+            write("</s>")
+        else:
+            write("<s />")
+    
+    elif isinstance(value, dict):
+        empty = True
+        
+        for k, v in value.items():
+            if v is False:
+                continue
+            if empty:
+                write("<d>")
+                empty = False
+            write("<k>" + escape_text(str(k)) + "</k>")
+            write_plist_text(v, write)
+        
+        write("<d />" if empty else "</d>")
+    
+    elif isinstance(value, (list, tuple)):
+        write("<d><k>_isArr</k><t />")
+        
+        for k, v in enumerate(value, start=1):
+            if v is False:
+                continue
+            write(f"<k>k_{k}</k>")
+            write_plist_text(v, write)
+        
+        write("</d>")
+    
+    else:
+        raise ValueError(f"class {type(value)} is not serializable")
+    
+    return True
+
+
+def write_plist_node(node:Element|str|Callable, write:Callable[[str],Any]):
+    """
+    Writes the output of a plist encoder as text.
+    
+    Accepts elements, serialized text or a deferred writer called with the write function,
+    which write_plist and to_node return while writing directly as text.
+    """
+    if isinstance(node, str):
+        write(node)
+    elif callable(node):
+        node(write)
+    else:
+        write(ET.tostring(node, encoding="unicode"))
+
+
+class RawNode:
+    """
+    A plist value left undecoded by a key projection, saved back as its original element.
+    """
+    
+    __slots__ = ("node",)
+    
+    def __init__(self, node:Element):
+        self.node = node.finish() if isinstance(node, StreamNode) else node
+    
+    
+    def decode(self, decoder:Callable, key:str) -> tuple[str,Any]:
+        """
+        Decodes the node with a plist dict decoder, returning the decoded key and value.
+        """
+        return decoder(key, self.node)
+    
+    
+    def __eq__(self, other):
+        if not isinstance(other, RawNode):
+            return NotImplemented
+        return ET.tostring(self.node) == ET.tostring(other.node)
+    
+    
+    def __repr__(self):
+        return f"{type(self).__name__}(<{self.node.tag}>)"
+
+
+def is_projected(key:str, keys:Optional[set]=None, skip_keys:Optional[set]=None) -> bool:
+    """
+    Returns whether a key is left out by a keys / skip_keys projection.
+    """
+    return (keys is not None and key not in keys) or (skip_keys is not None and key in skip_keys)
+
+
+def xml_declaration_text() -> str:
+    # the declared encoding of unicode output differs between versions, reuse ElementTree's
+    string = ET.tostring(ET.Element("plist"), encoding="unicode", xml_declaration=True)
+    return string[:string.index("\n") + 1]
+
+
 def write_plist(value:Any) -> Element:
     
+    if DIRECT_WRITE.get():
+        return None if value is False else partial(write_plist_text, value)
+    
     if isinstance(value, bool):
         if value: 
             return Element("t")
@@ -198,39 +912,29 @@ def write_plist(value:Any) -> Element:
         raise ValueError(f"class {type(value)} is not serializable")
     
 
-def validate_dict_node(node:ET.Element, is_array:bool=False, encoder_key:Optional[int]=None):
-    
-    if node.tag not in ['d', 'dict']:
-        raise ValueError("element is not a plist dict element")
-    
-    length = len(node)
-    
-    if length % 2 != 0:
-        raise ValueError(f"expected an even number of key-value dict elements, got {length}")
-    
-    if length < 2:
-        if is_array:
-            raise ValueError(f"expected at least 2 header elements for array, found {length}")
-        elif encoder_key is not None:
-            raise ValueError(f"expected at least 2 header elements for encoded dict, found {length}")
-        else:
-            return
-        
-    key_el = node[0]
-    val_el = node[1]
+def validate_dict_header(
+        key_el:Element, 
+        val_el:Element, 
+        is_array:bool=False, 
+        encoder_key:Optional[int]=None
+        ) -> bool:
+    """
+    Validates the first key-value pair of a plist dict element.
     
+    Returns True if the pair is an array or encoded dict header.
+    """
     array_header = key_el.tag == 'k' and key_el.text in ['_isArr','_IsArr'] and val_el.tag == 't' and val_el.text is None
     encoder_header = key_el.tag == 'k' and key_el.text == 'kCEK' and val_el.tag == 'i' and val_el.text is not None
     
     if is_array:
         if not array_header:
             raise ValueError(
-                f"malformed array header, expected '<k>_isArr</k><t />', got '{ET.tostring(key_el).decode()}{ET.tostring(val_el).decode()}'"
+                f"malformed array header, expected '<k>_isArr</k><t />', got '{node_string(key_el)}{node_string(val_el)}'"
                 )
     elif encoder_key is not None:
         if not encoder_header:
             raise ValueError(
-                f"malformed encoded struct header, expected '<k>kCEK</k><i>{encoder_key}</i>', got '{ET.tostring(key_el).decode()}{ET.tostring(val_el).decode()}'"
+                f"malformed encoded struct header, expected '<k>kCEK</k><i>{encoder_key}</i>', got '{node_string(key_el)}{node_string(val_el)}'"
                 )
         elif val_el.text != str(encoder_key):
             raise ValueError(f"encoder key does not match, expected '{encoder_key}', got '{val_el.text}'")
@@ -238,12 +942,75 @@ def validate_dict_node(node:ET.Element, is_array:bool=False, encoder_key:Optiona
         raise ValueError("expected plain dict, found array header")
     elif encoder_header:
         raise ValueError("expected plain dict, found encoded dict header")
+    
+    return is_array or encoder_key is not None
+
+
+def validate_dict_node(node:ET.Element, is_array:bool=False, encoder_key:Optional[int]=None):
+    
+    if node.tag not in ['d', 'dict']:
+        raise ValueError("element is not a plist dict element")
+    
+    length = len(node)
+    
+    if length % 2 != 0:
+        raise ValueError(f"expected an even number of key-value dict elements, got {length}")
+    
+    if length < 2:
+        if is_array:
+            raise ValueError(f"expected at least 2 header elements for array, found {length}")
+        elif encoder_key is not None:
+            raise ValueError(f"expected at least 2 header elements for encoded dict, found {length}")
+        else:
+            return
+    
+    validate_dict_header(node[0], node[1], is_array=is_array, encoder_key=encoder_key)
         
     for i in range(0, length, 2):
         if node[i].tag != 'k':
             raise ValueError(f"expected key tag 'k' at index {i}, got '{node[i].tag}'")
 
 
+def iter_dict_node(
+        node:Element, 
+        is_array:bool=False, 
+        encoder_key:Optional[int]=None
+        ) -> Iterator[tuple[Element,Element]]:
+    """
+    Iterates over the key-value element pairs of a plist dict element, skipping its header.
+    
+    Performs the same checks as validate_dict_node while iterating, 
+    so that stream nodes are validated without being parsed in full.
+    """
+    if node.tag not in ['d', 'dict']:
+        raise ValueError("element is not a plist dict element")
+    
+    children = iter(node)
+    length = 0
+    
+    for key_el in children:
+        val_el = next(children, None)
+        
+        if val_el is None:
+            raise ValueError(f"expected an even number of key-value dict elements, got {length + 1}")
+        
+        if key_el.tag != 'k':
+            raise ValueError(f"expected key tag 'k' at index {length}, got '{key_el.tag}'")
+        
+        length += 2
+        
+        if length == 2 and validate_dict_header(key_el, val_el, is_array=is_array, encoder_key=encoder_key):
+            continue
+        
+        yield key_el, val_el
+    
+    if length < 2:
+        if is_array:
+            raise ValueError(f"expected at least 2 header elements for array, found {length}")
+        elif encoder_key is not None:
+            raise ValueError(f"expected at least 2 header elements for encoded dict, found {length}")
+
+
 def get_plist_root(node:ET.Element) -> ET.Element:
     if node.tag != "plist":
         raise ValueError(f"expected root node to be <plist>, got <{node.tag}> instead")
@@ -256,6 +1023,461 @@ def get_plist_root(node:ET.Element) -> ET.Element:
     return root
 
 
+class StreamNode:
+    """
+    A plist element that is parsed on demand from a stream of pull parser events.
+    
+    Iterating over the node yields its children as stream nodes while they are parsed,
+    each child is discarded once the next one is requested, so a fully iterated node 
+    never holds more than one child in memory.
+    Any other access to the node's text or children parses its remaining subtree first.
+    """
+    
+    __slots__ = ("element", "events", "done", "current")
+    
+    def __init__(self, element:Element, events:Iterator[tuple[str,Element]]):
+        self.element = element
+        self.events = events
+        self.done = False
+        self.current = None
+    
+    
+    @property
+    def tag(self) -> str:
+        return self.element.tag
+    
+    
+    @property
+    def text(self) -> Optional[str]:
+        return self.finish().text
+    
+    
+    def finish(self) -> Element:
+        """
+        Parses the remaining subtree of the node and returns its element.
+        """
+        if not self.done:
+            if self.current is not None:
+                self.current.finish()
+            
+            element = self.element
+            
+            for event, node in self.events:
+                if event == "end" and node is element:
+                    break
+            
+            self.done = True
+        
+        return self.element
+    
+    
+    def close(self):
+        """
+        Parses the remaining subtree and drains the rest of the stream, raising any parser errors.
+        """
+        self.finish()
+        
+        for _ in self.events:
+            pass
+    
+    
+    def __iter__(self) -> Iterator[Self|Element]:
+        
+        if self.done:
+            yield from self.element
+            return
+        
+        element = self.element
+        events = self.events
+        
+        for event, node in events:
+            # a child's events are consumed before the next one is read, any end event is this node's
+            if event == "end":
+                break
+            
+            child = type(self)(node, events)
+            self.current = child
+            
+            yield child
+            
+            child.finish()
+            self.current = None
+            element.remove(node)
+        
+        self.done = True
+    
+    
+    def __len__(self) -> int:
+        return len(self.finish())
+    
+    
+    def __getitem__(self, index:int) -> Element:
+        return self.finish()[index]
+    
+    
+    def find(self, path:str) -> Optional[Element]:
+        return self.finish().find(path)
+
+
+def iter_plist_events(string:str|Iterable[str], chunk_size:int=1<<16) -> Iterator[tuple[str,Element]]:
+    """
+    Parses a plist string or an iterable of string chunks incrementally, yielding start and end events.
+    """
+    parser = ET.XMLPullParser(events=("start", "end"))
+    feed = parser.feed
+    read_events = parser.read_events
+    
+    if isinstance(string, str):
+        chunks = (string[i:i+chunk_size] for i in range(0, len(string), chunk_size))
+    else:
+        chunks = string
+    
+    for chunk in chunks:
+        feed(chunk)
+        yield from read_events()
+    
+    parser.close()
+    yield from read_events()
+
+
+def stream_plist_root(string:str|Iterable[str]) -> StreamNode:
+    """
+    Returns the root dict of a plist string or an iterable of string chunks as a stream node,
+    equivalent to get_plist_root(ET.fromstring(string)).
+    """
+    events = iter_plist_events(string)
+    
+    _, node = next(events)
+    
+    if node.tag != "plist":
+        raise ValueError(f"expected root node to be <plist>, got <{node.tag}> instead")
+    
+    for event, node in events:
+        if event == "end":
+            break
+        
+        child = StreamNode(node, events)
+        
+        if node.tag == "dict":
+            return child
+        
+        child.finish()
+    
+    raise ValueError("plist does not contain a <dict> sub-element")
+
+
+def node_string(node:Element) -> str:
+    if isinstance(node, StreamNode):
+        node = node.finish()
+    return ET.tostring(node).decode()
+
+
+PLIST_KEY = re.compile(r"\s*<k>([^<]*)</k>\s*")
+PLIST_TAG = re.compile(r"\s*<([A-Za-z]+)\s*(/?)>")
+PLIST_END = re.compile(r"\s*</([A-Za-z]+)>")
+PLIST_CONTAINERS = {"d", "dict", "a", "array"}
+
+
+@typed_cache()
+def element_tag_pattern(tag:str) -> re.Pattern:
+    return re.compile(f"<(/?){tag}>")
+
+
+def find_element_end(string:str, start:int) -> int:
+    """
+    Returns the end position of the plist element starting at start.
+    
+    Only scans for the element's tags, since plist text never contains '<',
+    values are skipped without being parsed.
+    """
+    match = PLIST_TAG.match(string, start)
+    
+    if match is None:
+        raise ValueError(f"expected a plist element at position {start}")
+    
+    if match.group(2):
+        return match.end()
+    
+    tag = match.group(1)
+    
+    if tag not in PLIST_CONTAINERS:
+        end = string.find(f"</{tag}>", match.end())
+        
+        if end < 0:
+            raise ValueError(f"element <{tag}> at position {start} is not closed")
+        
+        return end + len(tag) + 3
+    
+    depth = 1
+    
+    for tag_match in element_tag_pattern(tag).finditer(string, match.end()):
+        if tag_match.group(1):
+            depth -= 1
+            if not depth:
+                return tag_match.end()
+        else:
+            depth += 1
+    
+    raise ValueError(f"element <{tag}> at position {start} is not closed")
+
+
+def iter_dict_spans(string:str, start:int) -> Iterator[tuple[str,int,int]]:
+    """
+    Iterates over the keys and value spans of the plist dict element starting at start.
+    
+    Values are not parsed, ET.fromstring(string[start:end]) parses a single value.
+    """
+    match = PLIST_TAG.match(string, start)
+    
+    if match is None or match.group(1) not in ("d", "dict"):
+        raise ValueError(f"expected a plist dict element at position {start}")
+    
+    if match.group(2):
+        return
+    
+    tag = match.group(1)
+    pos = match.end()
+    
+    while (key := PLIST_KEY.match(string, pos)) is not None:
+        value_start = key.end()
+        pos = find_element_end(string, value_start)
+        yield key.group(1), value_start, pos
+    
+    end = PLIST_END.match(string, pos)
+    
+    if end is None or end.group(1) != tag:
+        raise ValueError(f"expected a key or </{tag}> at position {pos}")
+
+
+def find_dict_value(string:str, start:int, key:str) -> Optional[int]:
+    """
+    Returns the start position of a key's value in the plist dict element starting at start,
+    or None if the key is missing. Values before the key are skipped without being parsed.
+    """
+    match = PLIST_TAG.match(string, start)
+    
+    if match is None or match.group(1) not in ("d", "dict"):
+        raise ValueError(f"expected a plist dict element at position {start}")
+    
+    if match.group(2):
+        return None
+    
+    pos = match.end()
+    
+    while (value_key := PLIST_KEY.match(string, pos)) is not None:
+        if value_key.group(1) == key:
+            return value_key.end()
+        
+        pos = find_element_end(string, value_key.end())
+    
+    return None
+
+
+@typed_cache()
+def dict_scan_pattern(keys:frozenset) -> re.Pattern:
+    names = "|".join(map(re.escape, sorted(keys)))
+    return re.compile(f"<k>({names})</k>|<(/?)d>|<d ?/>")
+
+
+def scan_dict_items(
+        string:str, 
+        start:int, 
+        keys:frozenset=frozenset()
+        ) -> tuple[list[tuple[int,int,dict[str,tuple[int,int]]]],int]:
+    """
+    Scans the dict values of the plist <d> element starting at start in a single pass.
+    
+    Other values, such as array headers, are skipped.
+    Values are not parsed, ET.fromstring(string[start:end]) parses a single value.
+
+    Parameters
+    ----------
+    string : str
+        The plist text.
+    start : int
+        The start position of the element.
+    keys : frozenset, optional
+        The keys to locate inside each dict value.
+
+    Returns
+    -------
+    items : list[tuple[int,int,dict[str,tuple[int,int]]]]
+        The start and end position of each dict value, 
+        with the value spans of the given keys found directly inside it.
+    end : int
+        The end position of the element.
+    """
+    match = PLIST_TAG.match(string, start)
+    
+    if match is None or match.group(1) != "d":
+        raise ValueError(f"expected a plist <d> element at position {start}")
+    
+    if match.group(2):
+        return [], match.end()
+    
+    items = []
+    depth = 1
+    
+    for tag in dict_scan_pattern(keys).finditer(string, match.end()):
+        
+        if (key := tag.group(1)) is not None:
+            if depth == 2:
+                value_start = tag.end()
+                values[key] = (value_start, find_element_end(string, value_start))
+        
+        elif tag.group(2) is None:
+            if depth == 1:
+                items.append((tag.start(), tag.end(), {}))
+        
+        elif tag.group(2):
+            depth -= 1
+            if depth == 1:
+                items.append((item_start, tag.end(), values))
+            elif not depth:
+                return items, tag.end()
+        
+        else:
+            depth += 1
+            if depth == 2:
+                item_start = tag.start()
+                values = {}
+    
+    raise ValueError(f"element <d> at position {start} is not closed")
+
+
+@typed_cache()
+def item_split_pattern(key:str) -> re.Pattern:
+    return re.compile(f"<k>{re.escape(key)}</k>|<(/?)d>|<d ?/>")
+
+
+def split_dict_items(
+        chunks:str|Iterable[str|bytes], 
+        key:str,
+        replacement:str="<d />"
+        ) -> tuple[str,Optional[list[str]]]:
+    """
+    Cuts the items of a root dict value out of plist text in a single streaming pass.
+    
+    The value of key in the root dict must be a <d> element, its items are returned as
+    separate strings and the value is replaced in the remaining text.
+    Only the remaining text, the items and about one chunk are held in memory,
+    the chunks are never joined into the full text.
+
+    Parameters
+    ----------
+    chunks : str | Iterable[str|bytes]
+        The plist text, or chunks of it. Byte chunks are decoded as utf-8 and may be reused by the caller.
+    key : str
+        The root dict key of the value to split.
+    replacement : str, optional
+        The text replacing the value. Defaults to an empty dict.
+
+    Raises
+    ------
+    ValueError
+        If the value is not closed.
+
+    Returns
+    -------
+    text : str
+        The plist text without the items, or the full text if the key is missing or not a <d> element.
+    items : list[str] | None
+        The text of every <d> item of the value, None if the key is missing or not a <d> element.
+    """
+    if isinstance(chunks, str):
+        chunks = (chunks,)
+    
+    pattern = item_split_pattern(key)
+    # tags can be split between chunks, this many characters are scanned again with the next chunk
+    tail = len(key) + 8
+    decoder = codecs.getincrementaldecoder("utf-8")()
+    
+    outside = []
+    items = None
+    item = []
+    # where the text goes, outside, item, or None between items
+    sink = outside
+    depth = 0
+    # the end of the key, while its value has not been reached
+    found = None
+    buffer = ""
+    
+    for chunk in chunks:
+        if not isinstance(chunk, str):
+            chunk = decoder.decode(chunk)
+        
+        buffer += chunk
+        pos = scanned = 0
+        
+        for tag in pattern.finditer(buffer):
+            start, end = tag.span()
+            closing = tag.group(1)
+            
+            if found is not None:
+                value = closing == "" and not buffer[found:start].strip()
+                found = None
+                
+                if value:
+                    outside.append(buffer[pos:start])
+                    outside.append(replacement)
+                    pos = scanned = end
+                    items = []
+                    sink = None
+                    depth += 1
+                    continue
+            
+            if closing is None and tag.group(0).startswith("<k>"):
+                # keys of the root dict have no dict around them
+                if not depth and items is None:
+                    found = end
+            
+            elif closing is None:
+                if depth == 1 and sink is None and items is not None:
+                    items.append(tag.group(0))
+            
+            elif closing:
+                depth -= 1
+                
+                if depth == 1 and sink is item:
+                    item.append(buffer[pos:end])
+                    items.append("".join(item))
+                    item.clear()
+                    pos = end
+                    sink = None
+                
+                elif not depth and sink is None and items is not None:
+                    pos = end
+                    sink = outside
+            
+            else:
+                if depth == 1 and sink is None and items is not None:
+                    pos = start
+                    sink = item
+                
+                depth += 1
+            
+            scanned = end
+        
+        keep = max(scanned, len(buffer) - tail)
+        
+        if found is not None:
+            found = 0 if not buffer[found:keep].strip() else None
+        
+        if sink is not None and keep > pos:
+            sink.append(buffer[pos:keep])
+        
+        buffer = buffer[keep:]
+    
+    decoder.decode(b"", final=True)
+    
+    if sink is not outside:
+        raise ValueError(f"value of key '{key}' is not closed")
+    
+    outside.append(buffer)
+    
+    return "".join(outside), items
+
+
 def from_plist_string(string: str) -> dict:
     tree = ET.fromstring(string)
     return read_plist(tree.find("dict"))
@@ -312,6 +1534,237 @@ def encoder_from_type(type_hint:Any):
     raise ValueError(f"unsupported type hint: {type_hint}")
 
 
+def field_error(
+        cls,
+        action:str,
+        names:Sequence[str],
+        functions:Sequence[Callable],
+        values:Sequence[Any],
+        error:Exception
+        ) -> Exception:
+    """
+    Returns the error of a generated dataclass method, naming the field that failed.
+    
+    The field is found by calling each field function again, which only happens after a failure. 
+    The original error is returned if no field fails.
+    """
+    for name, function, value in zip(names, functions, values):
+        try:
+            function(value)
+        except Exception:
+            field = f"field '{name}': '{value}'" if action == "decode" else f"field '{name}'"
+            new = ValueError(f"[{cls.__name__}] failed to {action} {field}")
+            new.__cause__ = error
+            return new
+    
+    return error
+
+
+def compile_dataclass_tokens(
+        cls, 
+        decoders:dict[str,Callable],
+        encoders:dict[str,Callable],
+        dkey_dict:dict[str,str],
+        ekey_dict:dict[str,str],
+        cond_dict:dict[str,Any],
+        decode:bool=True,
+        encode:bool=True
+        ) -> None:
+    """
+    Generates from_tokens and to_tokens methods specialised to the fields of a dataclass decoder.
+    
+    The generated methods decode and encode every field inline, 
+    calling the constructor positionally for array dataclasses. 
+    They return the same results as the generic DataclassDecoderMixin methods, 
+    which they defer to for subclasses, custom decoders, encoders or conditions, 
+    and for token layouts they do not handle, so that those are reported the same way.
+    Field errors are raised with the failing field, other errors propagate.
+    
+    Classes that define their own from_tokens or to_tokens keep them.
+
+    Parameters
+    ----------
+    cls : type
+        The dataclass, with its DECODER, ENCODER and CONDITION set.
+    decoders : dict[str,Callable]
+        Maps field names to decoders.
+    encoders : dict[str,Callable]
+        Maps field names to encoders.
+    dkey_dict : dict[str,str]
+        Maps serialization keys to field names.
+    ekey_dict : dict[str,str]
+        Maps field names to serialization keys.
+    cond_dict : dict[str,Any]
+        Maps optional field names to their default value.
+    decode : bool, optional
+        Whether to generate from_tokens. Defaults to True.
+    encode : bool, optional
+        Whether to generate to_tokens. Defaults to True.
+
+    Returns
+    -------
+    None.
+
+    """
+    from gmdkit.serialization.mixins import DataclassDecoderMixin
+    
+    generic_from = DataclassDecoderMixin.__dict__["from_tokens"].__func__
+    generic_to = DataclassDecoderMixin.__dict__["to_tokens"]
+    
+    inherited_from = getattr(getattr(cls, "from_tokens", None), "__func__", None)
+    inherited_to = getattr(cls, "to_tokens", None)
+    
+    decode = decode and (inherited_from is generic_from or hasattr(inherited_from, "generic"))
+    encode = encode and (inherited_to is generic_to or hasattr(inherited_to, "generic"))
+    
+    fields = get_fields(cls)
+    from_array = cls.FROM_ARRAY
+    count = len(fields)
+    
+    if not count:
+        return
+    
+    names = [f.name for f in fields]
+    namespace = {
+        "C": cls, "call": call, "generic_from": generic_from, "generic_to": generic_to, 
+        "field_error": field_error, "NAMES": tuple(names),
+        }
+    lines = []
+    
+    for i, name in enumerate(names):
+        namespace[f"d{i}"] = decoders[name]
+        namespace[f"e{i}"] = encoders[name]
+        namespace[f"D{i}"] = cond_dict.get(name)
+        namespace[f"K{i}"] = ekey_dict.get(name) if ekey_dict else name
+    
+    if from_array and (dkey_dict or not all(f.init and not f.kw_only for f in fields)):
+        decode = False
+    
+    if decode:
+        lines += [
+            "def from_tokens(cls, tokens, decoder=None, **kwargs):",
+            "    if cls is not C or decoder is not None:",
+            "        return generic_from(cls, tokens, decoder=decoder, **kwargs)",
+            ]
+        
+        if from_array:
+            namespace["DECODERS"] = tuple(decoders[name] for name in names)
+            lines += [
+                f"    if len(tokens) == {count}:",
+                f"        {', '.join(f't{i}' for i in range(count))}, = tokens",
+                "        try:",
+                f"            args = {', '.join(f'd{i}(t{i})' for i in range(count))},",
+                "        except Exception as e:",
+                "            raise field_error(cls, 'decode', NAMES, DECODERS, tokens, e)",
+                "        return cls(*args)",
+                f"    if len(tokens) < {count}:",
+                "        try:",
+                "            args = tuple(map(call, DECODERS, tokens))",
+                "        except Exception as e:",
+                "            raise field_error(cls, 'decode', NAMES, DECODERS, tokens, e)",
+                "        return cls(*args)",
+                ]
+        else:
+            if dkey_dict:
+                namespace["TABLE"] = {key: (name, decoders[name]) for key, name in dkey_dict.items()}
+            else:
+                namespace["TABLE"] = {name: (name, decoders[name]) for name in names}
+            lines += [
+                f"    if len(tokens) <= {count * 2} and not len(tokens) % 2:",
+                "        args = {}",
+                "        it = iter(tokens)",
+                "        for key, value in zip(it, it):",
+                "            entry = TABLE.get(key)",
+                "            if entry is None:",
+                "                return generic_from(cls, tokens, **kwargs)",
+                "            try:",
+                "                args[entry[0]] = entry[1](value)",
+                "            except Exception as e:",
+                "                raise ValueError(f\"[{cls.__name__}] failed to decode key '{key}'\") from e",
+                "        return cls(**args)",
+                ]
+        
+        lines += [
+            "    return generic_from(cls, tokens, **kwargs)",
+            "",
+            ]
+    
+    if encode:
+        lines += [
+            "def to_tokens(self, condition=None, encoder=None):",
+            "    if type(self) is not C or condition is not None or encoder is not None:",
+            "        return generic_to(self, condition=condition, encoder=encoder)",
+            *(f"    v{i} = self.{name}" for i, name in enumerate(names)),
+            "    try:",
+            ]
+        
+        if from_array:
+            # trailing optional fields equal to their default are left out
+            def tokens(end):
+                return f"[{', '.join(f'e{i}(v{i})' for i in range(end))}]"
+            
+            end = count
+            indent = "        "
+            returns = []
+            
+            while end and names[end-1] in cond_dict:
+                lines.append(f"{indent}if D{end-1} == v{end-1}:")
+                returns.append(f"{indent}return {tokens(end)}")
+                indent += "    "
+                end -= 1
+            
+            lines.append(f"{indent}return {tokens(end)}")
+            lines += reversed(returns)
+        else:
+            lines.append("        parts = []")
+            
+            for i, name in enumerate(names):
+                if name in cond_dict:
+                    lines += [
+                        f"        if not D{i} == v{i}:",
+                        f"            parts += (K{i}, e{i}(v{i}))",
+                        ]
+                else:
+                    lines.append(f"        parts += (K{i}, e{i}(v{i}))")
+            
+            lines.append("        return parts")
+        
+        # optional fields left out are not checked for errors either
+        skipped = names[end:] if from_array else cond_dict
+        namespace["NOTHING"] = nothing = object()
+        namespace["ENCODERS"] = tuple(
+            (lambda value, encoder=encoders[name]: None if value is nothing else encoder(value)) 
+            if name in skipped else encoders[name]
+            for name in names
+            )
+        values = ", ".join(
+            f"NOTHING if D{i} == v{i} else v{i}" if name in skipped else f"v{i}"
+            for i, name in enumerate(names)
+            )
+        lines += [
+            "    except Exception as e:",
+            f"        raise field_error(C, 'encode', NAMES, ENCODERS, ({values},), e)",
+            "",
+            ]
+    
+    if not lines:
+        return
+    
+    exec("\n".join(lines), namespace)
+    
+    if decode:
+        func = namespace["from_tokens"]
+        func.generic = generic_from
+        func.__qualname__ = f"{cls.__qualname__}.from_tokens"
+        cls.from_tokens = classmethod(func)
+    
+    if encode:
+        func = namespace["to_tokens"]
+        func.generic = generic_to
+        func.__qualname__ = f"{cls.__qualname__}.to_tokens"
+        cls.to_tokens = func
+
+
 _T = TypeVar("_T")
 
 @overload
@@ -439,6 +1892,11 @@ def dataclass_decoder(
         
         cls.CONDITION = staticmethod(condition or is_default)
         
+        compile_dataclass_tokens(
+            cls, decoders, encoders, dkey_dict, ekey_dict, cond_dict,
+            decode=decoder is None, encode=encoder is None and condition is None
+            )
+        
         return cls
     
     return wrap if cls is None else wrap(cls)
@@ -2,10 +2,13 @@
 from pathlib import Path
 import xml.etree.ElementTree as ET
 from contextlib import contextmanager
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
+from inspect import signature
 from typing import (
     Any, Self, Literal, 
     Optional, 
-    Callable, Sequence,
+    Callable, Sequence, Iterable,
     )
 
 # Package Imports
@@ -21,33 +24,61 @@ from gmdkit.utils.typing import (
     NumKey,
     MISSING
 )
+from gmdkit.utils.functions import accepted_kwargs
 from gmdkit.serialization.functions import (
-    decompress_string, compress_string,
+    decompress_string, compress_string, compress_strings, COMPRESS_BLOCK_SIZE, DEFERRED_COMPRESSION,
+    iter_decompress, StringCompressor, 
+    ChunkReader, CompressWriter, read_chunks, map_file, MappedReader,
     read_plist, write_plist,
-    validate_dict_node, get_plist_root,
+    DIRECT_WRITE, escape_text, write_plist_node, xml_declaration_text,
+    iter_dict_node, stream_plist_root, RawNode, is_projected,
     get_fields, get_field_names, get_field_names_ordered
 )
 
+# load options only some content types take, the other content is loaded without them
+CONTENT_OPTIONS = frozenset(("lazy", "intern", "compact"))
+
+
+def content_kwargs(method:Callable, kwargs:dict) -> dict:
+    """
+    Drops the content options a content method does not accept, other keyword arguments are kept.
+    """
+    options = {key: value for key, value in kwargs.items() if key in CONTENT_OPTIONS}
+    
+    if not options:
+        return kwargs
+    
+    kwargs = {key: value for key, value in kwargs.items() if key not in CONTENT_OPTIONS}
+    kwargs.update(accepted_kwargs(method, options))
+    
+    return kwargs
+
 
 class FileStringMixin:
     
+    @classmethod
+    def from_stream(cls, stream, **kwargs) -> Self:
+        return cls.from_string(stream.read(), **kwargs)
+    
+    
+    def to_stream(self, stream, **kwargs):
+        stream.write(self.to_string(**kwargs))
+    
+    
     @classmethod
     def from_file(cls, path:PathString, encoding="utf-8", **kwargs) -> Self:
         
         with open(path, "r", encoding=encoding) as file:
-            string = file.read()
+            new = cls.from_stream(file, **kwargs)
             
-        new = cls.from_string(string, **kwargs)
         new.path = path
         return new
     
     
     def to_file(self, path:PathString, encoding="utf-8", **kwargs):
         
-        string = self.to_string(**kwargs)
-        
         with open(path, "w", encoding=encoding) as file:
-            file.write(string)
+            self.to_stream(file, **kwargs)
 
 
     @classmethod
@@ -114,6 +145,8 @@ class PlistDecoderMixin(FileStringMixin):
             node:ET.Element, 
             decoder:Optional[PlistEncoder]=None,
             container:Optional[int]=None,
+            keys:Optional[set]=None,
+            skip_keys:Optional[set]=None,
             **kwargs
             ):
         
@@ -125,43 +158,60 @@ class PlistDecoderMixin(FileStringMixin):
         data = self if container is None else getattr(self, container)
         
         try:
-            validate_dict_node(node, is_array=is_array, encoder_key=encoder_key)
+            if node.tag not in ['d', 'dict']:
+                raise ValueError("element is not a plist dict element")
         except Exception as e:
             raise RuntimeError(f"[{cls.__name__}] failed to validate node") from e
         
         data.clear()
         
-        start = 2 if is_array or encoder_key is not None else 0
-        length = len(node)
-        index_range = range(start, length, 2)
+        # validates the remaining elements while iterating, stream nodes are decoded as they are parsed
+        pairs = iter_dict_node(node, is_array=is_array, encoder_key=encoder_key)
+        
+        if keys is not None or skip_keys is not None:
+            if is_array:
+                # arrays have no keys, the projection applies to their items
+                kwargs.update(keys=keys, skip_keys=skip_keys)
+            else:
+                set_item = data.__setitem__
+                decode = partial(decoder, **kwargs) if decoder else (lambda k, v: (k, read_plist(v)))
+                
+                for key, value in pairs:
+                    key = key.text
+                    # projected values are kept undecoded, so that they are saved unchanged
+                    set_item(*(
+                        (key, RawNode(value)) if is_projected(key, keys, skip_keys) else decode(key, value)
+                        ))
+                return
+        
         use_kwargs = bool(kwargs)
     
         if decoder:
             if is_array:
                 append_func = data.append
                 if use_kwargs:
-                    for i in index_range:
-                        append_func(decoder(node[i + 1], **kwargs))
+                    for _, value in pairs:
+                        append_func(decoder(value, **kwargs))
                 else:
-                    for i in index_range:
-                        append_func(decoder(node[i + 1]))
+                    for _, value in pairs:
+                        append_func(decoder(value))
             else:
                 set_item = data.__setitem__
                 if use_kwargs:
-                    for i in index_range:
-                        set_item(*decoder(node[i].text, node[i + 1], **kwargs))
+                    for key, value in pairs:
+                        set_item(*decoder(key.text, value, **kwargs))
                 else:
-                    for i in index_range:
-                        set_item(*decoder(node[i].text, node[i + 1]))
+                    for key, value in pairs:
+                        set_item(*decoder(key.text, value))
         else:
             if is_array:
                 append_func = data.append
-                for i in index_range:
-                    append_func(read_plist(node[i + 1]))
+                for _, value in pairs:
+                    append_func(read_plist(value))
             else:
                 set_item = data.__setitem__
-                for i in index_range:
-                    set_item(node[i].text, read_plist(node[i + 1]))
+                for key, value in pairs:
+                    set_item(key.text, read_plist(value))
 
     
     def save_data(
@@ -203,6 +253,10 @@ class PlistDecoderMixin(FileStringMixin):
         append = node.append
     
         for k, v in items:
+            if v.__class__ is RawNode:
+                sub(node, 'k').text = k
+                append(v.node)
+                continue
             k, v = write(k, v)
             if v is None:
                 continue
@@ -212,6 +266,57 @@ class PlistDecoderMixin(FileStringMixin):
         return node
     
     
+    def write_data(
+            self,
+            write:Callable[[str],Any],
+            tag:str="d",
+            encoder:Optional=None,
+            container:Optional[int]=None,
+            **kwargs):
+        
+        cls = type(self)
+        is_array = cls.IS_ARRAY
+        encoder_key = cls.ENCODER_KEY
+        encoder = cls.ENCODER if encoder is None else encoder
+        container = cls.CONTAINER if container is None else container
+        data = self if container is None else getattr(self, container)
+        
+        if is_array:
+            write(f"<{tag}><k>_isArr</k><t />")
+            items = enumerate(data, start=1)
+            encode = (
+                (lambda k, v: (f'k_{k}', encoder(v, **kwargs)))
+                if encoder else
+                (lambda k, v: (f'k_{k}', write_plist(v)))
+            )
+        else:
+            if encoder_key is not None:
+                write(f"<{tag}><k>kCEK</k><i>{encoder_key}</i>")
+            items = data.items()
+            encode = (
+                (lambda k, v: encoder(k, v, **kwargs))
+                if encoder else
+                (lambda k, v: (k, write_plist(v)))
+            )
+        
+        empty = not is_array and encoder_key is None
+        
+        for k, v in items:
+            if v.__class__ is RawNode:
+                k, v = k, v.node
+            else:
+                k, v = encode(k, v)
+            if v is None:
+                continue
+            if empty:
+                write(f"<{tag}>")
+                empty = False
+            write("<k>" + escape_text(k) + "</k>")
+            write_plist_node(v, write)
+        
+        write(f"<{tag} />" if empty else f"</{tag}>")
+    
+    
     @classmethod
     def from_node(cls, node:ET.Element, **kwargs):
         
@@ -226,6 +331,9 @@ class PlistDecoderMixin(FileStringMixin):
     
     def to_node(self, node:Optional[ET.Element]=None, **kwargs):
         
+        if node is None and DIRECT_WRITE.get():
+            return partial(self.write_node, **kwargs)
+        
         try:
             result = self.save_data(**kwargs)
             
@@ -240,34 +348,88 @@ class PlistDecoderMixin(FileStringMixin):
     
     @classmethod
     def from_string(cls, string:str, **kwargs):
-        try:
-            node = ET.fromstring(string)
+        return cls._from_plist(string, **kwargs)
+    
+    
+    @classmethod
+    def from_stream(cls, stream, **kwargs):
+        return cls._from_plist(read_chunks(stream), **kwargs)
+    
+    
+    @classmethod
+    def from_file(cls, path:PathString, encoding="utf-8", mapped:bool=False, **kwargs) -> Self:
+        
+        if not mapped:
+            return super().from_file(path, encoding=encoding, **kwargs)
+        
+        # the parser reads the mapped bytes directly, without reading the file into a string
+        with map_file(path) as buffer:
+            start = 0
+            
+            # without a declaration the parser decodes utf-8, same as reading the file as text
+            if buffer[:5] == b"<?xml":
+                start = buffer.find(b"?>") + 2
+            
+            reader = MappedReader(buffer, start)
             
-            root = get_plist_root(node)
+            try:
+                new = cls.from_stream(reader, **kwargs)
+            finally:
+                reader.close()
+        
+        new.path = path
+        return new
+    
+    
+    @classmethod
+    def _from_plist(cls, source:str|Iterable[str], **kwargs):
+        try:
+            root = stream_plist_root(source)
         except Exception as e:
             raise RuntimeError(f"[{cls.__name__}] failed to load string") from e
-            
-        return cls.from_node(root,**kwargs)
+        
+        new = cls.from_node(root,**kwargs)
+        
+        try:
+            root.close()
+        except Exception as e:
+            raise RuntimeError(f"[{cls.__name__}] failed to load string") from e
+        
+        return new
     
     
-    def to_string(self, xml_declaration:bool=True, **kwargs):
-        node = self.to_node(**kwargs)
-
-        tag = node.tag
-        node.tag = "dict"
+    def write_node(self, write:Callable[[str],Any], **kwargs):
+        
+        token = DIRECT_WRITE.set(True)
+        
+        try:
+            self.write_data(write, **kwargs)
+        except Exception as e:
+            raise RuntimeError(f"[{type(self).__name__}] failed to save node") from e
+        finally:
+            DIRECT_WRITE.reset(token)
+    
+    
+    def write_document(self, write:Callable[[str],Any], xml_declaration:bool=True, **kwargs):
         
-        root = ET.Element("plist", version="1.0", gjver="2.0")
-        root.append(node)
+        if xml_declaration:
+            write(xml_declaration_text())
         
-        string = ET.tostring(
-            root,
-            encoding="unicode",
-            xml_declaration=xml_declaration
-        )
+        write('<plist version="1.0" gjver="2.0">')
+        self.write_node(write, tag="dict", **kwargs)
+        write("</plist>")
+    
+    
+    def to_string(self, **kwargs):
         
-        node.tag = tag
+        parts = []
+        self.write_document(parts.append, **kwargs)
         
-        return string
+        return "".join(parts)
+    
+    
+    def to_stream(self, stream, **kwargs):
+        self.write_document(stream.write, **kwargs)
     
     
     def update_file(self, **kwargs):
@@ -276,16 +438,18 @@ class PlistDecoderMixin(FileStringMixin):
         
     def reload_file(self, encoding="utf-8", **kwargs):
         
-        try:
-            with open(self.path, "r", encoding=encoding) as file:
-                string = file.read()
-            
-            node = ET.fromstring(string)        
-            root = get_plist_root(node)
-        except Exception as e:
-            raise RuntimeError(f"[{type(self).__name__}] failed to reload plist") from e
+        with open(self.path, "r", encoding=encoding) as file:
+            try:
+                root = stream_plist_root(read_chunks(file))
+            except Exception as e:
+                raise RuntimeError(f"[{type(self).__name__}] failed to reload plist") from e
+                
+            self.load_data(node=root,**kwargs)
             
-        self.load_data(node=root,**kwargs)
+            try:
+                root.close()
+            except Exception as e:
+                raise RuntimeError(f"[{type(self).__name__}] failed to reload plist") from e
 
 
     def invoke(
@@ -308,7 +472,7 @@ class PlistDecoderMixin(FileStringMixin):
         for value in values:
             value_method = getattr(value, method, None)
             if callable(value_method):
-                value_method(**kwargs)
+                value_method(**content_kwargs(value_method, kwargs))
 
 
 class DataclassDecoderMixin:
@@ -517,10 +681,14 @@ class DictDecoderMixin:
             items = sorted(items)
 
         if encoder:
+            encode_items = getattr(encoder, "encode_items", None)
             try:
-                for key, value in items:
-                    if condition is None or condition(key, value):
-                        result_extend(encoder(key, value))
+                if encode_items is not None and condition is None:
+                    result_extend(encode_items(items))
+                else:
+                    for key, value in items:
+                        if condition is None or condition(key, value):
+                            result_extend(encoder(key, value))
             except Exception as e:
                 raise ValueError(f"[{cls.__name__}] failed to encode") from e
         else:
@@ -741,6 +909,24 @@ class CompressFileMixin:
         return super().from_string(string, **kwargs)
     
     
+    @classmethod
+    def from_stream(
+            cls,
+            stream,
+            compressed:Optional[bool]=None,
+            **kwargs
+            ) -> Self:
+        
+        compressed = cls.COMPRESSED if compressed is None else compressed
+        
+        if compressed:
+            stream = ChunkReader(iter_decompress(
+                read_chunks(stream), compression=cls.COMPRESSION, xor_key=cls.CYPHER
+                ))
+            
+        return super().from_stream(stream, **kwargs)
+    
+    
     def to_string(
             self,
             compressed:Optional[bool]=None,
@@ -764,6 +950,28 @@ class CompressFileMixin:
         
         return string
     
+    
+    def to_stream(
+            self,
+            stream,
+            compressed:Optional[bool]=None,
+            compression_level:Optional[int]=None,
+            **kwargs
+            ):
+        
+        cls = type(self)
+        compressed = cls.COMPRESSED if compressed is None else compressed
+        
+        if not compressed:
+            return super().to_stream(stream, **kwargs)
+        
+        kw = {}
+        if compression_level is not None: kw["level"] = compression_level
+        
+        writer = CompressWriter(stream, StringCompressor(compression=cls.COMPRESSION, xor_key=cls.CYPHER, **kw))
+        super().to_stream(writer, **kwargs)
+        writer.close()
+    
 
 class FilePathMixin(FileStringMixin):
     
@@ -833,20 +1041,49 @@ class PlistLoaderMixin(PlistDecoderMixin):
     SAVE_CONTENT: bool = True
     
     @classmethod
-    def from_string(cls, string:str, load_content:Optional[bool]=None, content_selectors:Optional[set]=None, **kwargs):
+    def from_string(cls, string:str, load_content:Optional[bool]=None, content_selectors:Optional[set]=None, lazy:bool=False, intern:bool=False, compact:bool=False, workers:Optional[int]=None, **kwargs):
+        workers = cls._load_workers(workers)
         new = super().from_string(string, **kwargs)
         if load_content if load_content is not None else cls.LOAD_CONTENT:
-            new.load(selectors=content_selectors)
+            new.load(selectors=content_selectors, lazy=lazy, intern=intern, compact=compact, **workers)
             
         return new
     
     
-    def to_string(self, save_content:Optional[bool]=None, content_selectors:Optional[set]=None, **kwargs):
+    @classmethod
+    def from_stream(cls, stream, load_content:Optional[bool]=None, content_selectors:Optional[set]=None, lazy:bool=False, intern:bool=False, compact:bool=False, workers:Optional[int]=None, **kwargs):
+        workers = cls._load_workers(workers)
+        new = super().from_stream(stream, **kwargs)
+        if load_content if load_content is not None else cls.LOAD_CONTENT:
+            new.load(selectors=content_selectors, lazy=lazy, intern=intern, compact=compact, **workers)
+            
+        return new
+    
+    
+    @classmethod
+    def _load_workers(cls, workers:Optional[int]) -> dict:
+        # workers is only passed to load() methods that take it, the decoder would ignore it
+        if workers is None:
+            return {}
+        if "workers" not in signature(cls.load).parameters:
+            raise TypeError(f"[{cls.__name__}] load() does not take workers")
+        return {"workers": workers}
+    
+    
+    def to_string(self, save_content:Optional[bool]=None, content_selectors:Optional[set]=None, workers:Optional[int]=None, **kwargs):
         
         if save_content if save_content is not None else type(self).SAVE_CONTENT:
-            self.save(selectors=content_selectors)
+            self.save(selectors=content_selectors, workers=workers)
         
         return super().to_string(**kwargs)
+    
+    
+    def to_stream(self, stream, save_content:Optional[bool]=None, content_selectors:Optional[set]=None, workers:Optional[int]=None, **kwargs):
+        
+        if save_content if save_content is not None else type(self).SAVE_CONTENT:
+            self.save(selectors=content_selectors, workers=workers)
+        
+        super().to_stream(stream, **kwargs)
         
         
     def load(self, selectors:Optional[set]=None,**kwargs):
@@ -854,9 +1091,44 @@ class PlistLoaderMixin(PlistDecoderMixin):
         self.invoke("load",target=target,**kwargs)
         
             
-    def save(self, selectors:Optional[set]=None,**kwargs):
+    def save(self, selectors:Optional[set]=None, workers:Optional[int]=None, **kwargs):
         target = type(self).SELECTORS if selectors is None else selectors
-        self.invoke("save",target=target,**kwargs)
+        
+        if workers is None or workers <= 1:
+            self.invoke("save",target=target,**kwargs)
+            return
+        
+        # content is serialized as usual, then every collected string is compressed in a thread pool
+        deferred = []
+        token = DEFERRED_COMPRESSION.set(deferred)
+        
+        try:
+            self.invoke("save",target=target,**kwargs)
+        finally:
+            DEFERRED_COMPRESSION.reset(token)
+        
+        strings = compress_strings(
+            (item.decompressed for item in deferred), workers=workers, block_size=COMPRESS_BLOCK_SIZE
+            )
+        
+        for item, string in zip(deferred, strings):
+            item.string = string
+
+
+def _folder_decode(cls, decoder:Optional[Callable], kwargs:dict, path:Path):
+    # runs in a worker process, the class decoder is resolved there as it may not be picklable
+    decoder = cls.FOLDER_DECODER if decoder is None else decoder
+    return decoder(path, **kwargs)
+
+
+def _folder_encode(cls, encoder:Optional[Callable], path:Path, item):
+    encoder = cls.FOLDER_ENCODER if encoder is None else encoder
+    encoder(item, path)
+
+
+def _pool_chunksize(count:int, workers:int) -> int:
+    # a few chunks per worker balances uneven file or level sizes without a round trip per item
+    return max(1, count // (workers * 4))
 
 
 class FolderLoaderMixin:
@@ -873,11 +1145,35 @@ class FolderLoaderMixin:
             extension:Optional[str]=None,
             decoder:Optional[Callable]=None,
             container:Optional[str]=None,
+            workers:Optional[int]=None,
             **kwargs
             ):
-        
+        """
+        Loads every file with the folder extension in a folder, in path order.
+
+        Parameters
+        ----------
+        path : PathString
+            The folder to load.
+        extension : str, optional
+            The file extension to load. Defaults to the class folder extension.
+        decoder : Callable, optional
+            Called with each file path and the keyword arguments. Defaults to the class folder decoder.
+        container : str, optional
+            The attribute holding the items. Defaults to the class container.
+        workers : int, optional
+            The number of worker processes decoding files. Loads in this process if None or 1. 
+            Decoded items are pickled back, a custom decoder and its keyword arguments must be picklable.
+            Defaults to None.
+        **kwargs
+            Passed to the decoder.
+
+        Returns
+        -------
+        Self
+            The loaded items.
+        """
         extension = cls.FOLDER_EXTENSION if extension is None else extension
-        decoder = cls.FOLDER_DECODER if decoder is None else decoder
         container = cls.CONTAINER if container is None else container
         
         if extension is None:
@@ -886,9 +1182,23 @@ class FolderLoaderMixin:
         new = cls()
         data = new if container is None else getattr(new, container)
         
-        for file_path in Path(path).glob(f'*.{extension}'):
-            item = decoder(file_path, **kwargs)
-            data.append(item)
+        # sorted so that the order does not depend on the file system
+        paths = sorted(Path(path).glob(f'*.{extension}'))
+        
+        if workers is None or workers <= 1 or len(paths) <= 1:
+            decoder = cls.FOLDER_DECODER if decoder is None else decoder
+            
+            for file_path in paths:
+                item = decoder(file_path, **kwargs)
+                data.append(item)
+            
+            return new
+        
+        # items are decoded in worker processes and pickled back, map keeps the path order
+        load = partial(_folder_decode, cls, decoder, kwargs)
+        
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            data.extend(executor.map(load, paths, chunksize=_pool_chunksize(len(paths), workers)))
         
         return new
     
@@ -898,10 +1208,32 @@ class FolderLoaderMixin:
             path:PathString,
             encoder:Optional[Callable]=None,
             container:Optional[str]=None,
+            workers:Optional[int]=None,
             ):
-        
+        """
+        Saves every item as a file in a folder.
+
+        Parameters
+        ----------
+        path : PathString
+            The folder to save to, which must exist.
+        encoder : Callable, optional
+            Called with each item and the folder path. Defaults to the class folder encoder.
+        container : str, optional
+            The attribute holding the items. Defaults to the class container.
+        workers : int, optional
+            The number of worker processes encoding items. Saves in this process if None or 1. Defaults to None.
+            
+            Workers encode pickled copies of the items, so changes made while saving, 
+            such as updated compressed strings or cleared modification flags, 
+            are not applied to the items in this process, which are re-encoded on the next save.
+            A custom encoder must be picklable.
+
+        Returns
+        -------
+        None.
+        """
         cls = type(self)
-        encoder = cls.FOLDER_ENCODER if encoder is None else encoder
         container = cls.CONTAINER if container is None else container
         data = self if container is None else getattr(self, container)
             
@@ -910,8 +1242,20 @@ class FolderLoaderMixin:
         if not folder_path.is_dir():
             raise ValueError("provided path is not a directory.")
         
-        for item in data:
-            encoder(item, folder_path)
+        if workers is None or workers <= 1 or len(data) <= 1:
+            encoder = cls.FOLDER_ENCODER if encoder is None else encoder
+            
+            for item in data:
+                encoder(item, folder_path)
+            
+            return
+        
+        save = partial(_folder_encode, cls, encoder, folder_path)
+        
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            # consumes the results so that worker exceptions are raised here
+            for _ in executor.map(save, data, chunksize=_pool_chunksize(len(data), workers)):
+                pass
 
 
 class DictDefaultsMixin:
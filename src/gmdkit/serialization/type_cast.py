@@ -1,6 +1,6 @@
 # Imports
-from typing import Any, Optional, Callable
-from operator import attrgetter
+from typing import Any, Optional, Callable, Iterable, Iterator
+from operator import attrgetter, call
 import base64
 from enum import Enum, IntEnum
 
@@ -24,6 +24,17 @@ def to_numkey(key:str) -> NumKey:
         return key
     return int(key)
 
+
+class NumKeyCache(dict[str,NumKey]):
+    """
+    Maps raw string keys to numeric keys, converting and storing unseen keys on lookup.
+    """
+    def __missing__(self, key:str) -> NumKey:
+        value = self[key] = to_numkey(key)
+        return value
+
+numkey_cache = NumKeyCache()
+
 def to_string(obj: Any, **kwargs) -> str:
     method = getattr(obj, "to_string", None)
     if method is not None:
@@ -136,4 +147,262 @@ def dict_cast(
                 value = func(value) if func else (default(value) if has_default else value)
                 return key, value
 
-    return cast_func
\ No newline at end of file
+    return cast_func
+
+
+def identity(obj:Any) -> Any:
+    return obj
+
+
+# C-level equivalents of cast functions, valid when every value is a string token
+TOKEN_CASTS = {
+    to_bool: "1".__eq__,
+    }
+
+# cast functions inlined by CompiledEncoder.encode_items
+CAST_OTHER = 0
+CAST_BOOL = 1
+CAST_FLOAT = 2
+CAST_SERIALIZE = 3
+
+INLINE_CASTS = {
+    from_bool: CAST_BOOL,
+    from_float: CAST_FLOAT,
+    serialize: CAST_SERIALIZE,
+    }
+
+
+class KeyCache(dict):
+    """
+    Maps keys to converted keys, converting and storing unseen keys on lookup.
+    """
+    __slots__ = ("convert",)
+    
+    def __init__(self, convert:Callable):
+        self.convert = convert
+    
+    def __missing__(self, key:Any) -> Any:
+        value = self[key] = self.convert(key)
+        return value
+
+
+class FunctionTable(dict):
+    """
+    Maps raw keys to the cast function of their converted key, 
+    resolving and storing unseen keys on lookup.
+    
+    If given, wrap is called with the converted key and cast function 
+    and returns the function to store instead.
+    """
+    __slots__ = ("functions", "key_start", "default", "wrap")
+    
+    def __init__(
+            self, 
+            functions:dict, 
+            key_start:Optional[Callable]=None, 
+            default:Optional[Callable]=None,
+            replace:Optional[dict]=None,
+            wrap:Optional[Callable]=None
+            ):
+        
+        replace = replace or {}
+        
+        self.functions = {key: replace.get(func, func) for key, func in functions.items()}
+        self.key_start = key_start
+        self.default = default or identity
+        self.wrap = wrap
+    
+    def __missing__(self, key:Any) -> Callable:
+        
+        key_start = self.key_start
+        converted = key if key_start is None else key_start(key)
+        func = self.functions.get(converted) or self.default
+        
+        if self.wrap is not None:
+            func = self.wrap(converted, func)
+        
+        self[key] = func
+        
+        return func
+
+
+class InternTable(dict):
+    """
+    Maps raw tokens to a single shared decoded value, decoding unseen tokens on lookup.
+    """
+    __slots__ = ("func",)
+    
+    def __init__(self, func:Callable):
+        self.func = func
+    
+    def __missing__(self, token:str) -> Any:
+        value = self[token] = self.func(token)
+        return value
+
+
+def returns_singletons(func:Callable) -> bool:
+    """
+    Checks whether a cast function returns values that are already shared, such as bools and enum members.
+    """
+    if func is to_bool or func in TOKEN_CASTS.values():
+        return True
+    
+    owner = func if isinstance(func, type) else getattr(func, "__self__", None)
+    
+    return isinstance(owner, type) and issubclass(owner, Enum)
+
+
+class CompiledDecoder:
+    """
+    A key-value decoder compiled from a table of cast functions.
+    
+    Behaves like the function returned by dict_cast, 
+    but resolves the converted key and cast function of a raw key once, 
+    after which every pair costs two dict lookups and the cast function call.
+    decode_tokens decodes a whole token list without a Python call per pair.
+    """
+    __slots__ = ("keys", "functions")
+    
+    def __init__(
+            self, 
+            functions:dict,
+            key_start:Optional[Callable]=None,
+            default:Optional[Callable]=None,
+            tokens:bool=False
+            ):
+        """
+        Parameters
+        ----------
+        functions : dict
+            Maps converted keys to cast functions.
+        key_start : Callable, optional
+            Converts raw keys. Keys are kept as is if not given.
+        default : Callable, optional
+            Casts the values of keys without a cast function. Values are kept as is if not given.
+        tokens : bool, optional
+            Whether all values are string tokens, 
+            in which case cast functions are replaced by their TOKEN_CASTS equivalents.
+            Defaults to False.
+        """
+        self.keys = None if key_start is None else (numkey_cache if key_start is to_numkey else KeyCache(key_start))
+        self.functions = FunctionTable(
+            functions, key_start=key_start, default=default, replace=TOKEN_CASTS if tokens else None
+            )
+    
+    
+    def __call__(self, key:Any, value:Any, **kwargs) -> tuple[Any,Any]:
+        
+        keys = self.keys
+        
+        return (key if keys is None else keys[key]), self.functions[key](value)
+    
+    
+    def interned(self, keys:Optional[Iterable[Any]]=None) -> "CompiledDecoder":
+        """
+        Returns a decoder that shares one decoded value between identical raw tokens of a key.
+        
+        Each key gets its own token table, which lives as long as the returned decoder, 
+        use one decoder per load so that the tables are released afterwards.
+        Values of mutable types are shared as well, 
+        the objects holding them must copy them before they are modified.
+
+        Parameters
+        ----------
+        keys : Iterable, optional
+            The converted keys to intern. 
+            Defaults to every key whose cast function does not already return shared values.
+
+        Returns
+        -------
+        CompiledDecoder
+            The interning decoder.
+        """
+        keys = None if keys is None else frozenset(keys)
+        table = self.functions
+        
+        def wrap(key:Any, func:Callable) -> Callable:
+            if (keys is None and returns_singletons(func)) or (keys is not None and key not in keys):
+                return func
+            return InternTable(func).__getitem__
+        
+        new = type(self).__new__(type(self))
+        new.keys = self.keys
+        new.functions = FunctionTable(table.functions, key_start=table.key_start, default=table.default, wrap=wrap)
+        
+        return new
+    
+    
+    def decode_tokens(self, tokens:list) -> Iterator[tuple[Any,Any]]:
+        """
+        Returns an iterator over the decoded pairs of a flat key-value token list.
+        """
+        keys = tokens[0::2]
+        values = map(call, map(self.functions.__getitem__, keys), tokens[1::2])
+        
+        if self.keys is None:
+            return zip(keys, values)
+        
+        return zip(map(self.keys.__getitem__, keys), values)
+
+
+class CompiledEncoder:
+    """
+    A key-value encoder compiled from a table of cast functions.
+    
+    Behaves like the function returned by dict_cast, 
+    encode_items encodes a sequence of pairs into a flat token list, 
+    inlining the bool, float and default cast functions.
+    """
+    __slots__ = ("keys", "functions", "casts")
+    
+    def __init__(
+            self, 
+            functions:dict,
+            key_end:Optional[Callable]=None,
+            default:Optional[Callable]=None
+            ):
+        """
+        Parameters
+        ----------
+        functions : dict
+            Maps keys to cast functions.
+        key_end : Callable, optional
+            Converts keys after encoding. Keys are kept as is if not given.
+        default : Callable, optional
+            Casts the values of keys without a cast function. Values are kept as is if not given.
+        """
+        self.keys = KeyCache(key_end or identity)
+        self.functions = table = FunctionTable(functions, default=default)
+        self.casts = KeyCache(lambda key: (INLINE_CASTS.get(func := table[key], CAST_OTHER), func))
+    
+    
+    def __call__(self, key:Any, value:Any, **kwargs) -> tuple[Any,Any]:
+        return self.keys[key], self.functions[key](value)
+    
+    
+    def encode_items(self, items:Iterable[tuple[Any,Any]]) -> list:
+        """
+        Encodes key-value pairs into a flat list of keys and values.
+        """
+        keys = self.keys
+        casts = self.casts
+        
+        result = []
+        append = result.append
+        
+        for key, value in items:
+            append(keys[key])
+            cast, func = casts[key]
+            
+            if cast == CAST_BOOL:
+                append("1" if value else "0")
+            elif cast == CAST_FLOAT:
+                append(str(int(value)) if value.is_integer() else str(value))
+            elif cast == CAST_SERIALIZE and type(value) is str:
+                append(value)
+            elif cast == CAST_SERIALIZE and type(value) is int:
+                append(str(value))
+            else:
+                append(func(value))
+        
+        return result
@@ -5,7 +5,10 @@ class EnumClass(IntEnum):
     
     @classmethod
     def from_string(cls, string: str):
-        return cls(int(string))
+        value = int(string)
+        # same lookup as cls(value), without the Enum call overhead
+        member = cls._value2member_map_.get(value)
+        return cls(value) if member is None else member
 
     @classmethod
     def _missing_(cls, value):
@@ -1,8 +1,8 @@
 # Imports
-from typing import Callable, ParamSpec, TypeVar
+from typing import Callable, Optional, ParamSpec, TypeVar
 from enum import Enum
 from functools import lru_cache, partial
-from inspect import signature
+from inspect import signature, Parameter
 
 # Package Imports (only gmdkit.utils is allowed)
 from gmdkit.utils.enums import ArrowDir
@@ -80,4 +80,46 @@ def filter_kwargs(*functions:Callable, **kwargs) -> list[Callable]:
         else:
             result.append(fn)
     
-    return result
\ No newline at end of file
+    return result
+
+
+@typed_cache(maxsize=256)
+def get_kwarg_names(function:Callable) -> Optional[frozenset[str]]:
+    params = signature(function).parameters.values()
+    
+    if any(p.kind is Parameter.VAR_KEYWORD for p in params):
+        return None
+    
+    return frozenset(
+        p.name for p in params 
+        if p.kind in (Parameter.POSITIONAL_OR_KEYWORD, Parameter.KEYWORD_ONLY)
+        )
+
+
+def accepted_kwargs(function:Callable, kwargs:dict) -> dict:
+    """
+    Filters keyword arguments to only those accepted by a function.
+    
+    Parameters
+    ----------
+    function : Callable
+        The function to check the parameters of.
+        
+    kwargs : dict[str,Any]
+        The keyword arguments to filter.
+        
+    Returns
+    -------
+    kwargs : dict[str,Any]
+        The accepted keyword arguments, all of them if the function takes **kwargs.
+        
+    """
+    if not kwargs:
+        return kwargs
+    
+    names = get_kwarg_names(getattr(function, "__func__", function))
+    
+    if names is None:
+        return kwargs
+    
+    return {k: v for k, v in kwargs.items() if k in names}
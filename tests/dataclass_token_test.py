@@ -0,0 +1,62 @@
+import pytest
+
+from gmdkit.models.prop.color import Color
+from gmdkit.models.prop.hsv import HSV
+from gmdkit.models.prop.replay import ReplayInput
+from gmdkit.serialization.mixins import DataclassDecoderMixin
+from gmdkit.serialization.functions import dataclass_decoder
+
+
+@pytest.mark.parametrize("cls, string", [
+    (HSV, "12a0.5a1a1a0"),
+    (Color, "1_255_2_128_3_0_6_1000_7_1_15_1_18_0"),
+    (ReplayInput, "120,2:"),
+    (ReplayInput, "120"),
+    ], ids=lambda x: x if isinstance(x, str) else x.__name__)
+def test_dataclass_tokens(cls: type, string: str) -> None:
+    """Decodes and encodes with the generated token methods, verifying they match the generic ones."""
+    tokens = string.split(cls.SEPARATOR)
+    
+    generated = cls.from_tokens(tokens)
+    generic = DataclassDecoderMixin.from_tokens.__func__(cls, tokens)
+    
+    assert generated == generic, "Generated from_tokens does not match the generic method"
+    assert generated.to_tokens() == DataclassDecoderMixin.to_tokens(generic), (
+        "Generated to_tokens does not match the generic method"
+    )
+    
+    with pytest.raises(ValueError, match=rf"\[{cls.__name__}\]"):
+        cls.from_tokens(["x"] * len(tokens))
+
+
+def test_dataclass_token_errors() -> None:
+    """Raises constructor errors from the generated token methods once, without retrying the generic ones."""
+    calls = []
+    
+    for from_array, separator in ((True, "a"), (False, "_")):
+        @dataclass_decoder(slots=True, separator=separator, from_array=from_array)
+        class Checked(DataclassDecoderMixin):
+            
+            value: float = 0
+            
+            def __post_init__(self):
+                calls.append(self.value)
+                if self.value < 0:
+                    raise RuntimeError("negative value")
+        
+        tokens = ["-1"] if from_array else ["value", "-1"]
+        calls.clear()
+        
+        with pytest.raises(RuntimeError, match="negative value"):
+            Checked.from_tokens(tokens)
+        
+        assert calls == [-1], "The constructor should be called once"
+        
+        with pytest.raises(ValueError, match=r"\[Checked\] failed to decode"):
+            Checked.from_tokens(["x"] if from_array else ["value", "x"])
+        
+        checked = Checked()
+        checked.value = object()
+        
+        with pytest.raises(ValueError, match=r"\[Checked\] failed to encode field 'value'"):
+            checked.to_tokens()
@@ -0,0 +1,61 @@
+import os
+import subprocess
+import sys
+import pytest
+
+from gmdkit import Level, Object
+from gmdkit.mappings import obj_prop
+from gmdkit.models.level_diff import LevelDiff
+
+from tests.utils import OFFLINE_LEVELS
+
+
+def test_level_diff() -> None:
+    """Diffs a level against an edited copy, verifying the patch recreates the edited level."""
+    old = Level.from_file(OFFLINE_LEVELS[0])
+    new = Level.from_file(OFFLINE_LEVELS[0])
+    objects = new.objects
+    
+    moved, edited, removed = objects[1], objects[2], objects[3]
+    moved[obj_prop.X] = moved.get(obj_prop.X, 0) + 300
+    rotation = edited.get(obj_prop.ROTATION)
+    edited[obj_prop.ROTATION] = 45.0
+    objects.remove(removed)
+    added = Object.default(1)
+    objects.append(added)
+    new.start[obj_prop.X] = 0.5
+    
+    diff = LevelDiff.from_levels(old, new)
+    
+    assert len(diff.objects.changed) == 2, "Moved and edited objects should be changed"
+    assert list(diff.objects.removed) == [3] and diff.objects.added == [added], "Removed and added objects do not match"
+    assert diff.objects.changed[2] == {obj_prop.ROTATION: (rotation, 45.0)}, "Property changes do not match"
+    
+    with pytest.raises(ValueError):
+        diff.objects.apply(new.objects)
+    
+    string = diff.to_string()
+    
+    assert LevelDiff.from_string(string).to_string() == string, "Saved diff does not match"
+    
+    # the diff is applied in a process with different string hashes
+    script = (
+        "import sys\n"
+        "from gmdkit import Level\n"
+        "from gmdkit.models.level_diff import LevelDiff\n"
+        "level = Level.from_file(sys.argv[1])\n"
+        "LevelDiff.from_string(sys.stdin.read()).apply(level)\n"
+        "sys.stdout.write(level.start.to_string() + level.objects.to_string())\n"
+        )
+    env = {**os.environ, "PYTHONPATH": os.pathsep.join(sys.path), "PYTHONHASHSEED": "12345"}
+    result = subprocess.run(
+        [sys.executable, "-c", script, str(OFFLINE_LEVELS[0])],
+        input=string, capture_output=True, text=True, env=env, check=True
+        )
+    
+    diff.apply(old)
+    
+    assert not LevelDiff.from_levels(old, new), "Patched level should match the edited level"
+    assert result.stdout == old.start.to_string() + old.objects.to_string(), (
+        "Diff applied in another process does not match"
+    )
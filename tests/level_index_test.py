@@ -0,0 +1,56 @@
+from gmdkit import Level, Object, ObjectList
+from gmdkit.mappings import obj_prop
+from gmdkit.models.level_index import LevelIndex
+from gmdkit.models.prop.groups import IDList
+from gmdkit.functions.object_list import compile_groups, compile_parents, compile_links
+
+from tests.utils import OFFLINE_LEVELS
+
+
+def test_level_index_updates() -> None:
+    """Updates a level index after edits, verifying it matches the compiled mappings."""
+    objects = Level.from_file(OFFLINE_LEVELS[0]).objects
+    index = LevelIndex(objects)
+    
+    def identities(mapping: dict) -> dict:
+        return {key: [id(obj) for obj in value] if isinstance(value, list) else id(value) for key, value in mapping.items()}
+    
+    assert identities(index.groups()) == identities(compile_groups(objects)), "Indexed groups do not match"
+    
+    added = Object.default(1)
+    added[obj_prop.GROUPS] = IDList([9999])
+    objects.append(added)
+    removed = objects.pop(0)
+    
+    moved = objects[0]
+    moved[obj_prop.GROUPS] = IDList([9999])
+    moved[obj_prop.PARENT_GROUPS] = IDList([9999])
+    moved[obj_prop.LINKED_GROUP] = 42
+    
+    assert index.refresh() == 3, "Refresh should count added, removed and changed objects"
+    assert removed not in index, "Removed object is still indexed"
+    assert sorted(map(id, index.group(9999))) == sorted([id(moved), id(added)]), "Updated group does not match"
+    
+    groups, gid_parents, group_parents, area_parents = index.parents()
+    expected = compile_parents(objects)
+    
+    assert {key: sorted(map(id, value)) for key, value in groups.items()} == (
+        {key: sorted(map(id, value)) for key, value in expected[0].items()}
+    ), "Updated groups do not match"
+    assert identities(gid_parents) == identities(expected[1]), "Group ID parents do not match"
+    assert identities(index.links()[0]) == identities(compile_links(objects)[0]), "Links do not match"
+
+
+def test_parent_fallback() -> None:
+    """Compiles group parents, verifying a group's only group or area parent is used as both."""
+    child = Object({obj_prop.ID: 1, obj_prop.GROUPS: IDList([1]), obj_prop.PARENT_GROUPS: IDList([1])})
+    far = Object({obj_prop.ID: 1, obj_prop.X: 10.0, obj_prop.GROUPS: IDList([1]), obj_prop.GROUP_PARENT: True})
+    near = Object({obj_prop.ID: 1, obj_prop.X: 5.0, obj_prop.GROUPS: IDList([1]), obj_prop.GROUP_PARENT: True})
+    area = Object({
+        obj_prop.ID: 1, obj_prop.GROUPS: IDList([2]), obj_prop.PARENT_GROUPS: IDList([2]), obj_prop.AREA_PARENT: True
+        })
+    objects = ObjectList([child, far, near, area])
+    
+    for groups, gid_parents, group_parents, area_parents in (compile_parents(objects), LevelIndex(objects).parents()):
+        assert group_parents[1] is near and area_parents[1] is near, "The group parent should also be the area parent"
+        assert area_parents[2] is area and group_parents[2] is area, "The area parent should also be the group parent"
@@ -0,0 +1,31 @@
+from gmdkit import Level, Object, ObjectList
+from gmdkit.mappings import obj_prop
+
+from tests.utils import OFFLINE_LEVELS
+
+
+def test_structural_hash() -> None:
+    """Deduplicates objects by structural hash, verifying it against serialized comparisons."""
+    a = Object.from_string("1,1,2,15,3,15,57,2.4")
+    b = Object.from_string("57,2.4,3,15,2,15,1,1")
+    
+    assert a.canonical_hash() == b.canonical_hash(), "Property order should not change the hash"
+    
+    b[obj_prop.X] = 30.0
+    assert a.canonical_hash() != b.canonical_hash(), "Modifying an object should invalidate its hash"
+    
+    string = Level.from_file(OFFLINE_LEVELS[0], load_content=False).objects.to_string()
+    objects = ObjectList.from_string(string)
+    copies = ObjectList(obj.copy() for obj in objects[::3])
+    combined = ObjectList(objects + copies)
+    
+    seen = set()
+    expected = [obj for obj in combined if not ((key := obj.to_string(sort_keys=True)) in seen or seen.add(key))]
+    
+    assert [id(obj) for obj in combined.dedupe()] == [id(obj) for obj in expected], "Deduplicated objects do not match"
+    assert len(combined.difference(copies)) == len(objects) - len(objects.intersection(copies)), "Difference and intersection do not partition"
+    assert all(obj in copies for obj in combined.intersection(copies)), "Intersection has objects missing from the other list"
+    
+    for kwargs in ({"lazy": True}, {"compact": True}):
+        other = ObjectList.from_string(string, **kwargs)
+        assert [obj.canonical_hash() for obj in other] == [obj.canonical_hash() for obj in objects], f"Hashes do not match, {kwargs}"
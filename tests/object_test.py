@@ -1,4 +1,9 @@
-from gmdkit.models.object import ObjectList
+from gmdkit.models.object import Object, ObjectList, LazyObject
+from gmdkit.models.object_table import ObjectTable
+from gmdkit.functions.object import scale_position, rotate_position
+from gmdkit.functions.object_list import warp_objects, grid_align, compile_groups, compile_parents, boundaries
+from gmdkit.functions.object_table import scale_table, rotate_table, warp_table, grid_align_table
+from gmdkit.mappings import obj_prop
 
 object_string = "1,1,2,315,3,-75;1,1,2,285,3,-75,21,1004;1,1,2,255,3,-75,21,1004;1,1,2,255,3,-45,21,1004;1,1,2,255,3,-15,21,1004;1,1,2,285,3,-15,21,1004;1,1,2,315,3,-15,21,1004;1,1,2,315,3,-45,21,1004;1,1,2,345,3,-45,21,1004;1,1,2,345,3,-75,21,1004;"
 
@@ -7,4 +12,108 @@ def test_object_string_roundtrip():
     
     serialized = obj_list.to_string()
     
-    assert object_string == serialized, "Original and exported object strings do not match.\n"
\ No newline at end of file
+    assert object_string == serialized, "Original and exported object strings do not match.\n"
+
+def test_object_string_iter():
+    objects = list(ObjectList.iter_string(object_string))
+    
+    assert len(objects) == object_string.count(";"), "Object count does not match the number of delimiters.\n"
+    assert ObjectList(objects).to_string() == object_string, "Streamed and exported object strings do not match.\n"
+    assert list(ObjectList.iter_string(object_string.removesuffix(";"))) == objects, "Trailing delimiter changed the decoded objects.\n"
+
+
+
+def test_lazy_object_string():
+    obj_list = ObjectList.from_string(object_string, lazy=True)
+    
+    assert all(isinstance(obj, LazyObject) for obj in obj_list)
+    assert obj_list == ObjectList.from_string(object_string), "Lazy and eager objects do not match.\n"
+    assert obj_list.to_string() == object_string, "Untouched lazy objects were not re-emitted as-is.\n"
+    
+    obj_list[1].setdefault(obj_prop.GROUPS).append(5)
+    obj_list[2][obj_prop.X] = 0.5
+    
+    assert obj_list[1].to_string() == "1,1,2,285,3,-75,21,1004,57,5;"
+    assert obj_list[2].to_string() == "1,1,2,0.5,3,-75,21,1004;"
+    
+    obj = LazyObject.from_string("1,1,57,2.3;")
+    obj[obj_prop.GROUPS].append(4)
+    
+    assert obj.is_modified(), "In-place modification was not detected.\n"
+    assert obj.to_string() == "1,1,57,2.3.4;"
+    
+    obj = LazyObject.from_string("1,1,2,15,3,15,57,2.3;")
+    obj[obj_prop.X] = 30
+    copy = obj.copy()
+    
+    assert copy[obj_prop.GROUPS] == [2, 3], "Undecoded values were not decoded in the copy.\n"
+    assert copy.to_string() == "1,1,2,30,3,15,57,2.3;", "Copy of a modified lazy object was not encoded.\n"
+
+def test_object_dirty_tracking():
+    obj_list = ObjectList.from_string(object_string)
+    
+    assert not any(obj.is_modified() for obj in obj_list)
+    assert obj_list.to_string() == object_string, "Clean objects were not re-emitted as-is.\n"
+    
+    obj_list[0][obj_prop.X] = 0.5
+    
+    assert obj_list[0].is_modified()
+    assert not obj_list[1].is_modified()
+    assert obj_list[0].to_string() == "1,1,2,0.5,3,-75;"
+    assert not obj_list[0].is_modified(), "Serialized object was not cached.\n"
+    
+    obj = Object.from_string("1,1,57,2.3;")
+    obj[obj_prop.GROUPS].append(4)
+    
+    assert obj.is_modified(), "In-place modification was not detected.\n"
+    assert obj.to_string() == "1,1,57,2.3.4;"
+    
+    for copy in (dict, lambda obj: {**obj}, lambda obj: obj | {}):
+        obj = Object.from_string("1,1,2,15,3,15,57,2.3;")
+        copy(obj)[obj_prop.GROUPS].append(7)
+        
+        assert obj.to_string() == "1,1,2,15,3,15,57,2.3.7;", "In-place modification of a copied dict was not detected.\n"
+    
+    obj_list = ObjectList.from_string("1,1,2,15,3,15,57,2.3,274,2;1,1,2,30,3,15,57,2.4;")
+    compile_groups(obj_list), compile_parents(obj_list), boundaries(obj_list)
+    
+    assert not any(obj.is_modified() for obj in obj_list), "Read-only functions marked objects as modified.\n"
+
+def test_object_table():
+    obj_list = ObjectList.from_string(object_string + "1,1,2,15,3,15,57,2.3;")
+    table = ObjectTable(obj_list)
+    
+    assert table[obj_prop.X].tolist() == [obj[obj_prop.X] for obj in obj_list]
+    assert table.present[obj_prop.COLOR_1].sum() == 9
+    assert table.groups(10).tolist() == [2, 3]
+    assert table.has_groups(3).tolist() == [False] * 10 + [True]
+    
+    mask = table[obj_prop.Y] == -15
+    table.set(obj_prop.Y, table[obj_prop.Y][mask] + 30, mask)
+    
+    assert table.write_back() == 3
+    assert sum(obj.is_modified() for obj in obj_list) == 3, "Unchanged objects were modified.\n"
+    assert obj_list[4].to_string() == "1,1,2,255,3,15,21,1004;"
+    
+    table.drop(obj_prop.COLOR_1, table.has_groups(2) | (table[obj_prop.X] == 255))
+    table.write_back()
+    
+    assert obj_prop.COLOR_1 not in obj_list[2]
+    assert table.where(table.has_groups(2)).to_list() == obj_list[10:]
+
+def test_object_table_transforms():
+    string = object_string + "1,1,2,15,3,15,6,30,128,2;1,1,2,45,3,15,131,10,132,-20;"
+    
+    for scalar, batched in (
+            (lambda l: [scale_position(obj, 1.5, 0.5, 100.0, 10.0) for obj in l], lambda l: scale_table(l, 1.5, 0.5, 100.0, 10.0)),
+            (lambda l: [rotate_position(obj, 33.0, 100.0, 10.0) for obj in l], lambda l: rotate_table(l, 33.0, 100.0, 10.0)),
+            (lambda l: warp_objects(l, rotation=17.0, skew=9.0, center_x=30.0), lambda l: warp_table(l, rotation=17.0, skew=9.0, center_x=30.0)),
+            (lambda l: grid_align(l, 7.5, 3.3, 1.0), lambda l: grid_align_table(l, 7.5, 3.3, 1.0))
+            ):
+        expected = ObjectList.from_string(string)
+        result = ObjectList.from_string(string)
+        
+        scalar(expected)
+        batched(result)
+        
+        assert result.to_string() == expected.to_string(), "Batched and scalar transforms do not match.\n"
@@ -0,0 +1,33 @@
+import pytest
+
+from gmdkit import Level, Object, ObjectList
+from gmdkit.mappings import obj_prop
+from gmdkit.functions.object_table import object_bounds, overlapping_pairs
+
+from tests.utils import OFFLINE_LEVELS
+
+
+def test_overlapping_pairs() -> None:
+    """Computes hitbox bounds and overlaps, verifying them against known boxes and a pairwise check."""
+    block = Object.default(1)
+    block.update({obj_prop.X: 15.0, obj_prop.Y: 15.0, obj_prop.ROTATION: 45.0})
+    pad = Object.default(35)
+    pad.update({obj_prop.X: 100.0, obj_prop.Y: 0.0, obj_prop.ROTATION: 90.0, obj_prop.SCALE_X: 2.0})
+    
+    bounds = object_bounds(ObjectList([block, pad])).tolist()
+    
+    assert bounds[0] == pytest.approx([15 - 15 * 2 ** 0.5, 15 - 15 * 2 ** 0.5, 15 + 15 * 2 ** 0.5, 15 + 15 * 2 ** 0.5]), "Rotated block bounds"
+    assert bounds[1] == pytest.approx([98, -25, 102, 25]), "Quarter turns should swap the hitbox extents"
+    
+    objects = Level.from_file(OFFLINE_LEVELS[0]).objects
+    bounds = object_bounds(objects).tolist()
+    
+    for touching in (False, True):
+        expected = [
+            [i, j]
+            for i, a in enumerate(bounds) for j, b in enumerate(bounds) if i < j
+            if (a[0] <= b[2] and b[0] <= a[2] and a[1] <= b[3] and b[1] <= a[3] if touching else
+                a[0] < b[2] and b[0] < a[2] and a[1] < b[3] and b[1] < a[3])
+            ]
+        
+        assert overlapping_pairs(objects, touching=touching).tolist() == expected, f"Overlaps do not match, touching={touching}"
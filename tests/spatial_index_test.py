@@ -0,0 +1,34 @@
+import math
+import pytest
+
+from gmdkit import Level
+from gmdkit.models.spatial_index import SpatialIndex
+from gmdkit.functions.object_list import group_objects_x
+
+from tests.utils import OFFLINE_LEVELS
+
+
+@pytest.mark.parametrize("hitboxes", [False, True])
+def test_spatial_index(hitboxes: bool) -> None:
+    """Queries a spatial index, verifying it matches a scan of every object."""
+    objects = Level.from_file(OFFLINE_LEVELS[0]).objects
+    index = SpatialIndex(objects, cell_size=60, hitboxes=hitboxes)
+    
+    def scan(min_x: float, min_y: float, max_x: float, max_y: float) -> list[int]:
+        return [
+            i for i, (x, y, w, h) in enumerate(zip(index.x, index.y, index.half_w, index.half_h))
+            if x + w >= min_x and x - w <= max_x and y + h >= min_y and y - h <= max_y
+            ]
+    
+    for rect in [(0, 0, 300, 300), (200, 50, 900, 120), (-1000, -1000, 1e6, 1e6), (5000, 5000, 5001, 5001)]:
+        assert index.query_indices(*rect).tolist() == scan(*rect), f"Query {rect} does not match scan"
+        assert sorted(index.sweep_indices(rect[0], rect[2]).tolist()) == scan(rect[0], -1e9, rect[2], 1e9), (
+            f"Sweep {rect} does not match scan"
+        )
+    
+    distance = [(math.hypot(x - 100, y - 100), i) for i, (x, y) in enumerate(zip(index.x, index.y))]
+    
+    assert index.nearest_indices(100, 100, 10).tolist() == [i for _, i in sorted(distance)[:10]], "Nearest objects do not match"
+    assert {x: list(map(id, v)) for x, v in group_objects_x(index).items()} == (
+        {x: list(map(id, v)) for x, v in group_objects_x(objects).items()}
+    ), "Grouping by X does not match"
@@ -1,13 +1,20 @@
 
+import io
 import pytest
+import xml.etree.ElementTree as ET
 from pathlib import Path
 
-from gmdkit import Level, Object
-from gmdkit.mappings import obj_prop
+from gmdkit import Level, LevelList, LevelSave, Object, ObjectList
+from gmdkit.models.object import LazyObject, CompactObject
+from gmdkit.mappings import obj_prop, lvl_prop, lvl_save
+from gmdkit.models.save.game_manager import GameSave
+from gmdkit.models.prop.gzip import ObjectString
+from gmdkit.serialization.functions import get_plist_root, xor_inplace, compress_string
 
 from tests.utils import ONLINE_LEVELS, OFFLINE_LEVELS
 
 level_paths = (ONLINE_LEVELS + OFFLINE_LEVELS)[:10]
+save_paths = sorted((Path(__file__).parent.parent / "data" / "dat").rglob("*.dat"))
 
 @pytest.mark.parametrize("level_file", level_paths, ids=lambda p: p.name)
 def test_roundtrip(level_file: Path, tmp_path: Path) -> None:
@@ -47,4 +54,207 @@ def test_roundtrip(level_file: Path, tmp_path: Path) -> None:
     appended = reloaded.objects[-1]
     assert appended[obj_prop.ID] == 901, "Object ID should survive round-trip"
     assert appended[obj_prop.X] == 100.0, "X position should survive round-trip"
-    assert appended[obj_prop.Y] == 100.0, "Y position should survive round-trip"
\ No newline at end of file
+    assert appended[obj_prop.Y] == 100.0, "Y position should survive round-trip"
+@pytest.mark.parametrize("level_file", level_paths, ids=lambda p: p.name)
+def test_stream_reader(level_file: Path) -> None:
+    """Loads a level with the streaming reader and with a full element tree, verifying both match."""
+    string = level_file.read_text(encoding="utf-8")
+    
+    streamed = Level.from_string(string, load_content=False)
+    tree = Level.from_node(get_plist_root(ET.fromstring(string)))
+    
+    assert streamed.to_string(save_content=False) == tree.to_string(save_content=False), (
+        "Streamed and tree-loaded levels do not match"
+    )
+
+@pytest.mark.parametrize("level_file", level_paths, ids=lambda p: p.name)
+def test_direct_writer(level_file: Path) -> None:
+    """Saves a level with the direct text writer and with an element tree, verifying both match."""
+    level = Level.from_file(level_file, load_content=False)
+    
+    node = level.to_node()
+    node.tag = "dict"
+    root = ET.Element("plist", version="1.0", gjver="2.0")
+    root.append(node)
+    
+    assert level.to_string(save_content=False) == ET.tostring(root, encoding="unicode", xml_declaration=True), (
+        "Directly written and tree-serialized levels do not match"
+    )
+
+@pytest.mark.parametrize("save_file", save_paths, ids=lambda p: p.parent.name)
+def test_stream_pipeline(save_file: Path, tmp_path: Path) -> None:
+    """Loads and saves a compressed save through the streaming pipeline, verifying it matches the string path."""
+    string = save_file.read_text(encoding="utf-8")
+    
+    loaded = GameSave.from_string(string)
+    streamed = GameSave.from_file(save_file)
+    
+    assert streamed.to_string(compressed=False) == loaded.to_string(compressed=False), (
+        "Streamed and string-loaded saves do not match"
+    )
+    
+    out_file = tmp_path / save_file.name
+    streamed.to_file(out_file)
+    
+    assert out_file.read_text(encoding="utf-8") == loaded.to_string(), (
+        "Streamed and string-compressed saves do not match"
+    )
+
+@pytest.mark.parametrize("key", [bytes([11]), b"gmdkit"], ids=len)
+def test_xor_inplace(key: bytes) -> None:
+    """XORs a buffer in place whole and in chunks, verifying both match a byte-wise XOR and invert."""
+    data = bytes(range(256)) * 40 + b"tail"
+    expected = bytes(b ^ key[i % len(key)] for i, b in enumerate(data))
+    
+    whole = bytearray(data)
+    xor_inplace(whole, key)
+    
+    assert whole == expected, "In place XOR does not match byte-wise XOR"
+    
+    chunked = bytearray(data)
+    view = memoryview(chunked)
+    for start in range(0, len(data), 1001):
+        xor_inplace(view[start:start+1001], key, offset=start)
+    
+    assert chunked == expected, "Chunked XOR does not match byte-wise XOR"
+    
+    xor_inplace(whole, key)
+    
+    assert whole == data, "XOR should be its own inverse"
+
+def test_level_index() -> None:
+    """Indexes the levels of a save, verifying header keys are read without decoding and levels are saved unchanged."""
+    save = LevelSave()
+    save[lvl_save.LEVELS] = LevelList(Level.from_file(path, load_content=False) for path in level_paths)
+    string = save.to_string(compressed=False, save_content=False)
+    
+    loaded = LevelSave.from_string(string, compressed=False)
+    indexed = LevelSave.from_string(string, compressed=False, index=True)
+    levels = indexed[lvl_save.LEVELS]
+    
+    assert [level.get(lvl_prop.NAME) for level in levels] == [level.get(lvl_prop.NAME) for level in loaded[lvl_save.LEVELS]], (
+        "Indexed level names do not match"
+    )
+    assert all(level.is_indexed() for level in levels), "Reading header keys should not decode levels"
+    assert indexed.to_string(compressed=False, save_content=False) == string, (
+        "Indexed levels should be saved unchanged"
+    )
+    
+    streamed = LevelSave.from_stream(io.StringIO(string), compressed=False, index=True)
+    
+    assert streamed.to_string(compressed=False, save_content=False) == string, (
+        "Levels indexed from chunks should be saved unchanged"
+    )
+    
+    level = levels[0]
+    expected = loaded[lvl_save.LEVELS][0]
+    
+    assert len(level.objects) == len(expected.objects), "Decoded level objects do not match"
+    assert not level.is_indexed(), "Loading level content should decode the level"
+    assert level.to_string() == expected.to_string(), "Decoded level does not match"
+
+def test_interned_objects() -> None:
+    """Loads objects with interning, verifying they match plain objects and copy shared values before modification."""
+    level = Level.from_file(next(path for path in level_paths if path.name == "example_level.gmd"), load_content=False)
+    string = level.objects.to_string()
+    
+    plain = ObjectList.from_string(string)
+    interned = ObjectList.from_string(string, intern=True)
+    
+    assert interned == plain, "Interned objects do not match plain objects"
+    assert interned.to_string() == string, "Interned objects should be saved unchanged"
+    
+    grouped = [obj for obj in interned if obj.peek(obj_prop.GROUPS) is not None]
+    shared = [obj for obj in grouped if obj.peek(obj_prop.GROUPS) is grouped[0].peek(obj_prop.GROUPS)]
+    
+    assert len(shared) > 1, "Identical group lists should be shared"
+    
+    shared[0][obj_prop.GROUPS].append(9999)
+    
+    assert 9999 not in shared[1].peek(obj_prop.GROUPS), "Modifying a shared value should not affect other objects"
+    assert shared[0].is_modified() and not shared[1].is_modified(), "Only the modified object should be re-encoded"
+    
+    loaded = Level.from_file(next(path for path in level_paths if path.name == "example_level.gmd"), intern=True)
+    grouped = [obj for obj in loaded.objects if obj.peek(obj_prop.GROUPS) is not None]
+    
+    assert loaded.objects == plain, "Interned objects loaded from a file do not match plain objects"
+    assert any(obj.peek(obj_prop.GROUPS) is grouped[0].peek(obj_prop.GROUPS) for obj in grouped[1:]), (
+        "Intern option was not passed to load()"
+    )
+    
+    with pytest.raises(ValueError):
+        ObjectList.from_string(string, lazy=True, intern=True)
+
+def test_compact_objects() -> None:
+    """Loads compact objects, verifying they match plain objects through the mapping API and serialization."""
+    level = Level.from_file(next(path for path in level_paths if path.name == "example_level.gmd"), load_content=False)
+    string = level.objects.to_string()
+    
+    plain = ObjectList.from_string(string)
+    compact = ObjectList.from_string(string, compact=True)
+    
+    assert compact == plain, "Compact objects do not match plain objects"
+    assert compact.to_string() == string, "Compact objects should be saved unchanged"
+    
+    for obj, expected in zip(compact, plain):
+        obj[obj_prop.X] = expected[obj_prop.X] = obj.get(obj_prop.X, 0.0) + 10.5
+        obj.pop(obj_prop.Y, None), expected.pop(obj_prop.Y, None)
+        obj.setdefault(obj_prop.ROTATION, 45.0), expected.setdefault(obj_prop.ROTATION, 45.0)
+    
+    assert all(obj.is_modified() for obj in compact), "Assigning a property should mark the object as modified"
+    assert compact.to_string() == plain.to_string(), "Modified compact objects do not match plain objects"
+    assert compact[0].to_object() == plain[0], "Converted compact object does not match"
+    
+    loaded = Level.from_file(next(path for path in level_paths if path.name == "example_level.gmd"), compact=True)
+    
+    assert all(isinstance(obj, CompactObject) for obj in loaded.objects), "Compact option was not passed to load()"
+    assert loaded.objects == ObjectList.from_string(string), "Compact objects loaded from a file do not match plain objects"
+
+
+def test_content_options() -> None:
+    """Loads level content with options only object strings take, verifying other arguments still raise."""
+    level = Level.from_file(OFFLINE_LEVELS[0], load_content=False)
+    level.load(lazy=True)
+    
+    assert all(isinstance(obj, LazyObject) for obj in level.objects), "Lazy option was not forwarded"
+    
+    with pytest.raises(TypeError):
+        Level.from_file(OFFLINE_LEVELS[0], load_content=False).load(lazzy=True)
+    
+    objects = ObjectString(compress_string(";1,1,2,15,3,15;"))
+    start, _ = objects.load(lazy=True)
+    
+    assert isinstance(start, LazyObject) and not start, "An empty start object should be kept"
+    objects.save()
+    
+    assert objects.decompressed == ";1,1,2,15,3,15;", "An empty start object should be saved unchanged"
+
+
+@pytest.mark.parametrize("level_file", level_paths, ids=lambda p: p.name)
+def test_key_projection(level_file: Path) -> None:
+    """Loads a level with a key projection, verifying projected keys are saved unchanged."""
+    expected = Level.from_file(level_file, load_content=False)
+    loaded = Level.from_file(level_file)
+    
+    for kwargs in ({"keys": {lvl_prop.NAME}}, {"skip_keys": {lvl_prop.OBJECT_STRING}}):
+        level = Level.from_file(level_file, **kwargs)
+        
+        assert list(level) == list(expected), "Projection should keep every key"
+        assert level.get(lvl_prop.NAME) == expected.get(lvl_prop.NAME), "Kept keys should be decoded"
+        assert not isinstance(level.get(lvl_prop.OBJECT_STRING), ObjectString), "Projected keys should not be decoded"
+        # projected values keep their original text, which decoded values may not be saved as
+        saved = Level.from_string(level.to_string(), load_content=False)
+        assert saved.to_string() == expected.to_string(), "Projected level should be saved unchanged"
+        
+        assert level.objects == loaded.objects, "Projected objects should be decoded on first access"
+        assert level.start == loaded.start, "Projected start object should be decoded on first access"
+
+
+@pytest.mark.parametrize("level_file", level_paths, ids=lambda p: p.name)
+def test_mapped_reader(level_file: Path) -> None:
+    """Loads a level from a memory mapped file, verifying it matches the level read as text."""
+    expected = Level.from_file(level_file, load_content=False)
+    level = Level.from_file(level_file, load_content=False, mapped=True)
+    
+    assert level.path == level_file, "Mapped level should keep its path"
+    assert level.to_string() == expected.to_string(), "Mapped level does not match"
@@ -0,0 +1,27 @@
+from gmdkit.serialization.functions import xor_inplace
+import numpy as np
+import time
+
+SIZE = 100 * 2**20
+
+def xor_copy(data: bytes, key: bytes) -> bytes:
+    # previous implementation, tiles the key to the full data size
+    d = np.frombuffer(data, dtype=np.uint8)
+    k = np.frombuffer(key * (len(data) // len(key) + 1), dtype=np.uint8)[:len(data)]
+    return (d ^ k).tobytes()
+
+data = np.random.default_rng(0).integers(0, 256, SIZE, dtype=np.uint8).tobytes()
+
+for key in (bytes([11]), b"gmdkit"):
+    _start = time.perf_counter()
+    expected = xor_copy(data, key)
+    _end = time.perf_counter()
+    print(f"Copying XOR with {len(key)} byte key took {_end - _start:.6f} seconds")
+    
+    buffer = bytearray(data)
+    _start = time.perf_counter()
+    xor_inplace(buffer, key)
+    _end = time.perf_counter()
+    print(f"In place XOR with {len(key)} byte key took {_end - _start:.6f} seconds")
+    
+    assert buffer == expected
@@ -0,0 +1,78 @@
+import pytest
+from pathlib import Path
+
+from gmdkit import Level, LevelList, LevelSave
+from gmdkit.mappings import lvl_prop, lvl_save
+from gmdkit.models.prop.gzip import ObjectString
+from gmdkit.serialization.functions import compress_string, decompress_string
+
+from tests.utils import ALL_STORED_LEVELS, OFFLINE_LEVELS
+
+
+def test_folder_workers(tmp_path: Path) -> None:
+    """Loads and saves a level folder with a process pool, verifying it matches the sequential result."""
+    folder = Path(__file__).parent.parent / "data" / "gmd" / "official"
+    
+    sequential = LevelList.from_folder(folder, load_content=False)
+    parallel = LevelList.from_folder(folder, workers=2, load_content=False)
+    
+    assert [level.path for level in parallel] == [level.path for level in sequential], "Levels are not in path order"
+    assert parallel.to_string() == sequential.to_string(), "Parallel levels do not match sequential levels"
+    
+    (tmp_path / "sequential").mkdir()
+    (tmp_path / "parallel").mkdir()
+    sequential.to_folder(tmp_path / "sequential")
+    parallel.to_folder(tmp_path / "parallel", workers=2)
+    
+    for path in sorted((tmp_path / "sequential").iterdir()):
+        assert path.read_bytes() == (tmp_path / "parallel" / path.name).read_bytes(), f"{path.name} differs"
+
+
+def test_level_save_workers(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Loads a save's level objects with a process pool, verifying they match the sequential load."""
+    save = LevelSave()
+    save[lvl_save.LEVELS] = LevelList(
+        Level.from_file(path, load_content=False) for path in sorted(OFFLINE_LEVELS * 3)
+        )
+    string = save.to_string(compressed=False)
+    
+    sequential = LevelSave.from_string(string, compressed=False)
+    sequential.load()
+    parallel = LevelSave.from_string(string, compressed=False)
+    parallel.load(workers=2)
+    
+    for expected, level in zip(sequential[lvl_save.LEVELS], parallel[lvl_save.LEVELS], strict=True):
+        assert level.start == expected.start, "Start objects do not match"
+        assert level.objects == expected.objects, "Objects do not match"
+    
+    assert parallel.to_string(compressed=False) == sequential.to_string(compressed=False), "Saved saves do not match"
+    
+    calls = []
+    load_all = ObjectString.load_all.__func__
+    monkeypatch.setattr(ObjectString, "load_all", classmethod(
+        lambda cls, instances, workers=None, **kwargs: calls.append(workers) or load_all(cls, instances, workers, **kwargs)
+        ))
+    loaded = LevelSave.from_string(string, compressed=False, load_content=True, workers=2)
+    
+    assert calls == [2], "Workers were not passed to load()"
+    assert loaded.to_string(compressed=False) == sequential.to_string(compressed=False), "Loaded save does not match"
+    
+    with pytest.raises(TypeError):
+        Level.from_file(OFFLINE_LEVELS[0], workers=2)
+
+
+@pytest.mark.parametrize("compression", ["gzip", "zlib", "deflate"])
+def test_block_compression(compression: str) -> None:
+    """Compresses a level string in deflate blocks, verifying it decompresses the same for any number of threads."""
+    level = Level.from_file(next(path for path in ALL_STORED_LEVELS if path.name == "example_level.gmd"), load_content=False)
+    string = level.objects.to_string() * 50
+    
+    expected = compress_string(string, xor_key=b"gmdkit", compression=compression, block_size=4096)
+    
+    assert compress_string(string, xor_key=b"gmdkit", compression=compression, block_size=4096, workers=3) == expected, "Blocks depend on the number of threads"
+    assert decompress_string(expected, xor_key=b"gmdkit", compression=compression) == string, "Blocks do not decompress to the string"
+    
+    level.objects.extend(level.objects * 10)
+    parallel = Level.from_string(level.to_string(workers=2), load_content=False)
+    
+    assert parallel[lvl_prop.OBJECT_STRING].load() == level[lvl_prop.OBJECT_STRING].load(), "Level saved with workers does not match"